@@ -4,8 +4,6 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
-from qom.solvers.measure import QCMSolver
 from qom.ui import init_log
 from qom.ui.plotters import MPLPlotter
 
@@ -13,6 +11,10 @@ from qom.ui.plotters import MPLPlotter
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.OptoElectroMechanical import OEM_20
+# import archive
+from utils.archives import get_trajectory_archive
+# import measures
+from solvers.measure import get_log_negativities
 
 # all parameters
 params = {
@@ -80,30 +82,16 @@ for j in range(4):
     params['system']['A_vs'] = [50.0, 0.0, 0.0] if int(j / 2) == 0 else [50.0, 50.0, 50.0]
     params['system']['theta'] = 0.0 if j % 2 == 0 else 0.5
 
-    # initialize system
-    system = OEM_20(
-        params=params['system']
-    )
-
-    # initialize solver
-    hle_solver = HLESolver(
-        system=system,
-        params=params['solver']
-    )
-    # get times, modes and correlations
-    T = hle_solver.get_times()
-    Modes = hle_solver.get_modes()
-    Corrs = hle_solver.get_corrs()
-    # get quantum correlation measures
-    Measures = QCMSolver(
-        Modes=Modes,
-        Corrs=Corrs,
-        params=params['solver']
-    ).get_measures()
+    # get times, modes and correlations from the archived trajectory
+    T, Modes, Corrs = get_trajectory_archive(
+        system_class=OEM_20,
+        params_system=params['system'],
+        params_solver=params['solver']
+    ).get_window()
     # extract correlation
     M_0 = Corrs[:, 2, 2]
     # extract entanglement
-    M_1 = Measures[:, 0]
+    M_1 = get_log_negativities(Corrs, params['solver']['indices'])
     # output maximum squeezing and entanglement
     print(np.min(M_0), np.max(M_1))
 
@@ -4,8 +4,6 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
-from qom.solvers.measure import get_Wigner_distributions_single_mode
 from qom.ui import init_log
 from qom.ui.plotters import MPLPlotter
 
@@ -13,6 +11,10 @@ from qom.ui.plotters import MPLPlotter
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.OptoElectroMechanical import OEM_20
+# import archive
+from utils.archives import get_trajectory_archive
+# import measures
+from solvers.measure import get_Gaussian_ellipses, get_Wigner_distributions_from_ellipses
 
 # parameters
 params = {
@@ -70,26 +72,28 @@ params = {
 # initialize logger
 init_log()
 
-# initialize system
-system = OEM_20(
-    params=params['system']
-)
-
-# get correlations and times
-hle_solver = HLESolver(
-    system=system,
-    params=params['solver']
-)
-T = hle_solver.get_times()
-Corrs = hle_solver.get_corrs()
-# get Wigner distributions
-Wigners = get_Wigner_distributions_single_mode(
+# get times and correlations from the archived trajectory
+T, _, Corrs = get_trajectory_archive(
+    system_class=OEM_20,
+    params_system=params['system'],
+    params_solver=params['solver']
+).get_window()
+# get parameters of the Gaussian Wigner distributions
+ellipses = get_Gaussian_ellipses(
     Corrs=Corrs,
-    params=params['solver']
+    indices=params['solver']['indices']
+)
+# render Wigner distributions at the plotted times
+t_indices = [14, 91]
+Wigners = get_Wigner_distributions_from_ellipses(
+    ellipses=ellipses,
+    xs=params['solver']['wigner_xs'],
+    ys=params['solver']['wigner_ys'],
+    t_indices=t_indices
 )
 
 # plot squeezed Wigners
-for i in [14, 91]:
+for k, i in enumerate(t_indices):
     # update parameters and plot
     params['plotter']['title'] = '$\\omega_{b0} t = ' + str(T[i]) +'$'
     plotter = MPLPlotter(
@@ -100,6 +104,6 @@ for i in [14, 91]:
         params=params['plotter']
     )
     plotter.update(
-        vs=Wigners[i, 0]
+        vs=Wigners[k, 0]
     )
     plotter.show()
\ No newline at end of file
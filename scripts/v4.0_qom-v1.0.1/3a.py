@@ -4,20 +4,27 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
-from qom.solvers.measure import QCMSolver
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
+from qom.utils.loopers import wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.OptoElectroMechanical import OEM_20
+# import solver
+from solvers.deterministic import OEMHLESolver
+# import measures
+from solvers.measure import get_measure_bundle, get_measure_bundle_reduction_keys
+# import cache and looper
+from utils.cache import CachedFunc
+from utils.loopers import get_file_path, get_X_values, run_continuation_looper, run_stored_looper
 
 # all parameters
 params = {
     'looper': {
         'show_progress' : True,
+        # warm-start each point from the periodic state of its neighbour, with ``'stop_on_convergence'`` or ``'floquet'`` set for the solver
+        'warm_start'    : False,
         'X'             : {
             'var'   : 'Omegas',
             'idx'   : 1,
@@ -82,61 +89,84 @@ params = {
     }
 }
 
+# keys of the extrema of all measures
+keys = get_measure_bundle_reduction_keys()
+# keys of the maximum squeezing and entanglement
+keys_plot = ['V_q_1_min', 'E_N_{}_{}_max'.format(*params['solver']['indices'])]
+
 # function to obtain squeezing and entanglement
 def func(system_params):
+    return func_continuation(system_params)[0]
+
+# function to obtain squeezing and entanglement along with the solver, starting from the given initial values
+def func_continuation(system_params, iv_modes=None, iv_corrs=None):
     # initialize system
     system = OEM_20(
         params=system_params
     )
 
     # initialize solver
-    hle_solver = HLESolver(
+    hle_solver = OEMHLESolver(
         system=system,
-        params=params['solver']
+        params=params['solver'],
+        iv_modes=iv_modes,
+        iv_corrs=iv_corrs
+    )
+    # fold vectorized measures over chunks of the returned times
+    reductions = hle_solver.get_reductions(
+        funcs=lambda Modes, Corrs: get_measure_bundle(Corrs),
+        chunk_size=1000
+    )
+
+    # return extrema of all measures as array
+    return np.array([reductions[key][reduce] for key in reductions for reduce in ['min', 'max']], dtype=np.float_), hle_solver
+
+# function to obtain the plotted squeezing and entanglement
+def get_plotted_measures(func_cached, suffix):
+    # extrema of all measures with warm starts
+    if params['looper']['warm_start']:
+        params['looper']['file_path_prefix'] = 'data/v4.0_qom-v1.0.1/3a_continuation_' + suffix
+        looper = run_continuation_looper(
+            func=func_continuation,
+            params=params['looper'],
+            params_system=params['system']
+        )
+        return np.transpose(looper.results['V'][:, [keys.index(key) for key in keys_plot]])
+
+    # results of the previous versions containing only the plotted measures
+    params['looper']['file_path_prefix'] = 'data/v4.0_qom-v1.0.1/3a_' + suffix
+    file_path = get_file_path(params['looper'])
+    if os.path.isfile(file_path):
+        return np.transpose(np.load(file_path)['arr_0'])
+
+    # extrema of all measures
+    params['looper']['file_path_prefix'] = 'data/v4.0_qom-v1.0.1/3a_bundle_' + suffix
+    looper = run_stored_looper(
+        func=func_cached,
+        params=params['looper'],
+        params_system=params['system']
     )
-    # get modes and correlations
-    Modes, Corrs = hle_solver.get_modes_corrs()
-    # get quantum correlation measures
-    Measures = QCMSolver(
-        Modes=Modes,
-        Corrs=Corrs,
-        params=params['solver']
-    ).get_measures()
-    # extract maximum squeezing
-    m_0 = np.min(Corrs[:, 2, 2])
-    # extract maximum entanglement
-    m_1 = np.max(Measures[:, 0])
-
-    # return results as array
-    return np.array([m_0, m_1], dtype=np.float_)
+
+    return np.transpose(looper.results['V'][:, [keys.index(key) for key in keys_plot]])
 
 if __name__ == '__main__':
-    # without mechanical frequency modulation
-    params['looper']['file_path_prefix'] = 'data/v4.0_qom-v1.0.1/3a_theta=0.0'
-    params['system']['theta'] = 0.0
-    looper_0 = run_loopers_in_parallel(
-        looper_name='XLooper',
+    # results shared across the scripts
+    func_cached = CachedFunc(
         func=func,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+        params_solver=params['solver'],
+        deps=[func_continuation, OEM_20, OEMHLESolver, get_measure_bundle]
     )
-    Sq_0, En_0 = np.transpose(looper_0.results['V'])
+
+    # without mechanical frequency modulation
+    params['system']['theta'] = 0.0
+    Sq_0, En_0 = get_plotted_measures(func_cached, 'theta=0.0')
 
     # with mechanical frequency modulation
-    params['looper']['file_path_prefix'] = 'data/v4.0_qom-v1.0.1/3a_theta=0.5'
     params['system']['theta'] = 0.5
-    looper_1 = run_loopers_in_parallel(
-        looper_name='XLooper',
-        func=func,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
-    )
-    Sq_1, En_1 = np.transpose(looper_1.results['V'])
+    Sq_1, En_1 = get_plotted_measures(func_cached, 'theta=0.5')
 
     # plotter
-    X = looper_0.axes['X']['val']
+    X = get_X_values(params['looper']['X'])
     plotter = MPLPlotter(
         axes={},
         params=params['plotter']
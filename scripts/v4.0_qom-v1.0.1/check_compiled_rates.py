@@ -0,0 +1,50 @@
+# dependencies
+import os
+import sys
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import system
+from systems.OptoElectroMechanical import OEM_20, njit
+
+# parameters of the checked systems
+params_systems = [{
+    'A_ls'      : [100.0, 10.0, 10.0],
+    'A_vs'      : [50.0, 50.0, 50.0], 
+    'Delta_0'   : 1.0,
+    'gammas'    : [0.1, 1e-6, 1e-2],
+    'gs'        : [1e-3, 2e-4],
+    'n_ths'     : [0.0, 0.0],
+    'Omegas'    : [2.0, 2.0, 2.0],
+    'omega_c0'  : 1.1,
+    'theta'     : 0.5,
+    't_mod'     : 'cos',
+    't_pos'     : 'top'
+}, {
+    'A_ls'      : [100.0, 10.0, 10.0],
+    'A_vs'      : [50.0, 50.0, 50.0], 
+    'Delta_0'   : 1.0,
+    'gammas'    : [0.1, 1e-6, 1e-2],
+    'gs'        : [1e-3, 2e-4],
+    'n_ths'     : [0.1, 0.1],
+    'Omegas'    : [2.0, 1.0, 2.0],
+    'omega_c0'  : 1.1,
+    'theta'     : 0.0,
+    't_mod'     : 'sin',
+    't_pos'     : 'bottom'
+}]
+
+# compiled rates are only available with numba installed
+if njit is None:
+    print('numba is not installed, skipping the check of the compiled rates')
+    sys.exit(0)
+
+# compare the compiled rates with the rates of the interpreter
+for idx, params_system in enumerate(params_systems):
+    system = OEM_20(
+        params=params_system
+    )
+    if not system.is_compiled_consistent():
+        raise RuntimeError('Compiled rates differ from the rates of the interpreter for system {}'.format(idx))
+
+print('Compiled rates agree with the rates of the interpreter for {} systems'.format(len(params_systems)))
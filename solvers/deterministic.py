@@ -0,0 +1,1173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing solvers for the deterministic dynamics of the systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-16"
+__updated__ = "2026-10-17"
+
+# dependencies
+import copy
+import itertools
+import logging
+import numpy as np
+import scipy.integrate as si
+import scipy.linalg as sl
+
+# local modules
+from utils.modulations import get_modulation_schedule
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# Butcher tableau of the Dormand-Prince method
+DOPRI5_C = np.array([0.0, 1.0 / 5.0, 3.0 / 10.0, 4.0 / 5.0, 8.0 / 9.0, 1.0, 1.0], dtype=np.float_)
+DOPRI5_A = [
+    [],
+    [1.0 / 5.0],
+    [3.0 / 40.0, 9.0 / 40.0],
+    [44.0 / 45.0, - 56.0 / 15.0, 32.0 / 9.0],
+    [19372.0 / 6561.0, - 25360.0 / 2187.0, 64448.0 / 6561.0, - 212.0 / 729.0],
+    [9017.0 / 3168.0, - 355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, - 5103.0 / 18656.0],
+    [35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, - 2187.0 / 6784.0, 11.0 / 84.0]
+]
+DOPRI5_E = np.array([71.0 / 57600.0, 0.0, - 71.0 / 16695.0, 71.0 / 1920.0, - 17253.0 / 339200.0, 22.0 / 525.0, - 1.0 / 40.0], dtype=np.float_)
+
+def get_lyapunov_steady_states(A, D):
+    r"""Function to obtain the steady-state correlations for stacks of drift and noise matrices.
+
+    The correlations solve the continuous Lyapunov equation :math:`A V + V A^{T} + D = 0`, which is vectorized as :math:`\left( A \otimes I + I \otimes A \right) \mathrm{vec} (V) = - \mathrm{vec} (D)` and solved for all stacks at once.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        Drift matrices with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    D : numpy.ndarray
+        Noise matrices with the same shape as ``A``.
+
+    Returns
+    -------
+    V : numpy.ndarray
+        Steady-state correlations with the same shape as ``A``.
+    """
+
+    # extract frequently used variables
+    A = np.asarray(A, dtype=np.float_)
+    dim = A.shape[-1]
+    I = np.eye(dim, dtype=np.float_)
+
+    # vectorized Lyapunov operators
+    L = np.einsum('...ik,jl->...ijkl', A, I) + np.einsum('ik,...jl->...ijkl', I, A)
+    L = L.reshape(A.shape[:-2] + (dim**2, dim**2))
+
+    # solve and symmetrize
+    V = np.linalg.solve(L, - np.reshape(np.broadcast_to(D, A.shape), A.shape[:-2] + (dim**2, 1)))[..., 0].reshape(A.shape)
+
+    return 0.5 * (V + np.swapaxes(V, -1, -2))
+
+class EnsembleHLESolver():
+    r"""Class to solve the Heisenberg-Langevin equations of a stack of systems as a single vectorized ODE.
+
+    The classical modes and the quadrature correlations of all ``N`` systems are stacked into one real state array of shape ``(N, 2 * num_modes + 4 * num_modes**2)`` and advanced together with a shared time step.
+    Systems with non-finite errors, for example unstable parameter points, systems requiring steps below ``'ode_h_min'`` and systems limiting the step once ``'ode_num_steps'`` steps are exceeded between two consecutive times are masked with ``nan`` values for the remaining times and marked in the attribute ``failed``, so that they do not stall the other systems.
+
+    Parameters
+    ----------
+    system_class : class
+        Class of the system. It should implement the class methods ``get_params_stacked``, ``get_ivc_batch``, ``get_mode_rates_batch``, ``get_A_batch`` and ``get_D_batch``.
+    params_systems : list
+        Parameters for each system.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        show_progress       (*bool*) option to display the progress of the solver. Default is ``False``.
+        ode_method          (*str*) method used to solve the ODEs. Available options are ``'dopri5'`` (fallback) for the embedded Dormand-Prince method with a shared adaptive step and ``'rk4'`` for the classical fixed-step Runge-Kutta method. Default is ``'dopri5'``.
+        ode_atol            (*float*) absolute tolerance of the adaptive step. Default is ``1e-9``.
+        ode_h_min           (*float*) minimum adaptive step. Default is ``1e-10``.
+        ode_rtol            (*float*) relative tolerance of the adaptive step. Default is ``1e-6``.
+        ode_num_steps       (*int*) maximum number of adaptive steps between two consecutive times before the system limiting the step is masked. Default is ``10000``.
+        ode_num_substeps    (*int*) number of fixed steps between two consecutive times for ``'rk4'``. Default is ``4``.
+        use_modulation_schedule (*bool*) option to tabulate the modulation waveforms once over the times and the intermediate stages of ``'rk4'`` when all systems share the modulation frequencies and the type of modulation. Default is ``False``.
+        t_min               (*float*) minimum time at which integration starts. Default is ``0.0``.
+        t_max               (*float*) maximum time at which integration stops. Default is ``1000.0``.
+        t_dim               (*int*) number of values from ``'t_max'`` to ``'t_min'``, both inclusive. Default is ``10001``.
+        t_index_min         (*int*) minimum index of the times at which the values are returned. Default is ``0``.
+        t_index_max         (*int*) maximum index (exclusive) of the times at which the values are returned. Default is ``'t_dim'``.
+        ================    ====================================================
+    """
+
+    # default solver parameters
+    solver_defaults = {
+        'show_progress'     : False,
+        'ode_method'        : 'dopri5',
+        'ode_atol'          : 1e-9,
+        'ode_h_min'         : 1e-10,
+        'ode_rtol'          : 1e-6,
+        'ode_num_steps'     : 10000,
+        'ode_num_substeps'  : 4,
+        'use_modulation_schedule': False,
+        't_min'             : 0.0,
+        't_max'             : 1000.0,
+        't_dim'             : 10001,
+        't_index_min'       : 0,
+        't_index_max'       : None
+    }
+
+    def __init__(self, system_class, params_systems, params):
+        """Class constructor for EnsembleHLESolver."""
+
+        # set attributes
+        self.system_class = system_class
+        self.params = dict()
+        for key in self.solver_defaults:
+            self.params[key] = params.get(key, self.solver_defaults[key])
+        if self.params['t_index_max'] is None:
+            self.params['t_index_max'] = self.params['t_dim']
+        assert self.params['ode_method'] in ['dopri5', 'rk4'], "Parameter ``'ode_method'`` can only assume the values ``'dopri5'`` and ``'rk4'``"
+
+        # stack system parameters
+        self.Params = system_class.get_params_stacked(params_systems)
+        self.num_systems = len(params_systems)
+
+        # times
+        self.T = np.linspace(self.params['t_min'], self.params['t_max'], self.params['t_dim'])
+
+        # shared modulation waveforms
+        if self.params['use_modulation_schedule'] and 'Omegas' in self.Params and np.all(self.Params['Omegas'] == self.Params['Omegas'][0]) and np.all(self.Params['t_mod'] == self.Params['t_mod'][0]):
+            self.Params['schedule'] = get_modulation_schedule(self.Params['Omegas'][0], self.Params['t_mod'][0], self.T, 2 * self.params['ode_num_substeps'] if self.params['ode_method'] == 'rk4' else 1)
+
+        # results
+        self.Modes = None
+        self.Corrs = None
+        self.failed = np.zeros(self.num_systems, dtype=np.bool_)
+
+    def get_corrs(self):
+        """Method to obtain the quadrature correlations of all systems.
+
+        Returns
+        -------
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(N, T, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        return self.get_modes_corrs()[1]
+
+    def get_modes(self):
+        """Method to obtain the classical modes of all systems.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(N, T, num_modes)``.
+        """
+
+        return self.get_modes_corrs()[0]
+
+    def get_modes_corrs(self):
+        """Method to obtain the classical modes and quadrature correlations of all systems.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(N, T, num_modes)``.
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(N, T, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        if self.Modes is None:
+            self.solve()
+
+        return self.Modes, self.Corrs
+
+    def get_modes_corrs_from_states(self, Y):
+        """Method to split stacked states into classical modes and quadrature correlations.
+
+        Parameters
+        ----------
+        Y : numpy.ndarray
+            States with shape ``(N, 2 * num_modes + 4 * num_modes**2)``.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(N, num_modes)``.
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(N, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        Modes = Y[:, :self.num_modes] + 1.0j * Y[:, self.num_modes:2 * self.num_modes]
+        Corrs = Y[:, 2 * self.num_modes:].reshape((len(Y), 2 * self.num_modes, 2 * self.num_modes))
+
+        return Modes, Corrs
+
+    def get_states_from_modes_corrs(self, Modes, Corrs):
+        """Method to stack classical modes and quadrature correlations into states.
+
+        Parameters
+        ----------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(N, num_modes)``.
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(N, 2 * num_modes, 2 * num_modes)``.
+
+        Returns
+        -------
+        Y : numpy.ndarray
+            States with shape ``(N, 2 * num_modes + 4 * num_modes**2)``.
+        """
+
+        return np.concatenate((np.real(Modes), np.imag(Modes), Corrs.reshape((len(Corrs), -1))), axis=1)
+
+    def get_times(self):
+        """Method to obtain the times at which the values are returned.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times with shape ``(T, )``.
+        """
+
+        return self.T[self.params['t_index_min']:self.params['t_index_max']]
+
+    def get_rates(self, t, Y):
+        """Method to obtain the rates of change of the stacked states.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        Y : numpy.ndarray
+            States with shape ``(N, 2 * num_modes + 4 * num_modes**2)``.
+
+        Returns
+        -------
+        rates : numpy.ndarray
+            Rates of change of the states with the same shape as ``Y``.
+        """
+
+        # extract modes and correlations
+        Modes, Corrs = self.get_modes_corrs_from_states(Y)
+
+        # rates of the classical modes
+        mode_rates = self.system_class.get_mode_rates_batch(Modes, self.Params, t)
+
+        # rates of the quadrature correlations
+        A = self.system_class.get_A_batch(Modes, self.Params, t)
+        AV = np.matmul(A, Corrs)
+        corr_rates = AV + np.transpose(AV, (0, 2, 1)) + self.D
+
+        return self.get_states_from_modes_corrs(mode_rates, corr_rates)
+
+    def solve(self):
+        """Method to integrate all systems over the times.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(N, T, num_modes)``.
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(N, T, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        # extract frequently used variables
+        t_index_min = self.params['t_index_min']
+        t_index_max = self.params['t_index_max']
+
+        # initial values
+        iv_modes, iv_corrs = self.system_class.get_ivc_batch(self.Params)
+        self.num_modes = iv_modes.shape[1]
+        self.D = self.system_class.get_D_batch(self.Params)
+        Y = self.get_states_from_modes_corrs(iv_modes, iv_corrs)
+
+        # initialize results
+        Ys = np.empty((t_index_max - t_index_min, ) + Y.shape, dtype=np.float_)
+        if t_index_min == 0:
+            Ys[0] = Y
+
+        # integrate between consecutive times
+        h = self.T[1] - self.T[0] if len(self.T) > 1 else 0.0
+        k_1 = None
+        for i in range(1, t_index_max):
+            if self.params['ode_method'] == 'rk4':
+                Y = self.step_rk4(self.T[i - 1], self.T[i], Y)
+            else:
+                Y, h, k_1 = self.step_dopri5(self.T[i - 1], self.T[i], Y, h, k_1)
+            if i >= t_index_min:
+                Ys[i - t_index_min] = Y
+
+            # update progress
+            if self.params['show_progress'] and i % max(1, int(t_index_max / 10)) == 0:
+                logger.info('Integrating ({:0.0f}%)'.format(100.0 * i / (t_index_max - 1)))
+
+        # split results for each system
+        Modes, Corrs = self.get_modes_corrs_from_states(Ys.reshape((-1, Y.shape[1])))
+        self.Modes = np.transpose(Modes.reshape((len(Ys), self.num_systems, self.num_modes)), (1, 0, 2))
+        self.Corrs = np.transpose(Corrs.reshape((len(Ys), self.num_systems, 2 * self.num_modes, 2 * self.num_modes)), (1, 0, 2, 3))
+
+        return self.Modes, self.Corrs
+
+    def step_dopri5(self, t_start, t_stop, Y, h, k_1=None):
+        """Method to advance the states between two times using the Dormand-Prince method with a shared adaptive step.
+
+        The step is accepted only if the scaled error of every system is within tolerance.
+        Systems with non-finite errors, with errors exceeding the tolerance at the minimum step or limiting the step after the maximum number of steps are masked instead.
+
+        Parameters
+        ----------
+        t_start : float
+            Initial time.
+        t_stop : float
+            Final time.
+        Y : numpy.ndarray
+            States at the initial time.
+        h : float
+            Trial step size.
+        k_1 : numpy.ndarray, optional
+            Rates at the initial time, reused from the last accepted step.
+
+        Returns
+        -------
+        Y : numpy.ndarray
+            States at the final time.
+        h : float
+            Trial step size for the next call.
+        k_1 : numpy.ndarray
+            Rates at the final time.
+        """
+
+        # extract frequently used variables
+        atol = self.params['ode_atol']
+        h_min = self.params['ode_h_min']
+        rtol = self.params['ode_rtol']
+
+        t = t_start
+        if k_1 is None:
+            k_1 = self.get_rates(t, Y)
+        num_steps = 0
+        while t < t_stop:
+            # clip step to the final time
+            h_step = min(h, t_stop - t)
+            last = h_step == t_stop - t
+
+            # stages
+            ks = [k_1]
+            for j in range(1, 7):
+                Y_j = Y + h_step * sum(a * k for a, k in zip(DOPRI5_A[j], ks))
+                ks.append(self.get_rates(t + DOPRI5_C[j] * h_step, Y_j))
+
+            # scaled error of each system
+            error = h_step * sum(e * k for e, k in zip(DOPRI5_E, ks) if e != 0.0)
+            scale = atol + rtol * np.maximum(np.abs(Y), np.abs(Y_j))
+            with np.errstate(invalid='ignore', over='ignore'):
+                norms = np.sqrt(np.mean((error / scale)**2, axis=1))
+            norms[self.failed] = 0.0
+
+            # mask failing systems
+            failing = ~ np.isfinite(norms) | ((norms > 1.0) & (h_step <= h_min))
+            num_steps += 1
+            if num_steps > self.params['ode_num_steps'] and np.max(np.where(failing, 0.0, norms)) > 0.0:
+                failing[np.argmax(np.where(failing, 0.0, norms))] = True
+                num_steps = 0
+            if np.any(failing):
+                logger.warning('Masking systems {} at time {}'.format(np.flatnonzero(failing).tolist(), t))
+                self.failed |= failing
+                norms[failing] = 0.0
+            norm = np.max(norms) if len(norms) > 0 else 0.0
+
+            # update step size
+            factor = 5.0 if norm == 0.0 else min(5.0, max(0.2, 0.9 * norm**(- 0.2)))
+            if norm <= 1.0:
+                t = t_stop if last else t + h_step
+                Y = np.where(self.failed[:, None], np.nan, Y_j)
+                k_1 = ks[6]
+                # retain trial step if clipped
+                h = max(h, h_step * factor) if last else h_step * factor
+            else:
+                h = max(h_min, h_step * factor)
+
+        return Y, h, k_1
+
+    def step_rk4(self, t_start, t_stop, Y):
+        """Method to advance the states between two times using the classical Runge-Kutta method with fixed steps.
+
+        Parameters
+        ----------
+        t_start : float
+            Initial time.
+        t_stop : float
+            Final time.
+        Y : numpy.ndarray
+            States at the initial time.
+
+        Returns
+        -------
+        Y : numpy.ndarray
+            States at the final time.
+        """
+
+        # step size
+        num_substeps = self.params['ode_num_substeps']
+        h = (t_stop - t_start) / num_substeps
+
+        # times of the stages, read from the schedule to use its tables
+        schedule = self.Params.get('schedule', None)
+        Ts = schedule.get_times(t_start, t_stop) if schedule is not None else np.linspace(t_start, t_stop, 2 * num_substeps + 1)
+
+        for j in range(num_substeps):
+            k_1 = self.get_rates(Ts[2 * j], Y)
+            k_2 = self.get_rates(Ts[2 * j + 1], Y + 0.5 * h * k_1)
+            k_3 = self.get_rates(Ts[2 * j + 1], Y + 0.5 * h * k_2)
+            k_4 = self.get_rates(Ts[2 * j + 2], Y + h * k_3)
+            Y = Y + h / 6.0 * (k_1 + 2.0 * k_2 + 2.0 * k_3 + k_4)
+
+        return Y
+
+class OEMHLESolver():
+    r"""Class to solve the Heisenberg-Langevin equations of a single system with its analytical Jacobian.
+
+    The real state is formed by the interleaved real and imaginary parts of the classical modes followed by the flattened quadrature correlations.
+    For the correlations, the rates :math:`\dot{V} = A V + V A^{T} + D` are linear in :math:`V` and the drift matrix is linear in the modes, so that the complete Jacobian is assembled exactly from the drift matrix and its derivatives.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.*`
+        Instance of the system. Along with the methods ``get_ivc``, ``get_mode_rates``, ``get_A`` and ``get_D``, it should implement ``get_mode_rates_jacobian`` and ``get_A_gradients`` to use the analytical Jacobian.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        show_progress       (*bool*) option to display the progress of the solver. Default is ``False``.
+        corrs_packed        (*bool*) option to integrate only the upper-triangular elements of the symmetric correlation matrix, with the rates obtained from the structurally non-zero elements of the drift matrix. The system may implement ``get_A_sparsity`` to provide these elements. Default is ``False``.
+        conv_tol            (*float*) relative tolerance of the period-to-period changes in the modes and the mechanical position variance for ``'stop_on_convergence'``. It should exceed ``'ode_rtol'``. Default is ``1e-5``. For example, with ``'gammas'`` of ``[0.1, 0.05, 0.05]`` and the remaining parameters of the scripts ``3a-3c``, the dynamics converges at ``t = 213.6`` with a modulation period of :math:`\pi`, whereas with the mechanical damping ``1e-6`` of the scripts, the transients do not decay within ``'t_max'`` and the complete integration is performed.
+        hle_method          (*str*) method used to obtain the dynamics. Available options are ``'integrate'`` (fallback) to integrate from the initial values and ``'floquet'`` to directly obtain the asymptotic periodic state using a shooting method for the modes and the monodromy matrix for the correlations. If the modulation period cannot be obtained or the periodic state is unstable, the solver falls back to ``'integrate'``. Default is ``'integrate'``.
+        floquet_max_iter    (*int*) maximum number of Newton iterations of the shooting method. Default is ``20``.
+        floquet_max_period  (*float*) maximum modulation period for which ``'floquet'`` is used. Default is ``100.0``.
+        floquet_tol         (*float*) relative tolerance of the shooting method. Default is ``1e-6``.
+        ode_method          (*str*) method used to solve the ODEs. Available options are ``'vode'`` (fallback) and ``'lsoda'``. Default is ``'vode'``.
+        ode_is_stiff        (*bool*) option to use the backward differentiation formulae instead of the Adams methods for ``'vode'``. Default is ``True``.
+        ode_use_compiled    (*bool*) option to evaluate the rates with the compiled function returned by the ``get_hle_rates_compiled`` method of the system, if implemented. It is not used with ``'corrs_packed'``. As the Jacobian is evaluated by the interpreter, disabling ``'ode_use_jac'`` is usually faster with this option. Default is ``False``.
+        ode_use_jac         (*bool*) option to use the analytical Jacobian of the system. If ``False``, the Jacobian is estimated by finite differences. Default is ``True``.
+        ode_atol            (*float*) absolute tolerance of the integrator. Default is ``1e-12``.
+        ode_rtol            (*float*) relative tolerance of the integrator. Default is ``1e-6``.
+        ode_num_steps       (*int*) maximum number of internal steps between two consecutive times. Default is ``100000``.
+        use_modulation_schedule (*bool*) option to tabulate the modulation waveforms of the system over the times, if the system has the attribute ``modulation_schedule``. The schedule is set on a shallow copy of the system, leaving the given instance unchanged. Solver times other than the tabulated times are evaluated exactly. Default is ``False``.
+        use_lyapunov        (*bool*) option to directly return the steady state for an unmodulated system, with the modes obtained from ``get_modes_steady_state`` and the correlations from the continuous Lyapunov equation. The system should implement ``is_time_independent``, which for ``OEM_20`` requires vanishing modulated amplitudes of the laser and the voltage along with a vanishing ``theta``. If no stable steady state exists, the solver falls back to the other methods. Default is ``False``.
+        stop_on_convergence (*bool*) option to stop the integration once the changes over two consecutive modulation periods are within ``'conv_tol'`` and to fill the returned times from the last converged period. Default is ``False``.
+        t_min               (*float*) minimum time at which integration starts. Default is ``0.0``.
+        t_max               (*float*) maximum time at which integration stops. Default is ``1000.0``.
+        t_dim               (*int*) number of values from ``'t_max'`` to ``'t_min'``, both inclusive. Default is ``10001``.
+        t_index_min         (*int*) minimum index of the times at which the values are returned. Default is ``0``.
+        t_index_max         (*int*) maximum index (exclusive) of the times at which the values are returned. Default is ``'t_dim'``.
+        ================    ====================================================
+    iv_modes : numpy.ndarray, optional
+        Initial values of the classical modes, for example the periodic state of a neighbouring parameter point. If ``None``, the initial values of the system are used.
+    iv_corrs : numpy.ndarray, optional
+        Initial values of the quadrature correlations. If ``None``, the initial values of the system are used.
+    """
+
+    # default solver parameters
+    solver_defaults = {
+        'show_progress'         : False,
+        'corrs_packed'          : False,
+        'conv_tol'              : 1e-5,
+        'hle_method'            : 'integrate',
+        'floquet_max_iter'      : 20,
+        'floquet_max_period'    : 100.0,
+        'floquet_tol'           : 1e-6,
+        'ode_method'            : 'vode',
+        'ode_is_stiff'          : True,
+        'ode_use_compiled'      : False,
+        'ode_use_jac'           : True,
+        'ode_atol'              : 1e-12,
+        'ode_rtol'              : 1e-6,
+        'ode_num_steps'         : 100000,
+        'stop_on_convergence'   : False,
+        'use_lyapunov'          : False,
+        'use_modulation_schedule': False,
+        't_min'                 : 0.0,
+        't_max'                 : 1000.0,
+        't_dim'                 : 10001,
+        't_index_min'           : 0,
+        't_index_max'           : None
+    }
+
+    def __init__(self, system, params, iv_modes=None, iv_corrs=None):
+        """Class constructor for OEMHLESolver."""
+
+        # set attributes
+        self.system = system
+        self.params = dict()
+        for key in self.solver_defaults:
+            self.params[key] = params.get(key, self.solver_defaults[key])
+        if self.params['t_index_max'] is None:
+            self.params['t_index_max'] = self.params['t_dim']
+        assert self.params['hle_method'] in ['integrate', 'floquet'], "Parameter ``'hle_method'`` can only assume the values ``'integrate'`` and ``'floquet'``"
+        assert self.params['ode_method'] in ['vode', 'lsoda'], "Parameter ``'ode_method'`` can only assume the values ``'vode'`` and ``'lsoda'``"
+
+        # initial values
+        self.iv_modes, self.iv_corrs, self.c = system.get_ivc()
+        if iv_modes is not None:
+            self.iv_modes = np.array(iv_modes, dtype=np.complex_)
+        if iv_corrs is not None:
+            self.iv_corrs = np.array(iv_corrs, dtype=np.float_)
+        self.num_modes = system.num_modes
+        self.dim_corrs = (2 * self.num_modes, 2 * self.num_modes)
+        self.I = np.eye(2 * self.num_modes, dtype=np.float_)
+
+        # dimension of the state
+        self.dim_state = 2 * self.num_modes + (self.num_modes * (2 * self.num_modes + 1) if self.params['corrs_packed'] else 4 * self.num_modes**2)
+        if self.params['corrs_packed']:
+            self.set_packed_indices()
+
+        # compiled rates
+        self.rates_compiled = None
+        if self.params['ode_use_compiled'] and not self.params['corrs_packed'] and hasattr(system, 'get_hle_rates_compiled'):
+            self.rates_compiled = system.get_hle_rates_compiled()
+
+        # times
+        self.T = np.linspace(self.params['t_min'], self.params['t_max'], self.params['t_dim'])
+
+        # shared modulation waveforms
+        self.modulation_schedule = None
+        if self.params['use_modulation_schedule'] and hasattr(system, 'modulation_schedule'):
+            self.modulation_schedule = get_modulation_schedule(system.params['Omegas'], system.params['t_mod'], self.T)
+            self.system = copy.copy(system)
+            self.system.modulation_schedule = self.modulation_schedule
+
+        # results
+        self.Modes = None
+        self.Corrs = None
+        self.multipliers = None
+        self.y_periodic = None
+        self.t_conv = None
+        self.num_rates_evals = 0
+        self.num_jac_evals = 0
+
+    def get_corrs(self):
+        """Method to obtain the quadrature correlations.
+
+        Returns
+        -------
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(T, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        return self.get_modes_corrs()[1]
+
+    def get_convergence_time(self):
+        """Method to obtain the time at which the integration converged to the periodic state.
+
+        Returns
+        -------
+        t_conv : float
+            Time at which the integration was stopped. If ``'stop_on_convergence'`` is ``False`` or the integration did not converge before the returned times, ``None`` is returned.
+        """
+
+        if self.Modes is None:
+            self.solve()
+
+        return self.t_conv
+
+    def get_floquet_multipliers(self):
+        """Method to obtain the Floquet multipliers of the asymptotic periodic state.
+
+        The multipliers are the eigenvalues of the monodromy matrix of the linearized dynamics over one modulation period.
+        The periodic state is stable if all multipliers lie inside the unit circle.
+
+        Returns
+        -------
+        multipliers : numpy.ndarray
+            Floquet multipliers. If ``'hle_method'`` is not ``'floquet'`` or the modulation period cannot be obtained, ``None`` is returned.
+        """
+
+        if self.Modes is None:
+            self.solve()
+
+        return self.multipliers
+
+    def get_floquet_rates(self, t, y):
+        """Method to obtain the rates of change of the state along with its monodromy matrix.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        y : numpy.ndarray
+            Real modes, flattened monodromy matrix and flattened correlations.
+
+        Returns
+        -------
+        rates : numpy.ndarray
+            Rates of change.
+        """
+
+        # extract frequently used variables
+        dim_modes = 2 * self.num_modes
+        modes = np.ascontiguousarray(y[:dim_modes]).view(np.complex_)
+        Phi = y[dim_modes:dim_modes + dim_modes**2].reshape(self.dim_corrs)
+        corrs = y[dim_modes + dim_modes**2:].reshape(self.dim_corrs)
+
+        # rates of the classical modes
+        mode_rates = self.system.get_mode_rates(modes, self.c, t)
+
+        # rates of the monodromy matrix and the correlations
+        A = np.array(self.system.get_A(modes, self.c, t), dtype=np.float_)
+        AV = np.matmul(A, corrs)
+        corr_rates = AV + np.transpose(AV) + self.system.get_D(modes, corrs, self.c, t)
+
+        # update count
+        self.num_rates_evals += 1
+
+        return np.concatenate((np.asarray(mode_rates, dtype=np.complex_).view(np.float_), np.ravel(np.matmul(A, Phi)), np.ravel(corr_rates)))
+
+    def get_integrator(self, t_0, y_0):
+        """Method to initialize the integrator.
+
+        Parameters
+        ----------
+        t_0 : float
+            Initial time.
+        y_0 : numpy.ndarray
+            Initial state.
+
+        Returns
+        -------
+        integrator : :class:`scipy.integrate.ode`
+            Integrator for the state.
+        """
+
+        # initialize integrator
+        integrator = si.ode(self.get_rates, self.get_jacobian if self.params['ode_use_jac'] else None)
+        if self.params['ode_method'] == 'lsoda':
+            integrator.set_integrator('lsoda', atol=self.params['ode_atol'], rtol=self.params['ode_rtol'], nsteps=self.params['ode_num_steps'])
+        else:
+            integrator.set_integrator('vode', method='bdf' if self.params['ode_is_stiff'] else 'adams', with_jacobian=True, atol=self.params['ode_atol'], rtol=self.params['ode_rtol'], nsteps=self.params['ode_num_steps'])
+        integrator.set_initial_value(y_0, t_0)
+
+        return integrator
+
+    def get_jacobian(self, t, y):
+        """Method to obtain the Jacobian of the rates of change of the state.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        y : numpy.ndarray
+            State of the system.
+
+        Returns
+        -------
+        J : numpy.ndarray
+            Jacobian of the rates of change of the state.
+        """
+
+        # extract frequently used variables
+        dim_modes = 2 * self.num_modes
+        modes, corrs = self.get_modes_corrs_from_state(y)
+
+        # initialize Jacobian
+        J = np.zeros((len(y), len(y)), dtype=np.float_)
+
+        # classical modes
+        J[:dim_modes, :dim_modes] = self.system.get_mode_rates_jacobian(modes, self.c, t)
+        A = J[:dim_modes, :dim_modes]
+        dA = self.system.get_A_gradients(modes, self.c, t)
+
+        if self.params['corrs_packed']:
+            # correlations with respect to the classical modes
+            corrs_packed = y[dim_modes:]
+            for k in range(dim_modes):
+                J[dim_modes:, k] = np.bincount(self.terms_p, weights=np.ravel(dA[k])[self.terms_A] * corrs_packed[self.terms_V], minlength=len(corrs_packed))
+
+            # correlations with respect to the correlations
+            np.add.at(J[dim_modes:, dim_modes:], (self.terms_p, self.terms_V), np.ravel(A)[self.terms_A])
+        else:
+            # correlations with respect to the classical modes
+            dAV = np.matmul(dA, corrs)
+            J[dim_modes:, :dim_modes] = np.transpose((dAV + np.transpose(dAV, (0, 2, 1))).reshape((dim_modes, -1)))
+
+            # correlations with respect to the correlations
+            J[dim_modes:, dim_modes:] = np.kron(A, self.I) + np.kron(self.I, A)
+
+        # update count
+        self.num_jac_evals += 1
+
+        return J
+
+    def get_modes(self):
+        """Method to obtain the classical modes.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(T, num_modes)``.
+        """
+
+        return self.get_modes_corrs()[0]
+
+    def get_modes_corrs(self):
+        """Method to obtain the classical modes and quadrature correlations.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(T, num_modes)``.
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(T, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        if self.Modes is None:
+            self.solve()
+
+        return self.Modes, self.Corrs
+
+    def get_modes_corrs_from_state(self, y):
+        """Method to split a state into classical modes and quadrature correlations.
+
+        Parameters
+        ----------
+        y : numpy.ndarray
+            State of the system.
+
+        Returns
+        -------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quadrature correlations.
+        """
+
+        modes = np.ascontiguousarray(y[:2 * self.num_modes]).view(np.complex_)
+        if self.params['corrs_packed']:
+            corrs = y[2 * self.num_modes:][self.idxs_packed]
+        else:
+            corrs = y[2 * self.num_modes:].reshape(self.dim_corrs)
+
+        return modes, corrs
+
+    def get_periodic_state(self):
+        """Method to obtain the periodic state at the beginning of a modulation period.
+
+        The state is available for the ``'floquet'`` method and for integrations with ``'stop_on_convergence'``, where the state at the last period boundary before the returned times is used if the integration did not converge.
+        It can be used to warm-start the solver for a neighbouring parameter point.
+
+        Returns
+        -------
+        modes : numpy.ndarray
+            Classical modes. If the periodic state is unavailable, ``None`` is returned.
+        corrs : numpy.ndarray
+            Quadrature correlations. If the periodic state is unavailable, ``None`` is returned.
+        """
+
+        if self.Modes is None:
+            self.solve()
+
+        if self.y_periodic is None:
+            return None, None
+
+        return self.get_modes_corrs_from_state(self.y_periodic)
+
+    def get_reductions(self, funcs, chunk_size=None):
+        """Method to obtain running reductions of quantities over the returned times.
+
+        Each state, or each chunk of states, is folded into the reductions as soon as it is obtained, so that the classical modes and quadrature correlations at all returned times are never stored together.
+
+        Parameters
+        ----------
+        funcs : dict or callable
+            Functions to obtain the quantities, formatted as ``func(modes, corrs)`` and returning a float, or a single function formatted as ``func(modes, corrs)`` and returning a dictionary of floats, for example the bundle of measures of :func:`solvers.measure.get_measure_bundle`.
+        chunk_size : int, optional
+            Number of states in each chunk. If ``None``, the functions are called for each state. Otherwise, they are called with the stacked modes of shape ``(T_c, num_modes)`` and correlations of shape ``(T_c, 2 * num_modes, 2 * num_modes)`` of each chunk, returning arrays of shape ``(T_c, )`` instead of floats. Default is ``None``.
+
+        Returns
+        -------
+        reductions : dict
+            Reductions for each quantity with the keys ``'min'``, ``'max'``, ``'mean'``, ``'t_argmin'`` and ``'t_argmax'``.
+        """
+
+        # extract frequently used variables
+        T = self.get_times()
+        states = self.iterate_states()
+
+        # initialize reductions
+        reduction_init = {
+            'min'       : np.inf,
+            'max'       : - np.inf,
+            'mean'      : 0.0,
+            't_argmin'  : None,
+            't_argmax'  : None
+        }
+        keys = list() if callable(funcs) else list(funcs)
+        reductions = {key: dict(reduction_init) for key in keys}
+
+        # fold each chunk of states
+        i = 0
+        while True:
+            Ys = list(itertools.islice(states, chunk_size if chunk_size is not None else 1))
+            if len(Ys) == 0:
+                break
+
+            # values of the quantities
+            if chunk_size is None:
+                modes, corrs = self.get_modes_corrs_from_state(Ys[0])
+                values = funcs(modes, corrs) if callable(funcs) else {key: funcs[key](modes, corrs) for key in keys}
+            else:
+                Modes, Corrs = (np.array(values) for values in zip(*[self.get_modes_corrs_from_state(y) for y in Ys]))
+                values = funcs(Modes, Corrs) if callable(funcs) else {key: funcs[key](Modes, Corrs) for key in keys}
+
+            for key in values:
+                vs = np.ravel(np.asarray(values[key], dtype=np.float_))
+                reduction = reductions.setdefault(key, dict(reduction_init))
+                j_min = int(np.argmin(vs))
+                if vs[j_min] < reduction['min']:
+                    reduction['min'] = float(vs[j_min])
+                    reduction['t_argmin'] = T[i + j_min]
+                j_max = int(np.argmax(vs))
+                if vs[j_max] > reduction['max']:
+                    reduction['max'] = float(vs[j_max])
+                    reduction['t_argmax'] = T[i + j_max]
+                reduction['mean'] += (np.sum(vs) - len(vs) * reduction['mean']) / (i + len(vs))
+            i += len(Ys)
+
+        return reductions
+
+    def get_rates(self, t, y):
+        """Method to obtain the rates of change of the state.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        y : numpy.ndarray
+            State of the system.
+
+        Returns
+        -------
+        rates : numpy.ndarray
+            Rates of change of the state.
+        """
+
+        # update count
+        self.num_rates_evals += 1
+
+        # compiled rates
+        if self.rates_compiled is not None:
+            return self.rates_compiled(t, y)
+
+        # extract frequently used variables
+        dim_modes = 2 * self.num_modes
+        modes = np.ascontiguousarray(y[:dim_modes]).view(np.complex_)
+
+        # rates of the classical modes
+        mode_rates = self.system.get_mode_rates(modes, self.c, t)
+
+        # rates of the quadrature correlations
+        A = self.system.get_A(modes, self.c, t)
+        if self.params['corrs_packed']:
+            corrs_packed = y[dim_modes:]
+            D = self.system.get_D(modes, corrs_packed[self.idxs_packed], self.c, t)
+            corr_rates = np.bincount(self.terms_p, weights=np.ravel(A)[self.terms_A] * corrs_packed[self.terms_V], minlength=len(corrs_packed)) + D[self.idxs_triu]
+        else:
+            corrs = y[dim_modes:].reshape(self.dim_corrs)
+            AV = np.matmul(A, corrs)
+            corr_rates = np.ravel(AV + np.transpose(AV) + self.system.get_D(modes, corrs, self.c, t))
+
+        return np.concatenate((np.asarray(mode_rates, dtype=np.complex_).view(np.float_), corr_rates))
+
+    def get_state_from_modes_corrs(self, modes, corrs):
+        """Method to form a state from classical modes and quadrature correlations.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Quadrature correlations.
+
+        Returns
+        -------
+        y : numpy.ndarray
+            State of the system.
+        """
+
+        return np.concatenate((np.asarray(modes, dtype=np.complex_).view(np.float_), np.asarray(corrs)[self.idxs_triu] if self.params['corrs_packed'] else np.ravel(corrs)))
+
+    def get_times(self):
+        """Method to obtain the times at which the values are returned.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times with shape ``(T, )``.
+        """
+
+        return self.T[self.params['t_index_min']:self.params['t_index_max']]
+
+    def iterate_states(self):
+        """Method to iterate over the states at the returned times.
+
+        Depending on ``'use_lyapunov'``, ``'hle_method'`` and ``'stop_on_convergence'``, the states are obtained from the steady state, from the periodic state, from the last converged period or by integrating from the initial values.
+        Only the current state is held in memory, except for a converged integration, where the states of one period are retained.
+
+        Returns
+        -------
+        states : iterator
+            Iterator over the states at the returned times.
+        """
+
+        # obtain states
+        states = None
+        if self.params['use_lyapunov'] and hasattr(self.system, 'is_time_independent') and self.system.is_time_independent():
+            states = self.solve_lyapunov()
+        if states is None and self.params['hle_method'] == 'floquet':
+            states = self.solve_floquet()
+        if states is None and self.params['stop_on_convergence']:
+            states = self.solve_converged()
+        if states is None:
+            states = self.iterate_window(self.T[0], self.get_state_from_modes_corrs(self.iv_modes, self.iv_corrs))
+
+        return states
+
+    def iterate_window(self, t_0, y_0):
+        """Method to integrate the state from an initial time over the returned times.
+
+        Parameters
+        ----------
+        t_0 : float
+            Initial time, not exceeding the first returned time.
+        y_0 : numpy.ndarray
+            State at the initial time.
+
+        Yields
+        ------
+        y : numpy.ndarray
+            State at each returned time.
+        """
+
+        # extract frequently used variables
+        T = self.get_times()
+
+        # initialize integrator
+        integrator = self.get_integrator(t_0, y_0)
+
+        # integrate between consecutive times
+        for i in range(len(T)):
+            if T[i] == t_0:
+                yield y_0
+                continue
+            y = integrator.integrate(T[i])
+            assert integrator.successful(), "Integration failed at time {}".format(T[i])
+
+            # update progress
+            if self.params['show_progress'] and (i + 1) % max(1, int(len(T) / 10)) == 0:
+                logger.info('Integrating ({:0.0f}%)'.format(100.0 * (i + 1) / len(T)))
+
+            yield y
+
+    def solve_lyapunov(self):
+        """Method to obtain the states at the returned times from the steady state of an unmodulated system.
+
+        Among the steady-state branches with a stable drift matrix, the one with the smallest mechanical displacement is selected.
+
+        Returns
+        -------
+        states : iterator
+            Iterator over the states at the returned times. If no stable steady state exists, ``None`` is returned.
+        """
+
+        # stable steady-state modes
+        Modes = [modes for modes in self.system.get_modes_steady_state(self.c) if np.max(np.real(np.linalg.eigvals(self.system.get_A(modes, self.c, None)))) < 0.0]
+        if len(Modes) == 0:
+            logger.warning('No stable steady state, falling back to the other methods')
+            return None
+        modes = min(Modes, key=lambda modes: abs(np.real(modes[1])))
+
+        # steady-state correlations
+        A = np.array(self.system.get_A(modes, self.c, None), dtype=np.float_)
+        D = np.array(self.system.get_D(modes, self.iv_corrs, self.c, None), dtype=np.float_)
+        self.y_periodic = self.get_state_from_modes_corrs(modes, get_lyapunov_steady_states(A, D))
+
+        return itertools.repeat(self.y_periodic, len(self.get_times()))
+
+    def set_packed_indices(self):
+        r"""Method to set the indices to integrate the upper-triangular elements of the correlations.
+
+        For each upper-triangular element :math:`(i, j)`, the rates :math:`\sum_{k} A_{ik} V_{kj} + \sum_{k} A_{jk} V_{ki}` are formed only from the structurally non-zero elements of the drift matrix.
+        """
+
+        # extract frequently used variables
+        dim = 2 * self.num_modes
+        mask = self.system.get_A_sparsity() if hasattr(self.system, 'get_A_sparsity') else np.ones(self.dim_corrs, dtype=np.bool_)
+
+        # indices of the upper-triangular elements
+        self.idxs_triu = np.triu_indices(dim)
+        self.idxs_packed = np.zeros(self.dim_corrs, dtype=np.int_)
+        self.idxs_packed[self.idxs_triu] = np.arange(len(self.idxs_triu[0]))
+        self.idxs_packed = np.maximum(self.idxs_packed, np.transpose(self.idxs_packed))
+
+        # terms of the rates
+        terms_p, terms_A, terms_V = list(), list(), list()
+        for p, (i, j) in enumerate(zip(*self.idxs_triu)):
+            for m, n in [(i, j), (j, i)]:
+                for k in np.flatnonzero(mask[m]):
+                    terms_p.append(p)
+                    terms_A.append(m * dim + k)
+                    terms_V.append(self.idxs_packed[k][n])
+        self.terms_p = np.array(terms_p, dtype=np.int_)
+        self.terms_A = np.array(terms_A, dtype=np.int_)
+        self.terms_V = np.array(terms_V, dtype=np.int_)
+
+    def solve(self):
+        """Method to obtain the classical modes and quadrature correlations at the returned times.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(T, num_modes)``.
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(T, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        # collect states
+        Ys = np.empty((len(self.get_times()), self.dim_state), dtype=np.float_)
+        for i, y in enumerate(self.iterate_states()):
+            Ys[i] = y
+
+        # split results
+        self.Modes = np.ascontiguousarray(Ys[:, :2 * self.num_modes]).view(np.complex_)
+        if self.params['corrs_packed']:
+            self.Corrs = Ys[:, 2 * self.num_modes:][:, self.idxs_packed]
+        else:
+            self.Corrs = Ys[:, 2 * self.num_modes:].reshape((len(Ys), ) + self.dim_corrs)
+
+        return self.Modes, self.Corrs
+
+    def solve_converged(self):
+        """Method to obtain the states at the returned times by integrating only until the dynamics becomes periodic.
+
+        The state is integrated period by period and compared with that of the previous period.
+        Once the changes in the modes and the mechanical position variance remain within ``'conv_tol'`` for two consecutive periods, the returned times are mapped into the next period, which is integrated once.
+        A warning is logged if the modulation period cannot be obtained or if two periods do not fit before the returned times, for example for the periods of the order of :math:`10^{4}` of closely-spaced frequencies.
+
+        Returns
+        -------
+        states : iterator
+            Iterator over the states at the returned times. If the modulation period cannot be obtained or is too long, ``None`` is returned.
+        """
+
+        # extract frequently used variables
+        dim_modes = 2 * self.num_modes
+        tol = self.params['conv_tol']
+        T = self.get_times()
+        T_mod = self.system.get_modulation_period() if hasattr(self.system, 'get_modulation_period') else None
+        if T_mod is None:
+            logger.warning('Modulation period unavailable, integrating without convergence checks')
+            return None
+        if 2.0 * T_mod > T[0] - self.T[0]:
+            logger.warning('Modulation period {:0.2f} too long for convergence checks before time {:0.2f}, integrating without convergence checks'.format(T_mod, T[0]))
+            return None
+
+        # integrate period by period
+        t = self.T[0]
+        y = self.get_state_from_modes_corrs(self.iv_modes, self.iv_corrs)
+        integrator = self.get_integrator(t, y)
+        count = 0
+        while t + T_mod <= T[0] and count < 2:
+            y_prev = y
+            t += T_mod
+            y = integrator.integrate(t)
+            assert integrator.successful(), "Integration failed at time {}".format(t)
+
+            # check changes in the modes and the mechanical position variance
+            v = self.get_modes_corrs_from_state(y)[1][2][2]
+            dx = np.linalg.norm(y[:dim_modes] - y_prev[:dim_modes])
+            dv = abs(v - self.get_modes_corrs_from_state(y_prev)[1][2][2])
+            if dx <= tol * max(1.0, np.linalg.norm(y[:dim_modes])) and dv <= tol * max(1.0, abs(v)):
+                count += 1
+            else:
+                count = 0
+
+        # continue integration over the returned times if not converged
+        self.y_periodic = y
+        if count < 2:
+            logger.info('Not converged before time {:0.2f}, integrating the returned times'.format(T[0]))
+            return self.iterate_window(t, y)
+
+        # integrate the returned times mapped into the next period
+        self.t_conv = t
+        Ts, idxs = np.unique(t + np.mod(T - t, T_mod), return_inverse=True)
+        integrator = self.get_integrator(t, y)
+        Ys = np.empty((len(Ts), len(y)), dtype=np.float_)
+        for i in range(len(Ts)):
+            Ys[i] = y if Ts[i] == t else integrator.integrate(Ts[i])
+            assert integrator.successful(), "Integration failed at time {}".format(Ts[i])
+
+        # update progress
+        if self.params['show_progress']:
+            logger.info('Converged at time {:0.2f}, skipping {:0.1f}% of the integration'.format(t, 100.0 * (1.0 - (t + T_mod - self.T[0]) / (T[-1] - self.T[0]))))
+
+        return (Ys[idx] for idx in idxs)
+
+    def solve_floquet(self):
+        """Method to obtain the states at the returned times from the asymptotic periodic state.
+
+        The periodic modes are obtained by Newton iterations on the one-period map, whose Jacobian is the monodromy matrix.
+        The periodic correlations :math:`V_{p}` then solve the discrete Lyapunov equation :math:`V_{p} = M V_{p} M^{T} + Q`, where :math:`M` is the monodromy matrix and :math:`Q` are the correlations accumulated over one period from zero.
+
+        Returns
+        -------
+        states : iterator
+            Iterator over the states at the returned times. If the modulation period cannot be obtained or the periodic state is unstable, ``None`` is returned.
+        """
+
+        # extract frequently used variables
+        dim_modes = 2 * self.num_modes
+        T_mod = self.system.get_modulation_period() if hasattr(self.system, 'get_modulation_period') else None
+        if T_mod is None or T_mod > self.params['floquet_max_period']:
+            logger.warning('Modulation period {} unavailable or too long, falling back to integration'.format(T_mod))
+            return None
+
+        # function to integrate over one period from zero phase
+        def get_one_period(x):
+            y_0 = np.concatenate((x, np.ravel(self.I), np.zeros(dim_modes**2, dtype=np.float_)))
+            sol = si.solve_ivp(self.get_floquet_rates, (0.0, T_mod), y_0, method='DOP853', rtol=min(self.params['ode_rtol'], 1e-8), atol=self.params['ode_atol'])
+            assert sol.success, "Integration failed over one period"
+            y_T = sol.y[:, -1]
+            return y_T[:dim_modes], y_T[dim_modes:dim_modes + dim_modes**2].reshape(self.dim_corrs), y_T[dim_modes + dim_modes**2:].reshape(self.dim_corrs)
+
+        # shooting method for the modes
+        x = np.asarray(self.iv_modes, dtype=np.complex_).view(np.float_).copy()
+        for _ in range(self.params['floquet_max_iter']):
+            x_T, M, _ = get_one_period(x)
+            try:
+                dx = np.linalg.solve(M - self.I, x - x_T)
+            except np.linalg.LinAlgError:
+                logger.warning('Singular monodromy matrix, falling back to integration')
+                return None
+            x = x + dx
+            if np.linalg.norm(dx) <= self.params['floquet_tol'] * max(1.0, np.linalg.norm(x)):
+                break
+        else:
+            logger.warning('Shooting method did not converge, falling back to integration')
+            return None
+
+        # monodromy matrix and correlations at the periodic modes
+        _, M, Q = get_one_period(x)
+        self.multipliers = np.linalg.eigvals(M)
+        if np.max(np.abs(self.multipliers)) >= 1.0:
+            logger.warning('Unstable periodic state, falling back to integration')
+            return None
+        V = sl.solve_discrete_lyapunov(M, Q)
+        V = 0.5 * (V + np.transpose(V))
+        self.y_periodic = self.get_state_from_modes_corrs(x.view(np.complex_), V)
+
+        # integrate over the returned times from the last period
+        t_0 = T_mod * np.floor(self.get_times()[0] / T_mod)
+
+        return self.iterate_window(t_0, self.y_periodic)
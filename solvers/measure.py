@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing vectorized measures of the quadrature correlations."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-16"
+__updated__ = "2026-10-17"
+
+# dependencies
+import itertools
+import numpy as np
+
+def get_log_negativities(Corrs, indices=(0, 2)):
+    r"""Function to obtain the logarithmic negativities of a bipartition for stacks of quadrature correlations.
+
+    For two single modes, the smallest symplectic eigenvalue of the partially-transposed two-mode correlation matrix is obtained in closed form as :math:`\eta^{-} = 2^{-1/2} \left[ \Sigma - \left( \Sigma^{2} - 4 \det V \right)^{1/2} \right]^{1/2}`, where :math:`\Sigma = \det A + \det B - 2 \det C`, and the logarithmic negativity is :math:`E_{N} = \max \left[ 0, - \ln (2 \eta^{-}) \right]`.
+    For groups of modes, the symplectic eigenvalues :math:`\nu_{k}` of the partially-transposed correlation matrix are obtained from the eigenvalues of :math:`i \Omega \tilde{V}` for the entire stack at once and :math:`E_{N} = \sum_{k} \max \left[ 0, - \ln (2 \nu_{k}) \right]`.
+
+    Parameters
+    ----------
+    Corrs : numpy.ndarray
+        Quadrature correlations with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    indices : tuple, optional
+        Indices of the two parts, each either the index of a single mode or a tuple of indices of modes, for example ``(0, (1, 2))``. Default is ``(0, 2)``.
+
+    Returns
+    -------
+    E_N : numpy.ndarray
+        Logarithmic negativities with shape ``(...)``.
+    """
+
+    # extract frequently used variables
+    modes_A, modes_B = [tuple(int(index) for index in np.atleast_1d(part)) for part in indices]
+    idxs = [j for mode in modes_A + modes_B for j in (2 * mode, 2 * mode + 1)]
+    V = np.asarray(Corrs)[..., idxs, :][..., idxs]
+
+    # groups of modes
+    if len(modes_A) > 1 or len(modes_B) > 1:
+        # partial transposition of the second part
+        signs = np.ones(len(idxs), dtype=np.float_)
+        signs[2 * len(modes_A) + 1::2] = - 1.0
+        V_PT = V * signs[:, None] * signs[None, :]
+
+        # symplectic eigenvalues, each appearing twice
+        Omega = np.kron(np.eye(len(idxs) // 2), np.array([[0.0, 1.0], [- 1.0, 0.0]]))
+        nus = np.abs(np.linalg.eigvals(1.0j * np.matmul(Omega, V_PT)))
+
+        return np.sum(np.maximum(0.0, - np.log(2.0 * nus)), axis=-1) / 2.0
+
+    # invariants
+    det_A = V[..., 0, 0] * V[..., 1, 1] - V[..., 0, 1] * V[..., 1, 0]
+    det_B = V[..., 2, 2] * V[..., 3, 3] - V[..., 2, 3] * V[..., 3, 2]
+    det_C = V[..., 0, 2] * V[..., 1, 3] - V[..., 0, 3] * V[..., 1, 2]
+    det_V = np.linalg.det(V)
+    sigma = det_A + det_B - 2.0 * det_C
+
+    # smallest symplectic eigenvalue
+    eta_minus = np.sqrt(np.maximum(sigma - np.sqrt(np.maximum(sigma**2 - 4.0 * det_V, 0.0)), 0.0) / 2.0)
+
+    return np.maximum(0.0, - np.log(2.0 * eta_minus))
+
+def get_quadrature_variances(Corrs, modes=None, thetas=None):
+    r"""Function to obtain the variances of the quadratures of the modes for stacks of quadrature correlations.
+
+    The variance of the rotated quadrature :math:`X_{\theta} = Q \cos \theta + P \sin \theta` is :math:`\langle X_{\theta}^{2} \rangle = \langle Q^{2} \rangle \cos^{2} \theta + \langle P^{2} \rangle \sin^{2} \theta + \langle Q P + P Q \rangle \sin \theta \cos \theta`.
+
+    Parameters
+    ----------
+    Corrs : numpy.ndarray
+        Quadrature correlations with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    modes : list, optional
+        Indices of the modes. If ``None``, all modes are considered. Default is ``None``.
+    thetas : numpy.ndarray, optional
+        Angles of the rotated quadratures. If ``None``, the variances of the position and momentum quadratures are returned. Default is ``None``.
+
+    Returns
+    -------
+    Vars : numpy.ndarray
+        Variances with shape ``(..., len(modes), 2)`` if ``thetas`` is ``None``, else ``(..., len(modes), len(thetas))``.
+    """
+
+    # extract frequently used variables
+    Corrs = np.asarray(Corrs)
+    modes = np.arange(Corrs.shape[-1] // 2) if modes is None else np.asarray(modes)
+    V_qq = Corrs[..., 2 * modes, 2 * modes]
+    V_pp = Corrs[..., 2 * modes + 1, 2 * modes + 1]
+
+    # position and momentum quadratures
+    if thetas is None:
+        return np.stack([V_qq, V_pp], axis=-1)
+
+    # rotated quadratures
+    V_qp = (Corrs[..., 2 * modes, 2 * modes + 1] + Corrs[..., 2 * modes + 1, 2 * modes]) / 2.0
+    thetas = np.asarray(thetas, dtype=np.float_)
+
+    return V_qq[..., None] * np.cos(thetas)**2 + V_pp[..., None] * np.sin(thetas)**2 + 2.0 * V_qp[..., None] * np.sin(thetas) * np.cos(thetas)
+
+def get_rotated_variance_extrema(Corrs, modes=None):
+    r"""Function to obtain the extrema of the variances of the rotated quadratures of the modes for stacks of quadrature correlations.
+
+    The extrema over all angles are the eigenvalues of the single-mode correlation matrix, :math:`\left( \langle Q^{2} \rangle + \langle P^{2} \rangle \right) / 2 \mp \left[ \left( \langle Q^{2} \rangle - \langle P^{2} \rangle \right)^{2} / 4 + \langle Q P + P Q \rangle^{2} / 4 \right]^{1/2}`.
+
+    Parameters
+    ----------
+    Corrs : numpy.ndarray
+        Quadrature correlations with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    modes : list, optional
+        Indices of the modes. If ``None``, all modes are considered. Default is ``None``.
+
+    Returns
+    -------
+    Vars_min : numpy.ndarray
+        Minimum variances with shape ``(..., len(modes))``.
+    Vars_max : numpy.ndarray
+        Maximum variances with shape ``(..., len(modes))``.
+    thetas_min : numpy.ndarray
+        Angles of the quadratures with the minimum variances with shape ``(..., len(modes))``.
+    """
+
+    # extract frequently used variables
+    Corrs = np.asarray(Corrs)
+    modes = np.arange(Corrs.shape[-1] // 2) if modes is None else np.asarray(modes)
+    V_qq = Corrs[..., 2 * modes, 2 * modes]
+    V_pp = Corrs[..., 2 * modes + 1, 2 * modes + 1]
+    V_qp = (Corrs[..., 2 * modes, 2 * modes + 1] + Corrs[..., 2 * modes + 1, 2 * modes]) / 2.0
+
+    # eigenvalues of the single-mode correlation matrices
+    mean = (V_qq + V_pp) / 2.0
+    radius = np.sqrt(((V_qq - V_pp) / 2.0)**2 + V_qp**2)
+
+    return mean - radius, mean + radius, np.arctan2(2.0 * V_qp, V_qq - V_pp) / 2.0 + np.pi / 2.0
+
+def get_measure_bundle_keys(num_modes=3, pairs=None, cuts=None):
+    """Function to obtain the keys of the measures in a bundle.
+
+    Parameters
+    ----------
+    num_modes : int, optional
+        Number of modes. Default is ``3``.
+    pairs : list, optional
+        Pairs of modes for the logarithmic negativities. If ``None``, all pairs are considered. Default is ``None``.
+    cuts : list, optional
+        Single modes separated from the remaining modes for the logarithmic negativities. If ``None``, all modes are considered for more than two modes. Default is ``None``.
+
+    Returns
+    -------
+    keys : list
+        Keys of the measures in the order of the bundle.
+    """
+
+    # extract frequently used variables
+    pairs = list(itertools.combinations(range(num_modes), 2)) if pairs is None else pairs
+    cuts = (list(range(num_modes)) if num_modes > 2 else list()) if cuts is None else cuts
+
+    # entanglement
+    keys = ['E_N_{}_{}'.format(*pair) for pair in pairs]
+    keys += ['E_N_{}_{}'.format(cut, ''.join(str(mode) for mode in range(num_modes) if mode != cut)) for cut in cuts]
+    if len(cuts) > 0:
+        keys += ['E_N_cut_min', 'fully_inseparable']
+
+    # squeezing
+    for key in ['V_q', 'V_p', 'V_min', 'V_max']:
+        keys += [key + '_' + str(mode) for mode in range(num_modes)]
+
+    return keys
+
+def get_measure_bundle(Corrs, pairs=None, cuts=None):
+    r"""Function to obtain a bundle of entanglement and squeezing measures for stacks of quadrature correlations.
+
+    The bundle contains the logarithmic negativities of the pairs of modes and of each single mode against the remaining modes, the smallest of the latter and an indicator of full inseparability, which is ``1.0`` when all these bipartitions are entangled, along with the variances of the position and momentum quadratures and the extrema of the variances of the rotated quadratures of each mode.
+
+    Parameters
+    ----------
+    Corrs : numpy.ndarray
+        Quadrature correlations with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    pairs : list, optional
+        Pairs of modes for the logarithmic negativities. If ``None``, all pairs are considered. Default is ``None``.
+    cuts : list, optional
+        Single modes separated from the remaining modes for the logarithmic negativities. If ``None``, all modes are considered for more than two modes. Default is ``None``.
+
+    Returns
+    -------
+    bundle : dict
+        Measures with shape ``(...)`` for each key of :func:`get_measure_bundle_keys`.
+    """
+
+    # extract frequently used variables
+    Corrs = np.asarray(Corrs)
+    num_modes = Corrs.shape[-1] // 2
+    pairs = list(itertools.combinations(range(num_modes), 2)) if pairs is None else pairs
+    cuts = (list(range(num_modes)) if num_modes > 2 else list()) if cuts is None else cuts
+
+    # entanglement
+    measures = [get_log_negativities(Corrs, pair) for pair in pairs]
+    E_N_cuts = [get_log_negativities(Corrs, (cut, tuple(mode for mode in range(num_modes) if mode != cut))) for cut in cuts]
+    measures += E_N_cuts
+    if len(cuts) > 0:
+        E_N_cut_min = np.min(E_N_cuts, axis=0)
+        measures += [E_N_cut_min, (E_N_cut_min > 0.0).astype(np.float_)]
+
+    # squeezing
+    Vars = get_quadrature_variances(Corrs)
+    Vars_min, Vars_max, _ = get_rotated_variance_extrema(Corrs)
+    for Vs in [Vars[..., 0], Vars[..., 1], Vars_min, Vars_max]:
+        measures += [Vs[..., mode] for mode in range(num_modes)]
+
+    return dict(zip(get_measure_bundle_keys(num_modes, pairs, cuts), measures))
+
+def get_measure_bundle_reductions(bundle, axis=0):
+    """Function to reduce a bundle of measures to their extrema.
+
+    Parameters
+    ----------
+    bundle : dict
+        Measures for each key.
+    axis : int, optional
+        Axis of the times to reduce. Default is ``0``.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Minimum and maximum of each measure, in the order of :func:`get_measure_bundle_reduction_keys`.
+    """
+
+    return np.array([reduce(bundle[key], axis=axis) for key in bundle for reduce in (np.min, np.max)], dtype=np.float_)
+
+def get_measure_bundle_reduction_keys(num_modes=3, pairs=None, cuts=None):
+    """Function to obtain the keys of the reductions of a bundle of measures.
+
+    Parameters
+    ----------
+    num_modes : int, optional
+        Number of modes. Default is ``3``.
+    pairs : list, optional
+        Pairs of modes for the logarithmic negativities. If ``None``, all pairs are considered. Default is ``None``.
+    cuts : list, optional
+        Single modes separated from the remaining modes for the logarithmic negativities. If ``None``, all modes are considered for more than two modes. Default is ``None``.
+
+    Returns
+    -------
+    keys : list
+        Keys formatted as ``'<key>_min'`` and ``'<key>_max'`` for each measure.
+    """
+
+    return [key + suffix for key in get_measure_bundle_keys(num_modes, pairs, cuts) for suffix in ('_min', '_max')]
+
+def get_Wigner_distributions(Corrs, xs, ys, indices=(0, ), t_indices=None, Modes=None, dtype=np.float_):
+    r"""Function to obtain the Wigner distributions of single modes at selected times for stacks of quadrature correlations.
+
+    The Gaussian distributions are evaluated in closed form from their parameters using :func:`get_Wigner_grids`.
+
+    Parameters
+    ----------
+    Corrs : numpy.ndarray
+        Quadrature correlations with shape ``(T, 2 * num_modes, 2 * num_modes)``.
+    xs : numpy.ndarray
+        Values of the position quadrature.
+    ys : numpy.ndarray
+        Values of the momentum quadrature.
+    indices : tuple, optional
+        Indices of the modes. Default is ``(0, )``.
+    t_indices : list, optional
+        Indices of the times. If ``None``, all times are considered. Default is ``None``.
+    Modes : numpy.ndarray, optional
+        Classical modes with shape ``(T, num_modes)`` to displace the distributions by :math:`\left( \sqrt{2} \mathrm{Re} [\alpha], \sqrt{2} \mathrm{Im} [\alpha] \right)`. If ``None``, the distributions of the fluctuations are centered at the origin. Default is ``None``.
+    dtype : numpy.dtype, optional
+        Data type of the grids, for example ``numpy.float32`` to halve the memory. Default is ``numpy.float_``.
+
+    Returns
+    -------
+    Wigners : numpy.ndarray
+        Wigner distributions with shape ``(len(t_indices), len(indices), len(ys), len(xs))``.
+    """
+
+    # extract frequently used variables
+    t_indices = range(len(Corrs)) if t_indices is None else t_indices
+
+    # fill frames
+    Wigners = np.empty((len(t_indices), len(indices), len(ys), len(xs)), dtype=dtype)
+    for i, _Wigners in enumerate(iterate_Wigner_distributions(Corrs, xs, ys, indices, t_indices, Modes, dtype)):
+        Wigners[i] = _Wigners
+
+    return Wigners
+
+def iterate_Wigner_distributions(Corrs, xs, ys, indices=(0, ), t_indices=None, Modes=None, dtype=np.float_):
+    """Function to iterate over the Wigner distributions of single modes at selected times, for example to stream the frames of an animation.
+
+    Parameters
+    ----------
+    Corrs : numpy.ndarray
+        Quadrature correlations with shape ``(T, 2 * num_modes, 2 * num_modes)``.
+    xs : numpy.ndarray
+        Values of the position quadrature.
+    ys : numpy.ndarray
+        Values of the momentum quadrature.
+    indices : tuple, optional
+        Indices of the modes. Default is ``(0, )``.
+    t_indices : list, optional
+        Indices of the times. If ``None``, all times are considered. Default is ``None``.
+    Modes : numpy.ndarray, optional
+        Classical modes with shape ``(T, num_modes)`` to displace the distributions. If ``None``, the distributions are centered at the origin. Default is ``None``.
+    dtype : numpy.dtype, optional
+        Data type of the grids. Default is ``numpy.float_``.
+
+    Yields
+    ------
+    Wigners : numpy.ndarray
+        Wigner distributions at each time with shape ``(len(indices), len(ys), len(xs))``.
+    """
+
+    # extract frequently used variables
+    t_indices = range(len(Corrs)) if t_indices is None else t_indices
+
+    for i in t_indices:
+        # parameters of the Gaussian states
+        ellipses = get_Gaussian_ellipses(Corrs[i], Modes[i] if Modes is not None else None, indices)
+
+        yield get_Wigner_grids(ellipses['means'], ellipses['covs'], xs, ys, dtype)
+
+def get_Gaussian_ellipses(Corrs, Modes=None, indices=None, dtype=np.float_):
+    r"""Function to obtain the parameters of the Gaussian Wigner distributions of single modes for stacks of quadrature correlations.
+
+    Each distribution is described by its mean :math:`\left( \sqrt{2} \mathrm{Re} [\alpha], \sqrt{2} \mathrm{Im} [\alpha] \right)` and its single-mode correlation matrix :math:`V`, from which the semi-axes :math:`\sqrt{\lambda_{\mp}}` of the ellipse, the squeezing angle of the minor axis and the purity :math:`1 / (2 \sqrt{\det V})` are obtained.
+    The parameters of many snapshots can be stored and compared at a small fraction of the size of the grids, which are rendered on demand with :func:`get_Wigner_distributions_from_ellipses`.
+
+    Parameters
+    ----------
+    Corrs : numpy.ndarray
+        Quadrature correlations with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    Modes : numpy.ndarray, optional
+        Classical modes with shape ``(..., num_modes)``. If ``None``, the means of the fluctuations are zero. Default is ``None``.
+    indices : list, optional
+        Indices of the modes. If ``None``, all modes are considered. Default is ``None``.
+    dtype : numpy.dtype, optional
+        Data type of the parameters, for example ``numpy.float32`` to halve the memory. Default is ``numpy.float_``.
+
+    Returns
+    -------
+    ellipses : dict
+        Parameters of the distributions with the keys:
+            ==========  ====================================================
+            key         value
+            ==========  ====================================================
+            "means"     (*numpy.ndarray*) means with shape ``(..., len(indices), 2)``.
+            "covs"      (*numpy.ndarray*) symmetrized correlation matrices with shape ``(..., len(indices), 2, 2)``.
+            "axes"      (*numpy.ndarray*) minor and major semi-axes with shape ``(..., len(indices), 2)``.
+            "angles"    (*numpy.ndarray*) squeezing angles of the minor axes with shape ``(..., len(indices))``.
+            "purities"  (*numpy.ndarray*) purities with shape ``(..., len(indices))``.
+            ==========  ====================================================
+    """
+
+    # extract frequently used variables
+    Corrs = np.asarray(Corrs)
+    modes = np.arange(Corrs.shape[-1] // 2) if indices is None else np.asarray(indices)
+    V_qq = Corrs[..., 2 * modes, 2 * modes]
+    V_pp = Corrs[..., 2 * modes + 1, 2 * modes + 1]
+    V_qp = (Corrs[..., 2 * modes, 2 * modes + 1] + Corrs[..., 2 * modes + 1, 2 * modes]) / 2.0
+
+    # means
+    means = np.zeros(V_qq.shape + (2, ), dtype=dtype)
+    if Modes is not None:
+        alphas = np.asarray(Modes)[..., modes]
+        means[..., 0] = np.sqrt(2.0) * np.real(alphas)
+        means[..., 1] = np.sqrt(2.0) * np.imag(alphas)
+
+    # ellipses
+    Vars_min, Vars_max, thetas_min = get_rotated_variance_extrema(Corrs, modes)
+
+    return {
+        'means': means,
+        'covs': np.stack([np.stack([V_qq, V_qp], axis=-1), np.stack([V_qp, V_pp], axis=-1)], axis=-2).astype(dtype),
+        'axes': np.sqrt(np.stack([Vars_min, Vars_max], axis=-1)).astype(dtype),
+        'angles': thetas_min.astype(dtype),
+        'purities': (1.0 / (2.0 * np.sqrt(V_qq * V_pp - V_qp**2))).astype(dtype)
+    }
+
+def get_Wigner_distributions_from_ellipses(ellipses, xs, ys, t_indices=None, dtype=np.float_):
+    """Function to render the Wigner distributions of single modes at selected times from their parameters.
+
+    Parameters
+    ----------
+    ellipses : dict
+        Parameters of the distributions with leading axes of the times and the modes, obtained from :func:`get_Gaussian_ellipses`.
+    xs : numpy.ndarray
+        Values of the position quadrature.
+    ys : numpy.ndarray
+        Values of the momentum quadrature.
+    t_indices : list, optional
+        Indices of the times. If ``None``, all times are considered. Default is ``None``.
+    dtype : numpy.dtype, optional
+        Data type of the grids. Default is ``numpy.float_``.
+
+    Returns
+    -------
+    Wigners : numpy.ndarray
+        Wigner distributions with shape ``(len(t_indices), num_modes, len(ys), len(xs))``.
+    """
+
+    # extract frequently used variables
+    means = ellipses['means']
+    covs = ellipses['covs']
+    t_indices = range(len(covs)) if t_indices is None else t_indices
+
+    # fill frames
+    Wigners = np.empty((len(t_indices), covs.shape[1], len(ys), len(xs)), dtype=dtype)
+    for i, t_index in enumerate(t_indices):
+        Wigners[i] = get_Wigner_grids(means[t_index], covs[t_index], xs, ys, dtype)
+
+    return Wigners
+
+def get_Wigner_grids(means, covs, xs, ys, dtype=np.float_):
+    r"""Function to evaluate Gaussian Wigner distributions of single modes on a grid.
+
+    The Gaussian distribution :math:`W (q, p) = \exp \left[ - (a q^{2} + 2 b q p + c p^{2}) / 2 \right] / (2 \pi \sqrt{\det V})`, with :math:`a`, :math:`b` and :math:`c` the elements of :math:`V^{-1}`, is evaluated in the separable form :math:`e^{- a q^{2} / 2} e^{- c p^{2} / 2} e^{- b q p}`, so that only the cross term requires an exponential over the grid.
+
+    Parameters
+    ----------
+    means : numpy.ndarray
+        Means with shape ``(num_modes, 2)``.
+    covs : numpy.ndarray
+        Single-mode correlation matrices with shape ``(num_modes, 2, 2)``.
+    xs : numpy.ndarray
+        Values of the position quadrature.
+    ys : numpy.ndarray
+        Values of the momentum quadrature.
+    dtype : numpy.dtype, optional
+        Data type of the grids. Default is ``numpy.float_``.
+
+    Returns
+    -------
+    Wigners : numpy.ndarray
+        Wigner distributions with shape ``(num_modes, len(ys), len(xs))``.
+    """
+
+    # extract frequently used variables
+    means = np.asarray(means, dtype=np.float_)
+    covs = np.asarray(covs, dtype=np.float_)
+    xs = np.asarray(xs, dtype=np.float_)
+    ys = np.asarray(ys, dtype=np.float_)
+
+    # elements of the inverses
+    det_V = covs[:, 0, 0] * covs[:, 1, 1] - covs[:, 0, 1]**2
+    a, b, c = covs[:, 1, 1] / det_V, - covs[:, 0, 1] / det_V, covs[:, 0, 0] / det_V
+    norms = 1.0 / (2.0 * np.pi * np.sqrt(det_V))
+
+    # separable factors and the cross term
+    Wigners = np.empty((len(covs), len(ys), len(xs)), dtype=dtype)
+    for j in range(len(covs)):
+        dx = (xs - means[j, 0]).astype(dtype, copy=False)
+        dy = (ys - means[j, 1]).astype(dtype, copy=False)
+        np.exp(np.multiply.outer(dy, dx) * dtype(- b[j]), out=Wigners[j])
+        Wigners[j] *= (norms[j] * np.exp(- c[j] * dy**2 / 2.0)).astype(dtype)[:, None]
+        Wigners[j] *= np.exp(- a[j] * dx**2 / 2.0).astype(dtype)[None, :]
+
+    return Wigners
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing vectorized Routh-Hurwitz stability criteria."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-16"
+__updated__ = "2026-10-16"
+
+# dependencies
+import numpy as np
+
+def get_hurwitz_minors(coeffs):
+    r"""Function to obtain the leading principal minors of the Hurwitz matrices of sextic characteristic equations.
+
+    The minors :math:`T_{0}, T_{1}, ..., T_{6}` are evaluated in closed form from the coefficients :math:`a_{0}, a_{1}, ..., a_{6}` of :math:`\sum_{i = 0}^{6} a_{i} \lambda^{6 - i} = 0`, as derived in ``notebooks/oem_20_dynamical_stability.ipynb``.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Coefficients of the characteristic equations with shape ``(..., 7)``, in descending order of the powers.
+
+    Returns
+    -------
+    T : numpy.ndarray
+        Hurwitz minors with shape ``(..., 7)``.
+    """
+
+    # extract frequently used variables
+    a_0, a_1, a_2, a_3, a_4, a_5, a_6 = np.moveaxis(np.asarray(coeffs, dtype=np.float_), -1, 0)
+
+    # initialize minors
+    T = np.empty(np.shape(coeffs), dtype=np.float_)
+    # T_0
+    T[..., 0] = a_0
+    # T_1
+    T[..., 1] = a_1
+    # T_2
+    T[..., 2] = a_1 * a_2 - a_0 * a_3
+    # T_3
+    T[..., 3] = a_3 * T[..., 2] - a_1 * (a_1 * a_4 - a_0 * a_5)
+    # T_4
+    T[..., 4] = a_4 * T[..., 3] + a_0 * a_5 * (a_1 * a_4 + a_2 * a_3 - a_0 * a_5) + a_1 * a_6 * T[..., 2] - a_1 * a_2**2 * a_5
+    # T_5
+    T[..., 5] = a_5 * T[..., 4] + a_6 * (a_1**2 * (a_2 * a_5 + a_3 * a_4 - a_1 * a_6) - a_1 * a_3 * (a_2 * a_3 + 2.0 * a_0 * a_5) + a_0 * a_3**3)
+    # T_6
+    T[..., 6] = a_6 * T[..., 5]
+
+    return T
+
+def get_routh_hurwitz_stability(coeffs):
+    """Function to check the stability of sextic characteristic equations using the Routh-Hurwitz criterion.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Coefficients of the characteristic equations with shape ``(..., 7)``, in descending order of the powers.
+
+    Returns
+    -------
+    stable : numpy.ndarray
+        Boolean mask with shape ``(...)``, ``True`` when all roots have negative real parts.
+    margins : numpy.ndarray
+        Entries of the first column of the Routh array, :math:`T_{k} / T_{k - 1}` for :math:`k = 1, 2, ..., 6`, with shape ``(..., 6)``. All entries are positive for stable points and the smallest one measures the distance from the stability boundary.
+    """
+
+    # get minors
+    T = get_hurwitz_minors(coeffs)
+
+    # first column of the Routh array
+    with np.errstate(divide='ignore', invalid='ignore'):
+        margins = T[..., 1:] / T[..., :-1]
+
+    return np.all(T > 0.0, axis=-1), margins
+
+def get_stability_map(system_class, params_system, Delta_0s, A_l0s, A_v0s, t=None, chunk_size=10000):
+    """Function to obtain the steady states and their dynamical stability over a grid of detunings and drive amplitudes.
+
+    Parameters
+    ----------
+    system_class : class
+        Class of the system implementing the methods ``get_params_stacked``, ``get_modes_steady_state_batch`` and ``get_coeffs_A_batch``.
+    params_system : dict
+        Base parameters of the system.
+    Delta_0s : numpy.ndarray
+        Values of the laser detuning.
+    A_l0s : numpy.ndarray
+        Values of the constant laser amplitude.
+    A_v0s : numpy.ndarray
+        Values of the constant voltage amplitude.
+    t : float, optional
+        Time at which the drift matrices are calculated. Default is ``None``.
+    chunk_size : int, optional
+        Number of grid points processed at once. Default is ``10000``.
+
+    Returns
+    -------
+    Modes : numpy.ndarray
+        Steady state modes with shape ``(len(Delta_0s), len(A_l0s), len(A_v0s), num_branches, num_modes)``. Entries of missing branches are ``nan``.
+    mask : numpy.ndarray
+        Boolean mask with shape ``(len(Delta_0s), len(A_l0s), len(A_v0s), num_branches)`` marking the physical branches.
+    stable : numpy.ndarray
+        Boolean mask with the shape of ``mask`` marking the dynamically stable branches. The number of stable branches at each point is given by ``stable.sum(axis=-1)``.
+    margins : numpy.ndarray
+        Entries of the first column of the Routh array for each branch with the shape of ``mask`` and an additional axis of length ``6``.
+    """
+
+    # grid of points
+    shape = (len(Delta_0s), len(A_l0s), len(A_v0s))
+    Grid = [np.ravel(X) for X in np.meshgrid(Delta_0s, A_l0s, A_v0s, indexing='ij')]
+    N = Grid[0].shape[0]
+
+    # base parameters
+    Params_0 = system_class.get_params_stacked([params_system])
+
+    # initialize results
+    Modes = None
+    for i in range(0, N, chunk_size):
+        chunk = slice(i, i + chunk_size)
+        n = len(Grid[0][chunk])
+
+        # stacked parameters of the chunk
+        Params = {key: np.repeat(Params_0[key], n, axis=0) for key in Params_0}
+        Params['Delta_0'] = Grid[0][chunk].astype(np.float_)
+        Params['A_ls'] = Params['A_ls'].astype(np.float_)
+        Params['A_ls'][:, 0] = Grid[1][chunk]
+        Params['A_vs'] = Params['A_vs'].astype(np.float_)
+        Params['A_vs'][:, 0] = Grid[2][chunk]
+
+        # steady state branches
+        modes, branches = system_class.get_modes_steady_state_batch(Params)
+        num_branches, num_modes = modes.shape[1:]
+        if Modes is None:
+            Modes = np.empty((N, num_branches, num_modes), dtype=np.complex_)
+            mask = np.empty((N, num_branches), dtype=np.bool_)
+            stable = np.empty((N, num_branches), dtype=np.bool_)
+            margins = np.empty((N, num_branches, 2 * num_modes), dtype=np.float_)
+        Modes[chunk] = modes
+        mask[chunk] = branches
+
+        # stability of each branch
+        Params_branches = {key: np.repeat(Params[key], num_branches, axis=0) for key in Params}
+        coeffs = system_class.get_coeffs_A_batch(np.nan_to_num(modes.reshape((-1, num_modes))), Params_branches, t)
+        _stable, _margins = get_routh_hurwitz_stability(coeffs)
+        stable[chunk] = _stable.reshape((n, num_branches)) & branches
+        margins[chunk] = _margins.reshape((n, num_branches, 2 * num_modes))
+        margins[chunk][~ branches] = np.nan
+
+    return Modes.reshape(shape + Modes.shape[1:]), mask.reshape(shape + mask.shape[1:]), stable.reshape(shape + stable.shape[1:]), margins.reshape(shape + margins.shape[1:])
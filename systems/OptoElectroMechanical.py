@@ -6,14 +6,96 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2021-06-14"
-__updated__ = "2024-01-10"
+__updated__ = "2026-10-17"
 
 # dependencies
+from fractions import Fraction
+import math
 import numpy as np
+from typing import NamedTuple
+
+# optional dependencies
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # qom modules
 from qom.systems import BaseSystem
 
+# local modules
+from utils.codegen import get_kernel
+
+class OEM_20Params(NamedTuple):
+    r"""Class containing the frozen parameters of :class:`OEM_20` along with frequently used derived constants.
+
+    Being an immutable tuple, it is hashable, can be used as a cache key and is pickled cheaply for worker processes.
+    The fields ``A_ls``, ``A_vs``, ``Delta_0``, ``gammas``, ``gs``, ``n_ths``, ``Omegas``, ``omega_c0``, ``theta``, ``t_mod`` and ``t_pos`` follow the system parameters with lists converted to tuples. The derived constants are:
+    ============    ====================================================
+    key             meaning
+    ============    ====================================================
+    g_1             (*float*) signed electromechanical coupling, :math:`g_{1} = \pm g_{bc}`, negative for ``t_pos='bottom'``.
+    omega_b0        (*float*) unmodulated mechanical frequency, :math:`\sqrt{1 + \theta}`.
+    Omega_c0_2      (*float*) squared LC circuit frequency with damping, :math:`\gamma_{c}^{2} + \omega_{c0}^{2}`.
+    D_diag          (*tuple*) diagonal of the noise matrix.
+    ============    ====================================================
+    """
+
+    A_ls: tuple
+    A_vs: tuple
+    Delta_0: float
+    gammas: tuple
+    gs: tuple
+    n_ths: tuple
+    Omegas: tuple
+    omega_c0: float
+    theta: float
+    t_mod: str
+    t_pos: str
+    g_1: float
+    omega_b0: float
+    Omega_c0_2: float
+    D_diag: tuple
+
+    @classmethod
+    def from_params(cls, params):
+        """Method to freeze the parameters of a system.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the system, formatted as in the constructor of :class:`OEM_20`.
+
+        Returns
+        -------
+        params_frozen : :class:`OEM_20Params`
+            Frozen parameters.
+        """
+
+        # extract frequently used variables
+        gamma_a, gamma_b, gamma_c = (float(gamma) for gamma in params['gammas'])
+        _, g_bc = params['gs']
+        n_th_b, n_th_c = (float(n_th) for n_th in params['n_ths'])
+        omega_c0 = float(params['omega_c0'])
+
+        return cls(
+            A_ls=tuple(float(A_l) for A_l in params['A_ls']),
+            A_vs=tuple(float(A_v) for A_v in params['A_vs']),
+            Delta_0=float(params['Delta_0']),
+            gammas=(gamma_a, gamma_b, gamma_c),
+            gs=tuple(float(g) for g in params['gs']),
+            n_ths=(n_th_b, n_th_c),
+            Omegas=tuple(float(Omega) for Omega in params['Omegas']),
+            omega_c0=omega_c0,
+            theta=float(params['theta']),
+            t_mod=params['t_mod'],
+            t_pos=params['t_pos'],
+            g_1=- float(g_bc) if params['t_pos'] == 'bottom' else float(g_bc),
+            omega_b0=math.sqrt(1.0 + float(params['theta'])),
+            Omega_c0_2=gamma_c**2 + omega_c0**2,
+            D_diag=(gamma_a, gamma_a, gamma_b * (2.0 * n_th_b + 1.0), gamma_b * (2.0 * n_th_b + 1.0), gamma_c * (2.0 * n_th_c + 1.0), gamma_c * (2.0 * n_th_c + 1.0))
+        )
+
 class OEM_20(BaseSystem):
     r"""Class to simulate an OEM system with multiple modulations in laser amplitude, voltage amplitude and mechanical spring constant.
 
@@ -71,6 +153,14 @@ class OEM_20(BaseSystem):
         assert self.params['t_mod'] in ['cos', 'sin'], "Parameter ``'t_mod'`` can only assume the values ``'cos'`` and ``'sin'``"
         assert self.params['t_pos'] in ['top', 'bottom'], "Parameter ``'t_pos'`` can only assume the values ``'top'`` and ``'bottom'``"
 
+        # frozen parameters
+        self.params_frozen = OEM_20Params.from_params(self.params)
+        self.params_stacked = self.get_params_stacked([self.params])
+        self.params_struct = self.get_params_struct()
+
+        # tabulated modulations
+        self.modulation_schedule = None
+
     def get_A(self, modes, c, t):
         """Method to obtain the drift matrix.
 
@@ -90,15 +180,15 @@ class OEM_20(BaseSystem):
         """
 
         # extract frequently used variables
-        gamma_a, gamma_b, gamma_c = self.params['gammas']
-        g_ab, g_bc = self.params['gs']
-        _, _, Omega_s = self.params['Omegas']
+        p = self.params_frozen
+        gamma_a, gamma_b, gamma_c = p.gammas
+        g_ab, _ = p.gs
+        g_1 = p.g_1
         alpha, beta, chi = modes
 
         # effective values
-        Delta = self.params['Delta_0'] - 2.0 * g_ab * np.real(beta)
+        Delta = p.Delta_0 - 2.0 * g_ab * np.real(beta)
         G_alpha = g_ab * alpha
-        g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
         G_beta = 2.0 * g_1 * np.real(beta)
         G_chi = 2.0 * g_1 * np.real(chi)
         
@@ -106,7 +196,7 @@ class OEM_20(BaseSystem):
         t = 0.0 if t is None else t
 
         # update modulations
-        omega_b = np.sqrt(1.0 + self.params['theta'] * getattr(np, self.params['t_mod'])(Omega_s * t))
+        _, _, omega_b = self.get_modulations(t)
 
         # optical position quadrature
         self.A[0][0] = - gamma_a 
@@ -127,14 +217,161 @@ class OEM_20(BaseSystem):
         self.A[3][4] = 4.0 * G_chi
         # LC charge quadrature
         self.A[4][4] = - gamma_c
-        self.A[4][5] = self.params['omega_c0']
+        self.A[4][5] = p.omega_c0
         # LC flux quadrature
         self.A[5][2] = 4.0 * G_chi
-        self.A[5][4] = - self.params['omega_c0'] + 4.0 * G_beta
+        self.A[5][4] = - p.omega_c0 + 4.0 * G_beta
         self.A[5][5] = - gamma_c
 
         return self.A
 
+    def get_A_gradients(self, modes, c, t):
+        r"""Method to obtain the derivatives of the drift matrix with respect to the real and imaginary parts of the modes.
+
+        The drift matrix is linear in the modes and hence the derivatives are independent of ``modes`` and ``t``.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        dA : numpy.ndarray
+            Derivatives of the drift matrix with shape ``(6, 6, 6)``, where the first index follows the order :math:`\left[ \mathrm{Re} (\alpha), \mathrm{Im} (\alpha), \mathrm{Re} (\beta), \mathrm{Im} (\beta), \mathrm{Re} (\chi), \mathrm{Im} (\chi) \right]`.
+        """
+
+        # extract frequently used variables
+        g_ab, _ = self.params_frozen.gs
+        g_1 = self.params_frozen.g_1
+
+        # initialize derivatives
+        dA = np.zeros((2 * self.num_modes, ) + self.dim_corrs, dtype=np.float_)
+        # real part of optical mode
+        dA[0][1][2] = 2.0 * g_ab
+        dA[0][3][0] = 2.0 * g_ab
+        # imaginary part of optical mode
+        dA[1][0][2] = - 2.0 * g_ab
+        dA[1][3][1] = 2.0 * g_ab
+        # real part of mechanical mode
+        dA[2][0][1] = - 2.0 * g_ab
+        dA[2][1][0] = 2.0 * g_ab
+        dA[2][5][4] = 8.0 * g_1
+        # real part of LC mode
+        dA[4][3][4] = 8.0 * g_1
+        dA[4][5][2] = 8.0 * g_1
+
+        return dA
+
+    def get_A_sparsity(self):
+        """Method to obtain the structurally non-zero elements of the drift matrix.
+
+        Returns
+        -------
+        mask : numpy.ndarray
+            Boolean mask of the structurally non-zero elements.
+        """
+
+        # initialize mask
+        mask = np.zeros(self.dim_corrs, dtype=np.bool_)
+        # optical quadratures
+        mask[0][[0, 1, 2]] = True
+        mask[1][[0, 1, 2]] = True
+        # mechanical quadratures
+        mask[2][[2, 3]] = True
+        mask[3][[0, 1, 2, 3, 4]] = True
+        # LC quadratures
+        mask[4][[4, 5]] = True
+        mask[5][[2, 4, 5]] = True
+
+        return mask
+
+    @classmethod
+    def get_A_batch(cls, Modes, Params, t):
+        """Method to obtain the drift matrices for a stack of parameter points.
+
+        Parameters
+        ----------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(N, 3)``.
+        Params : dict
+            Stacked parameters returned by :meth:`get_params_stacked`.
+        t : float or numpy.ndarray
+            Time at which the values are calculated, either common to all points or with shape ``(N, )``.
+
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrices with shape ``(N, 6, 6)``.
+        """
+
+        # extract frequently used variables
+        gamma_a, gamma_b, gamma_c = np.transpose(Params['gammas'])
+        g_ab = Params['gs'][:, 0]
+        g_1 = Params['g_1']
+        omega_c0 = Params['omega_c0']
+        alpha, beta, chi = np.transpose(Modes)
+
+        # effective values
+        Delta = Params['Delta_0'] - 2.0 * g_ab * np.real(beta)
+        G_alpha = g_ab * alpha
+        G_beta = 2.0 * g_1 * np.real(beta)
+        G_chi = 2.0 * g_1 * np.real(chi)
+
+        # update modulations
+        _, _, omega_b = cls.get_modulations_batch(Params, t)
+
+        # initialize drift matrices
+        A = np.zeros((len(Modes), 2 * 3, 2 * 3), dtype=np.float_)
+        # optical position quadrature
+        A[:, 0, 0] = - gamma_a
+        A[:, 0, 1] = Delta
+        A[:, 0, 2] = - 2.0 * np.imag(G_alpha)
+        # optical momentum quadrature
+        A[:, 1, 0] = - Delta
+        A[:, 1, 1] = - gamma_a
+        A[:, 1, 2] = 2.0 * np.real(G_alpha)
+        # mechanical position quadrature
+        A[:, 2, 2] = - gamma_b
+        A[:, 2, 3] = omega_b
+        # mechanical momentum quadrature
+        A[:, 3, 0] = 2.0 * np.real(G_alpha)
+        A[:, 3, 1] = 2.0 * np.imag(G_alpha)
+        A[:, 3, 2] = - omega_b
+        A[:, 3, 3] = - gamma_b
+        A[:, 3, 4] = 4.0 * G_chi
+        # LC charge quadrature
+        A[:, 4, 4] = - gamma_c
+        A[:, 4, 5] = omega_c0
+        # LC flux quadrature
+        A[:, 5, 2] = 4.0 * G_chi
+        A[:, 5, 4] = - omega_c0 + 4.0 * G_beta
+        A[:, 5, 5] = - gamma_c
+
+        return A
+
+    def get_A_compiled(self, modes, t):
+        """Method to obtain the drift matrix using the compiled backend.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrix.
+        """
+
+        return get_A_nb(self.params_struct, np.asarray(modes, dtype=np.complex_), 0.0 if t is None else t, np.zeros(self.dim_corrs, dtype=np.float_))
+
     def get_coeffs_A(self, modes, c, t):
         """Method to obtain the coefficients of the characteristic equation of the drift matrix.
 
@@ -149,55 +386,49 @@ class OEM_20(BaseSystem):
 
         Returns
         -------
-        coeffs : int
+        coeffs : numpy.ndarray
             Coefficients of the characteristic equation of the drift matrix.
         """
 
+        return self.get_coeffs_A_batch(np.array([modes]), self.params_stacked, t)[0]
+    
+    @classmethod
+    def get_coeffs_A_batch(cls, Modes, Params, t):
+        """Method to obtain the coefficients of the characteristic equations of the drift matrices for a stack of parameter points.
+
+        Parameters
+        ----------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(N, 3)``.
+        Params : dict
+            Stacked parameters returned by :meth:`get_params_stacked`.
+        t : float or numpy.ndarray
+            Time at which the values are calculated, either common to all points or with shape ``(N, )``.
+
+        Returns
+        -------
+        coeffs : numpy.ndarray
+            Coefficients of the characteristic equations with shape ``(N, 7)``, in descending order of the powers.
+        """
+
         # extract frequently used variables
-        gamma_a, gamma_b, gamma_c = self.params['gammas']
-        g_ab, g_bc = self.params['gs']
-        _, _, Omega_s = self.params['Omegas']
-        omega_c0 = self.params['omega_c0']
-        alpha, beta, chi = modes
+        gamma_a, gamma_b, gamma_c = np.transpose(Params['gammas'])
+        g_ab = Params['gs'][:, 0]
+        g_1 = Params['g_1']
+        omega_c0 = Params['omega_c0']
+        alpha, beta, chi = np.transpose(Modes)
 
         # effective values
-        Delta = self.params['Delta_0'] - 2.0 * g_ab * np.real(beta)
+        Delta = Params['Delta_0'] - 2.0 * g_ab * np.real(beta)
         G_alpha = g_ab * alpha
-        g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
         G_beta = 2.0 * g_1 * np.real(beta)
         G_chi = 2.0 * g_1 * np.real(chi)
 
-        # handle fixed point 
-        t = 0.0 if t is None else t
-
         # update modulations
-        omega_b = np.sqrt(1.0 + self.params['theta'] * getattr(np, self.params['t_mod'])(Omega_s * t))
-
-        # substituted parameters
-        D_2 = Delta**2 + gamma_a**2
-        G_2 = np.real(np.conjugate(G_alpha) * G_alpha)
-        Omega_b_2 = gamma_b**2 + omega_b**2
-        Omega_c_2 = gamma_c**2 + omega_c0 * (omega_c0 - 4.0 * G_beta)
-
-        # coefficients
-        coeffs = np.array(2 * self.num_modes + 1, dtype=np.float_)
-        # a_0
-        coeffs[0] = 1.0
-        # a_1 
-        coeffs[1] = 2.0 * (gamma_a + gamma_b + gamma_c)
-        # a_2
-        coeffs[2] = D_2**2 + Omega_b_2**2 + Omega_c_2**2 + 4.0 * (gamma_b * gamma_c + gamma_b * gamma_a + gamma_c * gamma_a)
-        # a_3
-        coeffs[3] = 2.0 * (gamma_b + gamma_c) * D_2**2 + 2.0 * (Omega_b_2**2 * gamma_c + Omega_c_2**2 * gamma_b) + 2.0 * gamma_a * (Omega_b_2**2 + Omega_c_2**2) + 8.0 * gamma_b * gamma_c * gamma_a
-        # a_4
-        coeffs[4] = (Omega_b_2**2 + Omega_c_2**2 + 4.0 * gamma_b * gamma_c) * D_2**2 + 4.0 * (Omega_b_2**2 * gamma_c + Omega_c_2**2 * gamma_b) * gamma_a + Omega_b_2**2 * Omega_c_2**2 - 4.0 * G_2**2 * Delta * omega_b - 16.0 * G_chi**2 * omega_b * omega_c0
-        # a_5
-        coeffs[5] = 2.0 * (Omega_b_2**2 * gamma_c + Omega_c_2**2 * gamma_b) * D_2**2 + 2.0 * Omega_b_2**2 * Omega_c_2**2 * gamma_a - 8.0 * G_2**2 * Delta * gamma_c * omega_b - 32.0 * G_chi**2 * gamma_a * omega_b * omega_c0
-        # a_6
-        coeffs[6] = Omega_b_2**2 * Omega_c_2**2 * D_2**2 - 4.0 * G_2**2 * Omega_c_2**2 * Delta * omega_b - 16.0 * G_chi**2 * D_2**2 * omega_b * omega_c0
-
-        return coeffs
-    
+        _, _, omega_b = cls.get_modulations_batch(Params, t)
+
+        return get_kernel(cls.get_expressions_coeffs_A)(gamma_a, gamma_b, gamma_c, Delta, np.real(G_alpha), np.imag(G_alpha), G_beta, G_chi, omega_b, omega_c0)
+
     def get_coeffs_beta_sum(self, c):
         """Method to obtain coefficients of the polynomial in the sum of mechanical modes.
         
@@ -212,28 +443,36 @@ class OEM_20(BaseSystem):
             Coefficients of the polynomial in the sum of mechanical modes.
         """
 
+        return self.get_coeffs_beta_sum_batch(self.params_stacked)[0]
+
+    @classmethod
+    def get_coeffs_beta_sum_batch(cls, Params):
+        """Method to obtain coefficients of the polynomials in the sum of mechanical modes for a stack of parameter points.
+
+        Parameters
+        ----------
+        Params : dict
+            Stacked parameters returned by :meth:`get_params_stacked`.
+
+        Returns
+        -------
+        coeffs : numpy.ndarray
+            Coefficients of the polynomials with shape ``(N, 6)``, in descending order of the powers.
+        """
+
         # extract frequently used variables
-        A_l0, _, _ = self.params['A_ls']
-        A_v0, _, _ = self.params['A_vs']
-        Delta_0 = self.params['Delta_0']
-        gamma_a, gamma_b, gamma_c = self.params['gammas']
-        g_ab, g_bc = self.params['gs']
-        omega_c0 = self.params['omega_c0']
+        A_l0 = Params['A_ls'][:, 0]
+        A_v0 = Params['A_vs'][:, 0]
+        Delta_0 = Params['Delta_0']
+        gamma_a, gamma_b, gamma_c = np.transpose(Params['gammas'])
+        g_ab = Params['gs'][:, 0]
+        g_1 = Params['g_1']
+        omega_c0 = Params['omega_c0']
 
         # effective values
-        g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
-        omega_b = np.sqrt(1.0 + self.params['theta'])
-        
-        # get coefficients
-        coeffs = np.zeros(2 * self.num_modes, dtype=np.float_)
-        coeffs[0] = 16.0 * omega_c0**2 * g_ab**2 * g_1**2 * (gamma_b**2 + omega_b**2)
-        coeffs[1] = - 8.0 * omega_c0 * g_ab * g_1 * (4.0 * Delta_0 * omega_c0 * g_1 + g_ab * (gamma_c**2 + omega_c0**2)) * (gamma_b**2 + omega_b**2)
-        coeffs[2] = (16.0 * (gamma_a**2 + Delta_0**2) * omega_c0**2 * g_1**2 + g_ab * (gamma_c**2 + omega_c0**2) * (16.0 * Delta_0 * omega_c0 * g_1 + g_ab * (gamma_c**2 + omega_c0**2))) * (gamma_b**2 + omega_b**2)
-        coeffs[3] = (- 2.0 * Delta_0 * g_ab * (gamma_c**2 + omega_c0**2)**2 - 8.0 * omega_c0 * g_1 * (gamma_c**2 + omega_c0**2) * (gamma_a**2 + Delta_0**2)) * (gamma_b**2 + omega_b**2) - 32.0 * omega_b * omega_c0**2 * g_ab * g_1**2 * A_l0**2 - 8.0 * omega_b * omega_c0**2 * g_ab**2 * g_1 * A_v0**2
-        coeffs[4] = (gamma_a**2 + Delta_0**2) * (gamma_c**2 + omega_c0**2)**2 * (gamma_b**2 + omega_b**2) + 16.0 * omega_b * omega_c0 * g_ab * g_1 * A_l0**2 * (gamma_c**2 + omega_c0**2) + 16.0 * omega_b * omega_c0**2 * g_ab * g_1 * A_v0**2 * Delta_0
-        coeffs[5] = - 2.0 * omega_b * g_ab * A_l0**2 * (gamma_c**2 + omega_c0**2) - 8.0 * omega_b * omega_c0**2 * g_1 * A_v0**2 * (gamma_a**2 + Delta_0**2)
+        omega_b = Params['omega_b0']
 
-        return coeffs
+        return get_kernel(cls.get_expressions_coeffs_beta_sum)(A_l0, A_v0, Delta_0, gamma_a, gamma_b, gamma_c, g_ab, g_1, omega_b, omega_c0)
 
     def get_D(self, modes, corrs, c, t):
         """Method to obtain the noise matrix.
@@ -256,21 +495,145 @@ class OEM_20(BaseSystem):
         """
 
         # extract frequently used variables
-        gammas = self.params['gammas']
-        n_ths = self.params['n_ths']
-        
+        D_diag = self.params_frozen.D_diag
+
         # optical mode
-        self.D[0][0] = gammas[0]
-        self.D[1][1] = gammas[0]
+        self.D[0][0] = D_diag[0]
+        self.D[1][1] = D_diag[1]
         # mechanical mode
-        self.D[2][2] = gammas[1] * (2.0 * n_ths[0] + 1.0) 
-        self.D[3][3] = gammas[1] * (2.0 * n_ths[0] + 1.0) 
+        self.D[2][2] = D_diag[2]
+        self.D[3][3] = D_diag[3]
         # LC mode
-        self.D[4][4] = gammas[2] * (2.0 * n_ths[1] + 1.0) 
-        self.D[5][5] = gammas[2] * (2.0 * n_ths[1] + 1.0) 
+        self.D[4][4] = D_diag[4]
+        self.D[5][5] = D_diag[5]
 
         return self.D
+
+    @classmethod
+    def get_D_batch(cls, Params):
+        """Method to obtain the noise matrices for a stack of parameter points.
+
+        Parameters
+        ----------
+        Params : dict
+            Stacked parameters returned by :meth:`get_params_stacked`.
+
+        Returns
+        -------
+        D : numpy.ndarray
+            Noise matrices with shape ``(N, 6, 6)``.
+        """
+
+        # extract frequently used variables
+        gammas = Params['gammas']
+        n_ths = Params['n_ths']
+
+        # initialize noise matrices
+        D = np.zeros((len(gammas), 2 * 3, 2 * 3), dtype=np.float_)
+        # optical mode
+        D[:, 0, 0] = gammas[:, 0]
+        D[:, 1, 1] = gammas[:, 0]
+        # mechanical mode
+        D[:, 2, 2] = gammas[:, 1] * (2.0 * n_ths[:, 0] + 1.0)
+        D[:, 3, 3] = gammas[:, 1] * (2.0 * n_ths[:, 0] + 1.0)
+        # LC mode
+        D[:, 4, 4] = gammas[:, 2] * (2.0 * n_ths[:, 1] + 1.0)
+        D[:, 5, 5] = gammas[:, 2] * (2.0 * n_ths[:, 1] + 1.0)
+
+        return D
     
+    def get_D_compiled(self):
+        """Method to obtain the noise matrix using the compiled backend.
+
+        Returns
+        -------
+        D : numpy.ndarray
+            Noise matrix.
+        """
+
+        return get_D_nb(self.params_struct, np.zeros(self.dim_corrs, dtype=np.float_))
+
+    @staticmethod
+    def get_expressions_coeffs_A():
+        r"""Method to obtain the symbolic coefficients of the characteristic equation of the drift matrix.
+
+        The coefficients are obtained from :math:`\det (\lambda I - A)`, following ``notebooks/oem_20_dynamical_stability.ipynb``.
+
+        Returns
+        -------
+        args : list
+            Symbols for :math:`\gamma_{a}`, :math:`\gamma_{b}`, :math:`\gamma_{c}`, :math:`\Delta`, :math:`\mathrm{Re} (G_{\alpha})`, :math:`\mathrm{Im} (G_{\alpha})`, :math:`G_{\beta}`, :math:`G_{\chi}`, :math:`\omega_{b}` and :math:`\omega_{c0}`.
+        exprs : list
+            Coefficients of the characteristic equation in descending order of the powers.
+        """
+
+        # dependencies
+        import sympy as sp
+
+        # symbols
+        gamma_a, gamma_b, gamma_c, omega_b, omega_c0 = sp.symbols('gamma_a, gamma_b, gamma_c, omega_b, omega_c0', real=True, positive=True)
+        Delta, G_R, G_I, G_beta, G_chi = sp.symbols('Delta, G_R, G_I, G_beta, G_chi', real=True)
+        lamb = sp.symbols('lambda')
+
+        # drift matrix
+        A = sp.Matrix([
+            [- gamma_a, Delta, - 2 * G_I, 0, 0, 0],
+            [- Delta, - gamma_a, 2 * G_R, 0, 0, 0],
+            [0, 0, - gamma_b, omega_b, 0, 0],
+            [2 * G_R, 2 * G_I, - omega_b, - gamma_b, 4 * G_chi, 0],
+            [0, 0, 0, 0, - gamma_c, omega_c0],
+            [0, 0, 4 * G_chi, 0, - omega_c0 + 4 * G_beta, - gamma_c]
+        ])
+
+        return [gamma_a, gamma_b, gamma_c, Delta, G_R, G_I, G_beta, G_chi, omega_b, omega_c0], [sp.expand(coeff) for coeff in A.charpoly(lamb).all_coeffs()]
+
+    @staticmethod
+    def get_expressions_coeffs_beta_sum():
+        r"""Method to obtain the symbolic coefficients of the polynomial in the sum of mechanical modes.
+
+        The steady-state optical and electrical modes are eliminated from the mechanical steady state, following ``notebooks/oem_20_multistability.ipynb``.
+
+        Returns
+        -------
+        args : list
+            Symbols for :math:`A_{l0}`, :math:`A_{v0}`, :math:`\Delta_{0}`, :math:`\gamma_{a}`, :math:`\gamma_{b}`, :math:`\gamma_{c}`, :math:`g_{ab}`, :math:`g_{1}`, :math:`\omega_{b}` and :math:`\omega_{c0}`.
+        exprs : list
+            Coefficients of the polynomial in descending order of the powers.
+        """
+
+        # dependencies
+        import sympy as sp
+
+        # symbols
+        gamma_a, gamma_b, gamma_c, g_ab, omega_b, omega_c0 = sp.symbols('gamma_a, gamma_b, gamma_c, g_ab, omega_b, omega_c0', real=True, positive=True)
+        A_l0, A_v0, Delta_0, g_1, beta_sum = sp.symbols('A_l0, A_v0, Delta_0, g_1, beta_sum', real=True)
+
+        # denominators of the photon number and the sum of electrical modes
+        den_alpha = gamma_a**2 + (Delta_0 - g_ab * beta_sum)**2
+        den_chi = gamma_c**2 + omega_c0**2 - 4 * omega_c0 * g_1 * beta_sum
+
+        # real part of the mechanical steady state multiplied by the denominators
+        poly = beta_sum * (gamma_b**2 + omega_b**2) * den_alpha * den_chi**2 - 2 * omega_b * g_ab * A_l0**2 * den_chi**2 - 2 * omega_b * g_1 * (2 * omega_c0 * A_v0)**2 * den_alpha
+
+        return [A_l0, A_v0, Delta_0, gamma_a, gamma_b, gamma_c, g_ab, g_1, omega_b, omega_c0], sp.Poly(sp.expand(poly), beta_sum).all_coeffs()
+
+    def get_hle_rates_compiled(self):
+        """Method to obtain the compiled rates of change of the state formed by the interleaved real and imaginary parts of the modes followed by the flattened quadrature correlations.
+
+        Returns
+        -------
+        func : callable
+            Rates formatted as ``func(t, y)``, evaluated without returning to the interpreter.
+        """
+
+        # extract frequently used variables
+        params_struct = self.params_struct
+
+        def func(t, y):
+            return get_hle_rates_nb(params_struct, t, y)
+
+        return func
+
     def get_ivc(self):
         """Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -285,7 +648,7 @@ class OEM_20(BaseSystem):
         """
 
         # extract frequently used variables
-        n_ths = self.params['n_ths']
+        n_ths = self.params_frozen.n_ths
  
         # initial mode values
         iv_modes = np.zeros(self.num_modes, dtype=np.complex_)
@@ -301,6 +664,41 @@ class OEM_20(BaseSystem):
 
         return iv_modes, iv_corrs, np.empty(0)
 
+    @classmethod
+    def get_ivc_batch(cls, Params):
+        """Method to obtain the initial values of the modes and correlations for a stack of parameter points.
+
+        Parameters
+        ----------
+        Params : dict
+            Stacked parameters returned by :meth:`get_params_stacked`.
+
+        Returns
+        -------
+        iv_modes : numpy.ndarray
+            Initial values of the classical modes with shape ``(N, 3)``.
+        iv_corrs : numpy.ndarray
+            Initial values of the quantum correlations with shape ``(N, 6, 6)``.
+        """
+
+        # extract frequently used variables
+        n_ths = Params['n_ths']
+        dim = len(n_ths)
+
+        # initial mode values
+        iv_modes = np.zeros((dim, 3), dtype=np.complex_)
+
+        # initial quadrature correlations
+        iv_corrs = np.zeros((dim, 2 * 3, 2 * 3), dtype=np.float_)
+        iv_corrs[:, 0, 0] = 0.5
+        iv_corrs[:, 1, 1] = 0.5
+        iv_corrs[:, 2, 2] = n_ths[:, 0] + 0.5
+        iv_corrs[:, 3, 3] = n_ths[:, 0] + 0.5
+        iv_corrs[:, 4, 4] = n_ths[:, 1] + 0.5
+        iv_corrs[:, 5, 5] = n_ths[:, 1] + 0.5
+
+        return iv_modes, iv_corrs
+
     def get_modes_steady_state(self, c):
         """Method to obtain the steady state modes.
         
@@ -315,40 +713,94 @@ class OEM_20(BaseSystem):
             Steady state modes.
         """
 
-        # extract frequently used variables
-        A_l0, _, _ = self.params['A_ls']
-        A_v0, _, _ = self.params['A_vs']
-        Delta_0 = self.params['Delta_0']
-        gamma_a, gamma_b, gamma_c = self.params['gammas']
-        g_ab, g_bc = self.params['gs']
-        omega_c0 = self.params['omega_c0']
+        # get physical branches
+        Modes, mask = self.get_modes_steady_state_batch(self.params_stacked)
+
+        return Modes[0][mask[0]]
+
+    @classmethod
+    def get_modes_steady_state_batch(cls, Params, tol_imag=1e-9, tol_consistency=1e-6, chunk_size=10000):
+        """Method to obtain all steady state branches for a stack of parameter points.
+
+        The roots of the polynomials in the sum of mechanical modes are obtained together as the eigenvalues of their companion matrices.
+
+        Parameters
+        ----------
+        Params : dict
+            Stacked parameters returned by :meth:`get_params_stacked`.
+        tol_imag : float, optional
+            Relative tolerance of the imaginary parts below which a root is considered real. Default is ``1e-9``.
+        tol_consistency : float, optional
+            Relative tolerance between each root and the sum of the mechanical modes obtained from it. Roots introduced by clearing the denominators, for example the double root of the electrical denominator for a vanishing voltage, are discarded. Default is ``1e-6``.
+        chunk_size : int, optional
+            Number of points processed at once. Default is ``10000``.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Steady state modes with shape ``(N, 5, 3)``, sorted by the sum of mechanical modes. Entries of missing branches are ``nan``.
+        mask : numpy.ndarray
+            Boolean mask with shape ``(N, 5)`` marking the physical branches.
+        """
+
+        # get coefficients
+        coeffs = cls.get_coeffs_beta_sum_batch(Params)
+        N, dim = coeffs.shape
+        degree = dim - 1
+
+        # initialize modes and branches
+        Modes = np.empty((N, degree, 3), dtype=np.complex_)
+        mask = np.empty((N, degree), dtype=np.bool_)
+
+        # process chunks of points to reuse the working memory
+        for i in range(0, N, chunk_size):
+            chunk = slice(i, i + chunk_size)
+
+            # extract frequently used variables
+            A_l0 = Params['A_ls'][chunk, 0:1]
+            A_v0 = Params['A_vs'][chunk, 0:1]
+            Delta_0 = Params['Delta_0'][chunk, None]
+            gamma_a, gamma_b, gamma_c = np.transpose(Params['gammas'][chunk])[:, :, None]
+            g_ab = Params['gs'][chunk, 0:1]
+            g_1 = Params['g_1'][chunk, None]
+            omega_c0 = Params['omega_c0'][chunk, None]
+            Omega_c0_2 = Params['Omega_c0_2'][chunk, None]
+
+            # effective values
+            omega_b = Params['omega_b0'][chunk, None]
+
+            # normalized companion matrices, skipping degenerate polynomials
+            valid = coeffs[chunk, 0] != 0.0
+            C = np.zeros((len(valid), degree, degree), dtype=np.float_)
+            C[:, 0, :] = - coeffs[chunk, 1:] / np.where(valid, coeffs[chunk, 0], 1.0)[:, None]
+            C[:, np.arange(1, degree), np.arange(degree - 1)] = 1.0
+            roots = np.linalg.eigvals(C)
+
+            # real roots sorted in ascending order
+            is_real = (np.abs(np.imag(roots)) <= tol_imag * np.maximum(1.0, np.abs(roots))) & valid[:, None]
+            beta_sums = np.sort(np.where(is_real, np.real(roots), np.inf), axis=1)
+            mask[chunk] = np.isfinite(beta_sums)
+            beta_sums[~ mask[chunk]] = np.nan
+
+            # modes of the missing branches remain undefined
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # effective detunings and sums of chi and its conjugate
+                Delta = Delta_0 - g_ab * beta_sums
+                chi_sum = 2.0 * omega_c0 * A_v0 / (Omega_c0_2 - 4.0 * omega_c0 * g_1 * beta_sums)
+
+                # optical mode
+                Modes[chunk, :, 0] = A_l0 * (gamma_a - 1.0j * Delta) / (gamma_a**2 + Delta**2)
+                # mechanical mode
+                Modes[chunk, :, 1] = (g_ab * A_l0**2 / (gamma_a**2 + Delta**2) + g_1 * chi_sum**2) * (omega_b + 1.0j * gamma_b) / (gamma_b**2 + omega_b**2)
+                # LC circuit mode
+                Modes[chunk, :, 2] = (A_v0 + 2.0 * g_1 * beta_sums * chi_sum) * (omega_c0 + 1.0j * gamma_c) / Omega_c0_2
+
+            # discard spurious roots of the denominators
+            mask[chunk] &= np.abs(2.0 * np.real(Modes[chunk, :, 1]) - np.nan_to_num(beta_sums)) <= tol_consistency * np.maximum(1.0, np.abs(np.nan_to_num(beta_sums)))
+            Modes[chunk][~ mask[chunk]] = np.nan
+
+        return Modes, mask
 
-        # effective values
-        omega_b = np.sqrt(1.0 + self.params['theta'])
-
-        # get real roots for the sum of betas
-        coeffs = self.get_coeffs_beta_0_sum(c)
-        roots = np.roots(coeffs)
-        beta_sums = np.real(roots[np.imag(roots) == 0.0])
-
-        # initialize modes
-        Modes = np.zeros((len(beta_sums), self.num_modes), dtype=np.complex_)
-
-        # calculate mode amplitudes for each sum
-        for i in range(len(beta_sums)):
-            # optical mode
-            alpha = A_l0 / (gamma_a + 1.0j * Delta_0 - 1.0j * g_ab * beta_sums[i])
-            Modes[i][0] = alpha
-            # sum of chi and its conjugate
-            chi_sum = 2.0 * omega_c0 * A_v0 / (gamma_c**2 + omega_c0**2 - 4.0 * omega_c0 * g_bc * beta_sums[i])
-            # mechanical mode
-            beta = (1.0j * g_ab * np.conjugate(alpha) * alpha + 1.0j * g_bc * chi_sum**2) / (gamma_b + 1.0j * omega_b)
-            Modes[i][1] = beta
-            # LC circuit mode
-            Modes[i][2] = (1.0j * A_v0 + 2.0j * g_bc * beta_sums[i] * chi_sum) / (gamma_c + 1.0j * omega_c0)
-
-        return Modes
-    
     def get_mode_rates(self, modes, c, t):
         """Method to obtain the rates of change of the modes.
 
@@ -368,25 +820,21 @@ class OEM_20(BaseSystem):
         """
 
         # extract frequently used variables
-        A_l0, A_lm, A_lp = self.params['A_ls']
-        A_v0, A_vm, A_vp = self.params['A_vs']
-        gamma_a, gamma_b, gamma_c = self.params['gammas']
-        g_ab, g_bc = self.params['gs']
-        Omega_l, Omega_v, Omega_s = self.params['Omegas']
-        omega_c0 = self.params['omega_c0']
+        p = self.params_frozen
+        gamma_a, gamma_b, gamma_c = p.gammas
+        g_ab, _ = p.gs
+        g_1 = p.g_1
+        omega_c0 = p.omega_c0
         alpha, beta, chi = modes
 
         # effective values
-        Delta = self.params['Delta_0'] - 2.0 * g_ab * np.real(beta)
-        g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
+        Delta = p.Delta_0 - 2.0 * g_ab * np.real(beta)
 
         # handle fixed point 
         t = 0.0 if t is None else t
 
         # update modulations
-        A_l = A_l0 + A_lm * np.exp(1j * Omega_l * t) + A_lp * np.exp(-1j * Omega_l * t)
-        A_v = A_v0 + A_vm * np.exp(1j * Omega_v * t) + A_vp * np.exp(-1j * Omega_v * t)
-        omega_b = np.sqrt(1.0 + self.params['theta'] * getattr(np, self.params['t_mod'])(Omega_s * t))
+        A_l, A_v, omega_b = self.get_modulations(t)
 
         # calculate mode rates
         # optical
@@ -396,4 +844,515 @@ class OEM_20(BaseSystem):
         # circuit
         dchi_dt = 8.0j * g_1 * np.real(beta) * np.real(chi) - (gamma_c + 1.0j * omega_c0) * chi + 1.0j * A_v
 
-        return np.array([dalpha_dt, dbeta_dt, dchi_dt], dtype=np.complex_)
\ No newline at end of file
+        return np.array([dalpha_dt, dbeta_dt, dchi_dt], dtype=np.complex_)
+
+    def get_mode_rates_compiled(self, modes, t):
+        """Method to obtain the rates of change of the modes using the compiled backend.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        mode_rates : numpy.ndarray
+            Rate of change of the modes.
+        """
+
+        return get_mode_rates_nb(self.params_struct, np.asarray(modes, dtype=np.complex_), 0.0 if t is None else t, np.zeros(self.num_modes, dtype=np.complex_))
+
+    def get_mode_rates_jacobian(self, modes, c, t):
+        r"""Method to obtain the Jacobian of the rates of change of the modes in real form.
+
+        The real and imaginary parts of the modes are ordered as :math:`\left[ \mathrm{Re} (\alpha), \mathrm{Im} (\alpha), \mathrm{Re} (\beta), \mathrm{Im} (\beta), \mathrm{Re} (\chi), \mathrm{Im} (\chi) \right]`, which coincides with the ordering of the quadratures.
+        As the mode equations are at most quadratic in the modes, their Jacobian is identical to the drift matrix.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        J : numpy.ndarray
+            Jacobian of the rates of change of the modes.
+        """
+
+        return np.array(self.get_A(modes, c, t), dtype=np.float_)
+
+    @classmethod
+    def get_mode_rates_batch(cls, Modes, Params, t):
+        """Method to obtain the rates of change of the modes for a stack of parameter points.
+
+        Parameters
+        ----------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(N, 3)``.
+        Params : dict
+            Stacked parameters returned by :meth:`get_params_stacked`.
+        t : float or numpy.ndarray
+            Time at which the values are calculated, either common to all points or with shape ``(N, )``.
+
+        Returns
+        -------
+        mode_rates : numpy.ndarray
+            Rates of change of the modes with shape ``(N, 3)``.
+        """
+
+        # extract frequently used variables
+        gamma_a, gamma_b, gamma_c = np.transpose(Params['gammas'])
+        g_ab = Params['gs'][:, 0]
+        g_1 = Params['g_1']
+        omega_c0 = Params['omega_c0']
+        alpha, beta, chi = np.transpose(Modes)
+
+        # effective values
+        Delta = Params['Delta_0'] - 2.0 * g_ab * np.real(beta)
+
+        # update modulations
+        A_l, A_v, omega_b = cls.get_modulations_batch(Params, t)
+
+        # calculate mode rates
+        mode_rates = np.empty((len(Modes), 3), dtype=np.complex_)
+        # optical
+        mode_rates[:, 0] = - (gamma_a + 1.0j * Delta) * alpha + A_l
+        # mechanical
+        mode_rates[:, 1] = 1.0j * g_ab * np.conjugate(alpha) * alpha - (gamma_b + 1.0j * omega_b) * beta + 4.0j * g_1 * np.real(chi)**2
+        # circuit
+        mode_rates[:, 2] = 8.0j * g_1 * np.real(beta) * np.real(chi) - (gamma_c + 1.0j * omega_c0) * chi + 1.0j * A_v
+
+        return mode_rates
+
+    def get_modulations(self, t):
+        """Method to obtain the modulated drive amplitudes and mechanical frequency.
+
+        If a modulation schedule is set, the waveforms are read from its tables at tabulated times.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        A_l : complex
+            Laser amplitude.
+        A_v : complex
+            Voltage amplitude.
+        omega_b : float
+            Mechanical frequency.
+        """
+
+        # extract frequently used variables
+        p = self.params_frozen
+        A_l0, A_lm, A_lp = p.A_ls
+        A_v0, A_vm, A_vp = p.A_vs
+        Omega_l, Omega_v, Omega_s = p.Omegas
+
+        # unit waveforms
+        if self.modulation_schedule is not None:
+            E_l, E_v, W_s = self.modulation_schedule.get_waveforms(t)
+        else:
+            E_l, E_v, W_s = np.exp(1j * Omega_l * t), np.exp(1j * Omega_v * t), np.sin(Omega_s * t) if p.t_mod == 'sin' else np.cos(Omega_s * t)
+
+        # update modulations
+        A_l = A_l0 + A_lm * E_l + A_lp * np.conjugate(E_l)
+        A_v = A_v0 + A_vm * E_v + A_vp * np.conjugate(E_v)
+        omega_b = np.sqrt(1.0 + p.theta * W_s)
+
+        return A_l, A_v, omega_b
+
+    @classmethod
+    def get_modulations_batch(cls, Params, t):
+        """Method to obtain the modulated drive amplitudes and mechanical frequencies for a stack of parameter points.
+
+        Parameters
+        ----------
+        Params : dict
+            Stacked parameters returned by :meth:`get_params_stacked`. If the optional key ``'schedule'`` contains a :class:`utils.modulations.ModulationSchedule` common to all points, the waveforms are read from its tables at tabulated times.
+        t : float or numpy.ndarray
+            Time at which the values are calculated, either common to all points or with shape ``(N, )``.
+
+        Returns
+        -------
+        A_l : numpy.ndarray
+            Laser amplitudes with shape ``(N, )``.
+        A_v : numpy.ndarray
+            Voltage amplitudes with shape ``(N, )``.
+        omega_b : numpy.ndarray
+            Mechanical frequencies with shape ``(N, )``.
+        """
+
+        # extract frequently used variables
+        A_l0, A_lm, A_lp = np.transpose(Params['A_ls'])
+        A_v0, A_vm, A_vp = np.transpose(Params['A_vs'])
+        Omega_l, Omega_v, Omega_s = np.transpose(Params['Omegas'])
+
+        # handle fixed point
+        t = 0.0 if t is None else t
+
+        # unit waveforms
+        if Params.get('schedule', None) is not None:
+            E_l, E_v, W_s = Params['schedule'].get_waveforms(t)
+        else:
+            E_l, E_v, W_s = np.exp(1j * Omega_l * t), np.exp(1j * Omega_v * t), np.where(Params['t_mod'] == 'sin', np.sin(Omega_s * t), np.cos(Omega_s * t))
+
+        # update modulations
+        A_l = A_l0 + A_lm * E_l + A_lp * np.conjugate(E_l)
+        A_v = A_v0 + A_vm * E_v + A_vp * np.conjugate(E_v)
+        omega_b = np.sqrt(1.0 + Params['theta'] * W_s)
+
+        return A_l, A_v, omega_b
+
+    def get_modulation_period(self, max_denominator=10000):
+        r"""Method to obtain the common period of all modulations.
+
+        The modulation frequencies are converted to rational numbers and the period is obtained from their greatest common divisor.
+        For an unmodulated system, the dynamics is time-independent and a period of :math:`2 \pi` is returned.
+        As the frequencies are approximated by rational numbers, closely-spaced frequencies result in long periods, for example, :math:`\Omega_{l} = 2` and :math:`\Omega_{v} = 1.9001` result in a period of :math:`2 \pi \times 10^{4}`, exceeding the maximum time of the scripts.
+        Methods relying on the period should therefore check it against the integrated times.
+
+        Parameters
+        ----------
+        max_denominator : int, optional
+            Maximum denominator of the rational approximations of the modulation frequencies. Default is ``10000``.
+
+        Returns
+        -------
+        T_mod : float
+            Common period of the modulations. If the frequencies are not commensurate within the maximum denominator, ``None`` is returned.
+        """
+
+        # extract frequently used variables
+        _, A_lm, A_lp = self.params_frozen.A_ls
+        _, A_vm, A_vp = self.params_frozen.A_vs
+        Omega_l, Omega_v, Omega_s = self.params_frozen.Omegas
+
+        # frequencies of the active modulations
+        Omegas = list()
+        if A_lm != 0.0 or A_lp != 0.0:
+            Omegas.append(Omega_l)
+        if A_vm != 0.0 or A_vp != 0.0:
+            Omegas.append(Omega_v)
+        if self.params_frozen.theta != 0.0:
+            Omegas.append(Omega_s)
+        Omegas = [abs(Omega) for Omega in Omegas if Omega != 0.0]
+        if len(Omegas) == 0:
+            return 2.0 * np.pi
+
+        # greatest common divisor of the rational frequencies
+        Omega_gcd = Fraction(0)
+        for Omega in Omegas:
+            frac = Fraction(Omega).limit_denominator(max_denominator)
+            if abs(float(frac) - Omega) > 1e-12 * max(1.0, Omega):
+                return None
+            Omega_gcd = Fraction(math.gcd(Omega_gcd.numerator * frac.denominator, frac.numerator * Omega_gcd.denominator), Omega_gcd.denominator * frac.denominator)
+
+        return 2.0 * np.pi / float(Omega_gcd)
+
+    def get_params_struct(self):
+        """Method to freeze the parameters into a structured array for the compiled backend.
+
+        Returns
+        -------
+        params_struct : numpy.ndarray
+            Record array of length ``1`` with the fields of :data:`PARAMS_STRUCT_DTYPE`.
+        """
+
+        # extract frequently used variables
+        p = self.params_frozen
+
+        # freeze values
+        params_struct = np.zeros(1, dtype=PARAMS_STRUCT_DTYPE).view(np.recarray)
+        params_struct[0] = p.A_ls + p.A_vs + (p.Delta_0, ) + p.gammas + (p.gs[0], p.g_1) + p.n_ths + p.Omegas + (p.omega_c0, p.theta, 1.0 if p.t_mod == 'sin' else 0.0)
+
+        return params_struct
+
+    @classmethod
+    def get_params_stacked(cls, params_list):
+        """Method to stack the parameters of multiple systems into arrays.
+
+        Missing keys are filled from the system defaults.
+
+        Parameters
+        ----------
+        params_list : list
+            Parameters for each system, formatted as in the class constructor.
+
+        Returns
+        -------
+        Params : dict
+            Parameters with a leading axis of length ``N`` for each key. The additional keys ``'g_1'``, ``'omega_b0'`` and ``'Omega_c0_2'`` contain the derived constants of :class:`OEM_20Params` for each point.
+        """
+
+        # stack parameters
+        Params = dict()
+        for key in cls.system_defaults:
+            Params[key] = np.array([params.get(key, cls.system_defaults[key]) for params in params_list])
+
+        # validate strings
+        assert np.all(np.isin(Params['t_mod'], ['cos', 'sin'])), "Parameter ``'t_mod'`` can only assume the values ``'cos'`` and ``'sin'``"
+        assert np.all(np.isin(Params['t_pos'], ['top', 'bottom'])), "Parameter ``'t_pos'`` can only assume the values ``'top'`` and ``'bottom'``"
+
+        # effective values
+        Params['g_1'] = np.where(Params['t_pos'] == 'bottom', - 1.0, 1.0) * Params['gs'][:, 1]
+        Params['omega_b0'] = np.sqrt(1.0 + Params['theta'])
+        Params['Omega_c0_2'] = Params['gammas'][:, 2]**2 + Params['omega_c0']**2
+
+        return Params
+
+    def is_time_independent(self):
+        """Method to check if the system is unmodulated.
+
+        Only the modulated parts of the amplitudes are checked, so that the system is unmodulated for amplitudes formatted as ``[A_l0, 0.0, 0.0]`` and ``[A_v0, 0.0, 0.0]`` with ``theta`` set to ``0.0``.
+        The configurations of the scripts ``3a`` with ``theta`` set to ``0.0`` and ``3b-3c`` with ``A_vs`` set to ``[50.0, 0.0, 0.0]`` retain the laser modulation ``A_ls = [100.0, 10.0, 10.0]`` and remain modulated.
+
+        Returns
+        -------
+        time_independent : bool
+            ``True`` if the modulation amplitudes of the laser and the voltage and the mechanical modulation amplitude vanish.
+        """
+
+        # extract frequently used variables
+        _, A_lm, A_lp = self.params_frozen.A_ls
+        _, A_vm, A_vp = self.params_frozen.A_vs
+
+        return A_lm == 0.0 and A_lp == 0.0 and A_vm == 0.0 and A_vp == 0.0 and self.params_frozen.theta == 0.0
+
+    def is_compiled_consistent(self, num_samples=4, rtol=1e-10, seed=0):
+        """Method to check the rates of the compiled backend against the rates of the interpreter.
+
+        The rates of :func:`get_hle_rates_nb` are compared with the mode rates of :meth:`get_mode_rates` and the correlation rates :math:`A V + V A^{T} + D` of :meth:`get_A` and :meth:`get_D` at random states and times.
+
+        Parameters
+        ----------
+        num_samples : int, optional
+            Number of random states. Default is ``4``.
+        rtol : float, optional
+            Relative tolerance of the comparison. Default is ``1e-10``.
+        seed : int, optional
+            Seed of the random states. Default is ``0``.
+
+        Returns
+        -------
+        consistent : bool
+            ``True`` if the rates agree within the tolerance for all samples.
+        """
+
+        # extract frequently used variables
+        rng = np.random.default_rng(seed)
+        c = np.empty(0)
+
+        for _ in range(num_samples):
+            # random state
+            modes = rng.normal(size=self.num_modes) + 1.0j * rng.normal(size=self.num_modes)
+            corrs = rng.normal(size=self.dim_corrs)
+            corrs = corrs + np.transpose(corrs)
+            t = rng.uniform(0.0, 10.0)
+            y = np.concatenate((modes.view(np.float_), np.ravel(corrs)))
+
+            # rates of the interpreter
+            A = self.get_A(modes, c, t)
+            rates = np.concatenate((np.asarray(self.get_mode_rates(modes, c, t), dtype=np.complex_).view(np.float_), np.ravel(A.dot(corrs) + corrs.dot(np.transpose(A)) + self.get_D(modes, corrs, c, t))))
+
+            # compare with the compiled rates
+            if not np.allclose(get_hle_rates_nb(self.params_struct, t, y), rates, rtol=rtol, atol=rtol * np.max(np.abs(rates))):
+                return False
+
+        return True
+
+# fields of the frozen parameters for the compiled backend
+PARAMS_STRUCT_DTYPE = np.dtype([(name, np.float_) for name in ['A_l0', 'A_lm', 'A_lp', 'A_v0', 'A_vm', 'A_vp', 'Delta_0', 'gamma_a', 'gamma_b', 'gamma_c', 'g_ab', 'g_1', 'n_th_b', 'n_th_c', 'Omega_l', 'Omega_v', 'Omega_s', 'omega_c0', 'theta', 't_mod_sin']])
+
+def get_A_nb(params_struct, modes, t, A):
+    """Function to obtain the drift matrix in place for the compiled backend.
+
+    Parameters
+    ----------
+    params_struct : numpy.ndarray
+        Frozen parameters returned by :meth:`OEM_20.get_params_struct`.
+    modes : numpy.ndarray
+        Classical modes.
+    t : float
+        Time at which the values are calculated.
+    A : numpy.ndarray
+        Drift matrix to update.
+
+    Returns
+    -------
+    A : numpy.ndarray
+        Updated drift matrix.
+    """
+
+    # extract frequently used variables
+    p = params_struct[0]
+    alpha = modes[0]
+    beta = modes[1]
+    chi = modes[2]
+
+    # effective values
+    Delta = p.Delta_0 - 2.0 * p.g_ab * beta.real
+    G_alpha = p.g_ab * alpha
+    G_beta = 2.0 * p.g_1 * beta.real
+    G_chi = 2.0 * p.g_1 * chi.real
+
+    # update modulations
+    omega_b = np.sqrt(1.0 + p.theta * (np.sin(p.Omega_s * t) if p.t_mod_sin != 0.0 else np.cos(p.Omega_s * t)))
+
+    # optical position quadrature
+    A[0, 0] = - p.gamma_a
+    A[0, 1] = Delta
+    A[0, 2] = - 2.0 * G_alpha.imag
+    # optical momentum quadrature
+    A[1, 0] = - Delta
+    A[1, 1] = - p.gamma_a
+    A[1, 2] = 2.0 * G_alpha.real
+    # mechanical position quadrature
+    A[2, 2] = - p.gamma_b
+    A[2, 3] = omega_b
+    # mechanical momentum quadrature
+    A[3, 0] = 2.0 * G_alpha.real
+    A[3, 1] = 2.0 * G_alpha.imag
+    A[3, 2] = - omega_b
+    A[3, 3] = - p.gamma_b
+    A[3, 4] = 4.0 * G_chi
+    # LC charge quadrature
+    A[4, 4] = - p.gamma_c
+    A[4, 5] = p.omega_c0
+    # LC flux quadrature
+    A[5, 2] = 4.0 * G_chi
+    A[5, 4] = - p.omega_c0 + 4.0 * G_beta
+    A[5, 5] = - p.gamma_c
+
+    return A
+
+def get_D_nb(params_struct, D):
+    """Function to obtain the noise matrix in place for the compiled backend.
+
+    Parameters
+    ----------
+    params_struct : numpy.ndarray
+        Frozen parameters returned by :meth:`OEM_20.get_params_struct`.
+    D : numpy.ndarray
+        Noise matrix to update.
+
+    Returns
+    -------
+    D : numpy.ndarray
+        Updated noise matrix.
+    """
+
+    # extract frequently used variables
+    p = params_struct[0]
+
+    # optical mode
+    D[0, 0] = p.gamma_a
+    D[1, 1] = p.gamma_a
+    # mechanical mode
+    D[2, 2] = p.gamma_b * (2.0 * p.n_th_b + 1.0)
+    D[3, 3] = p.gamma_b * (2.0 * p.n_th_b + 1.0)
+    # LC mode
+    D[4, 4] = p.gamma_c * (2.0 * p.n_th_c + 1.0)
+    D[5, 5] = p.gamma_c * (2.0 * p.n_th_c + 1.0)
+
+    return D
+
+def get_mode_rates_nb(params_struct, modes, t, mode_rates):
+    """Function to obtain the rates of change of the modes in place for the compiled backend.
+
+    Parameters
+    ----------
+    params_struct : numpy.ndarray
+        Frozen parameters returned by :meth:`OEM_20.get_params_struct`.
+    modes : numpy.ndarray
+        Classical modes.
+    t : float
+        Time at which the values are calculated.
+    mode_rates : numpy.ndarray
+        Rates of change of the modes to update.
+
+    Returns
+    -------
+    mode_rates : numpy.ndarray
+        Updated rates of change of the modes.
+    """
+
+    # extract frequently used variables
+    p = params_struct[0]
+    alpha = modes[0]
+    beta = modes[1]
+    chi = modes[2]
+
+    # effective values
+    Delta = p.Delta_0 - 2.0 * p.g_ab * beta.real
+
+    # update modulations
+    A_l = p.A_l0 + p.A_lm * np.exp(1j * p.Omega_l * t) + p.A_lp * np.exp(-1j * p.Omega_l * t)
+    A_v = p.A_v0 + p.A_vm * np.exp(1j * p.Omega_v * t) + p.A_vp * np.exp(-1j * p.Omega_v * t)
+    omega_b = np.sqrt(1.0 + p.theta * (np.sin(p.Omega_s * t) if p.t_mod_sin != 0.0 else np.cos(p.Omega_s * t)))
+
+    # optical
+    mode_rates[0] = - (p.gamma_a + 1.0j * Delta) * alpha + A_l
+    # mechanical
+    mode_rates[1] = 1.0j * p.g_ab * (alpha.real**2 + alpha.imag**2) - (p.gamma_b + 1.0j * omega_b) * beta + 4.0j * p.g_1 * chi.real**2
+    # circuit
+    mode_rates[2] = 8.0j * p.g_1 * beta.real * chi.real - (p.gamma_c + 1.0j * p.omega_c0) * chi + 1.0j * A_v
+
+    return mode_rates
+
+def get_hle_rates_nb(params_struct, t, y):
+    """Function to obtain the rates of change of the state of the modes and the quadrature correlations for the compiled backend.
+
+    Parameters
+    ----------
+    params_struct : numpy.ndarray
+        Frozen parameters returned by :meth:`OEM_20.get_params_struct`.
+    t : float
+        Time at which the values are calculated.
+    y : numpy.ndarray
+        State formed by the interleaved real and imaginary parts of the modes followed by the flattened quadrature correlations.
+
+    Returns
+    -------
+    rates : numpy.ndarray
+        Rates of change of the state.
+    """
+
+    # extract modes
+    modes = np.empty(3, dtype=np.complex128)
+    for i in range(3):
+        modes[i] = y[2 * i] + 1.0j * y[2 * i + 1]
+
+    # rates of the modes
+    rates = np.empty_like(y)
+    mode_rates = get_mode_rates_nb(params_struct, modes, t, np.empty(3, dtype=np.complex128))
+    for i in range(3):
+        rates[2 * i] = mode_rates[i].real
+        rates[2 * i + 1] = mode_rates[i].imag
+
+    # rates of the correlations
+    A = get_A_nb(params_struct, modes, t, np.zeros((6, 6), dtype=np.float64))
+    D = get_D_nb(params_struct, np.zeros((6, 6), dtype=np.float64))
+    for i in range(6):
+        for j in range(i, 6):
+            rate = D[i, j]
+            for k in range(6):
+                rate += A[i, k] * y[6 + 6 * k + j] + A[j, k] * y[6 + 6 * i + k]
+            rates[6 + 6 * i + j] = rate
+            rates[6 + 6 * j + i] = rate
+
+    return rates
+
+# compile if available
+if njit is not None:
+    get_A_nb = njit(nogil=True, cache=True)(get_A_nb)
+    get_D_nb = njit(nogil=True, cache=True)(get_D_nb)
+    get_mode_rates_nb = njit(nogil=True, cache=True)(get_mode_rates_nb)
+    get_hle_rates_nb = njit(nogil=True, cache=True)(get_hle_rates_nb)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing a persistent memory-mapped archive of trajectories."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import copy
+import json
+import logging
+import numpy as np
+import os
+
+# local modules
+from utils.cache import get_cache_key, get_code_version
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# default directory of the archived trajectories
+ARCHIVE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'trajectories')
+# solver parameters defining the times
+TIME_KEYS = ['t_min', 't_max', 't_dim']
+
+def get_integration_params(params_solver):
+    """Function to obtain the solver parameters affecting the integrated trajectory.
+
+    Only the parameters of the times and the parameters of the integrator, formatted as ``'ode_*'``, are retained, so that scripts using different windows or measures of the same trajectory share it.
+
+    Parameters
+    ----------
+    params_solver : dict
+        Parameters of the solver.
+
+    Returns
+    -------
+    params_integration : dict
+        Parameters of the integration.
+    """
+
+    return {key: params_solver[key] for key in params_solver if key in TIME_KEYS or key.startswith('ode_')}
+
+class TrajectoryArchive():
+    """Class to archive the times, classical modes and quadrature correlations of a trajectory in memory-mapped arrays.
+
+    Each trajectory is stored in a directory of ``.npy`` files addressed by the hash of the system parameters, the integration parameters and the version of the code.
+    Windows of the trajectory are returned as views of the memory maps, so that only the accessed samples are read from the disk.
+
+    Parameters
+    ----------
+    params_system : dict
+        Parameters of the system.
+    params_solver : dict
+        Parameters of the solver. Only the parameters returned by :func:`get_integration_params` define the trajectory.
+    deps : list, optional
+        Functions and classes producing the trajectory, for example the classes of the system and the solver. Default is ``None``.
+    archive_dir : str, optional
+        Directory of the archive. If ``None``, :data:`ARCHIVE_DIR` is used.
+    """
+
+    def __init__(self, params_system, params_solver, deps=None, archive_dir=None):
+        """Class constructor for TrajectoryArchive."""
+
+        # set attributes
+        self.params_system = params_system
+        self.params_solver = params_solver
+        self.key = get_cache_key(params_system, get_integration_params(params_solver), get_code_version(*(deps if deps is not None else list())))
+        self.dir_path = os.path.join(archive_dir if archive_dir is not None else ARCHIVE_DIR, self.key)
+        self.arrays = None
+
+    def exists(self):
+        """Method to check if the trajectory is archived.
+
+        Returns
+        -------
+        exists : bool
+            ``True`` if the description of the trajectory exists.
+        """
+
+        return os.path.isfile(os.path.join(self.dir_path, 'meta.json'))
+
+    def save(self, T, Modes, Corrs):
+        """Method to archive the trajectory.
+
+        Parameters
+        ----------
+        T : numpy.ndarray
+            Times with shape ``(t_dim, )``.
+        Modes : numpy.ndarray
+            Classical modes with shape ``(t_dim, num_modes)``.
+        Corrs : numpy.ndarray
+            Quadrature correlations with shape ``(t_dim, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        # write arrays before the description
+        os.makedirs(self.dir_path, exist_ok=True)
+        for name, values in zip(['T', 'Modes', 'Corrs'], [T, Modes, Corrs]):
+            with open(os.path.join(self.dir_path, name + '.npy.' + str(os.getpid())), 'wb') as file:
+                np.save(file, np.asarray(values), allow_pickle=False)
+            os.replace(os.path.join(self.dir_path, name + '.npy.' + str(os.getpid())), os.path.join(self.dir_path, name + '.npy'))
+
+        # description
+        meta = {
+            'system': self.params_system,
+            'solver': get_integration_params(self.params_solver),
+            't_dim': len(T)
+        }
+        with open(os.path.join(self.dir_path, 'meta.json.' + str(os.getpid())), 'w') as file:
+            json.dump(meta, file, default=lambda value: value.tolist() if isinstance(value, np.ndarray) else str(value))
+        os.replace(os.path.join(self.dir_path, 'meta.json.' + str(os.getpid())), os.path.join(self.dir_path, 'meta.json'))
+        self.arrays = None
+
+    def get_window(self, t_index_min=None, t_index_max=None):
+        """Method to obtain a window of the trajectory without copying.
+
+        Parameters
+        ----------
+        t_index_min : int, optional
+            Index of the first sample. If ``None``, ``'t_index_min'`` of the solver parameters is used, defaulting to ``0``.
+        t_index_max : int, optional
+            Index after the last sample. If ``None``, ``'t_index_max'`` of the solver parameters is used, defaulting to the number of samples.
+
+        Returns
+        -------
+        T : numpy.memmap
+            Times of the window.
+        Modes : numpy.memmap
+            Classical modes of the window.
+        Corrs : numpy.memmap
+            Quadrature correlations of the window.
+        """
+
+        # open memory maps
+        if self.arrays is None:
+            self.arrays = [np.load(os.path.join(self.dir_path, name + '.npy'), mmap_mode='r') for name in ['T', 'Modes', 'Corrs']]
+
+        # window
+        t_index_min = t_index_min if t_index_min is not None else self.params_solver.get('t_index_min', 0)
+        t_index_max = t_index_max if t_index_max is not None else self.params_solver.get('t_index_max', len(self.arrays[0]))
+
+        return tuple(values[t_index_min:t_index_max] for values in self.arrays)
+
+def get_trajectory_archive(system_class, params_system, params_solver, solver_class=None, archive_dir=None):
+    """Function to obtain the archive of a trajectory, integrating and archiving it on the first call.
+
+    Parameters
+    ----------
+    system_class : class
+        Class of the system.
+    params_system : dict
+        Parameters of the system.
+    params_solver : dict
+        Parameters of the solver.
+    solver_class : class, optional
+        Class of the solver implementing the methods ``get_times`` and ``get_modes_corrs``. If ``None``, :class:`solvers.deterministic.OEMHLESolver` is used.
+    archive_dir : str, optional
+        Directory of the archive. If ``None``, :data:`ARCHIVE_DIR` is used.
+
+    Returns
+    -------
+    archive : :class:`utils.archives.TrajectoryArchive`
+        Archive of the trajectory.
+    """
+
+    # default solver
+    if solver_class is None:
+        from solvers.deterministic import OEMHLESolver
+        solver_class = OEMHLESolver
+
+    # look up trajectory
+    archive = TrajectoryArchive(
+        params_system=params_system,
+        params_solver=params_solver,
+        deps=[system_class, solver_class],
+        archive_dir=archive_dir
+    )
+    if archive.exists():
+        return archive
+
+    # integrate the entire trajectory
+    params_solver_full = copy.deepcopy(params_solver)
+    params_solver_full['t_index_min'] = 0
+    params_solver_full['t_index_max'] = params_solver['t_dim']
+    solver = solver_class(
+        system=system_class(
+            params=params_system
+        ),
+        params=params_solver_full
+    )
+    T = solver.get_times()
+    Modes, Corrs = solver.get_modes_corrs()
+    archive.save(T, Modes, Corrs)
+    logger.info('Archived trajectory {}'.format(archive.dir_path))
+
+    return archive
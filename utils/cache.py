@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing a persistent content-addressed cache of per-point results."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-16"
+__updated__ = "2026-10-17"
+
+# dependencies
+import hashlib
+import inspect
+import json
+import logging
+import numpy as np
+import os
+import sys
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# version of the cached results, included in the keys
+CACHE_VERSION = '1'
+# root directory of the repository
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# default directory of the cached results
+CACHE_DIR = os.path.join(REPO_DIR, 'data', 'cache')
+# default maximum size of the cache in bytes
+CACHE_MAX_SIZE = 2 * 1024**3
+# solver parameters not affecting the results
+IGNORED_KEYS = ['show_progress', 'cache', 'cache_dir', 'cache_max_size']
+# significant digits of the floating-point values in the keys
+NUM_DIGITS = 12
+
+def get_canonical(value):
+    """Function to obtain a canonical form of a parameter value.
+
+    Floating-point values are rounded to :data:`NUM_DIGITS` significant digits so that values obtained from different grids, for example ``2.0`` and ``numpy.linspace(1.9, 2.1, 2001)[1000]``, share the same form.
+
+    Parameters
+    ----------
+    value : any
+        Value of the parameter.
+
+    Returns
+    -------
+    value_canonical : any
+        Canonical form containing only dictionaries with string keys, lists, strings, integers, floats, booleans and ``None``.
+    """
+
+    # containers
+    if isinstance(value, dict):
+        return {str(key): get_canonical(value[key]) for key in value}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [get_canonical(item) for item in value]
+
+    # scalars
+    if value is None:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float('{:.{}g}'.format(float(value), NUM_DIGITS)) + 0.0
+    if isinstance(value, (complex, np.complexfloating)):
+        return [get_canonical(np.real(value)), get_canonical(np.imag(value))]
+
+    return str(value)
+
+def get_local_modules(obj, modules=None):
+    """Function to obtain the modules of the repository that an object depends on.
+
+    For functions, the modules of the global names referenced by their code, including nested functions, are followed.
+    For classes and modules, the modules of all their global names are followed, so that the modules imported by the modules are included recursively.
+    Modules outside the repository and the scripts run as ``__main__`` are not included.
+
+    Parameters
+    ----------
+    obj : callable or class or module
+        Function, class or module.
+    modules : dict, optional
+        Modules already obtained, updated in place. Default is ``None``.
+
+    Returns
+    -------
+    modules : dict
+        Modules of the repository for each name.
+    """
+
+    # extract frequently used variables
+    modules = dict() if modules is None else modules
+
+    # referenced global names of functions
+    if inspect.isfunction(obj):
+        names = set()
+        codes = [obj.__code__]
+        while len(codes) > 0:
+            code = codes.pop()
+            names.update(code.co_names)
+            codes += [const for const in code.co_consts if inspect.iscode(const)]
+        values = [obj.__globals__[name] for name in names if name in obj.__globals__]
+        module = sys.modules.get(obj.__module__, None)
+    else:
+        module = obj if inspect.ismodule(obj) else sys.modules.get(getattr(obj, '__module__', None), None)
+        values = list()
+
+    # module of the object
+    if module is not None and module.__name__ != '__main__' and module.__name__ not in modules:
+        file_path = getattr(module, '__file__', None)
+        if file_path is not None and os.path.abspath(file_path).startswith(REPO_DIR + os.sep):
+            modules[module.__name__] = module
+            values += list(vars(module).values())
+
+    # modules of the global names
+    for value in values:
+        if inspect.ismodule(value):
+            module = value
+        elif isinstance(getattr(value, '__module__', None), str):
+            module = sys.modules.get(value.__module__, None)
+        else:
+            continue
+        if module is not None and module.__name__ not in modules and module.__name__ != '__main__':
+            get_local_modules(module, modules)
+
+    return modules
+
+def get_code_version(*objs):
+    """Function to obtain the version of the code producing the results.
+
+    The version is the hash of :data:`CACHE_VERSION`, the version of the toolbox, the source code of the given objects and the source code of all modules of the repository they depend on, obtained from :func:`get_local_modules`.
+
+    Parameters
+    ----------
+    *objs : callable or class
+        Functions and classes producing the results.
+
+    Returns
+    -------
+    version : str
+        Hash of the code.
+    """
+
+    # version of the toolbox
+    try:
+        import qom
+        toolbox = str(getattr(qom, '__version__', ''))
+    except ImportError:
+        toolbox = ''
+
+    # source codes of the objects
+    sources = list()
+    modules = dict()
+    for obj in objs:
+        try:
+            sources.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            sources.append(getattr(obj, '__qualname__', repr(obj)))
+        get_local_modules(obj, modules)
+
+    # source codes of the modules
+    for name in sorted(modules):
+        try:
+            sources.append(inspect.getsource(modules[name]))
+        except (OSError, TypeError):
+            sources.append(name)
+
+    return hashlib.sha256('\n'.join([CACHE_VERSION, toolbox] + sources).encode('utf-8')).hexdigest()
+
+def get_cache_key(params_system, params_solver, code_version):
+    """Function to obtain the key of a point.
+
+    Parameters
+    ----------
+    params_system : dict
+        Parameters of the system.
+    params_solver : dict
+        Parameters of the solver. The keys in :data:`IGNORED_KEYS` are skipped.
+    code_version : str
+        Version of the code obtained from :func:`get_code_version`.
+
+    Returns
+    -------
+    key : str
+        Hash of the canonical parameters.
+    """
+
+    # canonical parameters
+    params = {
+        'system': get_canonical(params_system),
+        'solver': get_canonical({key: params_solver[key] for key in params_solver if key not in IGNORED_KEYS}),
+        'code': code_version
+    }
+
+    return hashlib.sha256(json.dumps(params, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+class ResultCache():
+    """Class to store per-point results in a directory addressed by their keys.
+
+    Each entry is saved as a separate ``.npz`` file written atomically, so that the cache can be shared by concurrent processes and scripts.
+    Reading an entry updates its modification time and the least-recently used entries are evicted once the total size exceeds the maximum size.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Directory of the cache. If ``None``, :data:`CACHE_DIR` is used.
+    max_size : int, optional
+        Maximum size of the cache in bytes. If ``None``, :data:`CACHE_MAX_SIZE` is used.
+    """
+
+    def __init__(self, cache_dir=None, max_size=None):
+        """Class constructor for ResultCache."""
+
+        # set attributes
+        self.cache_dir = cache_dir if cache_dir is not None else CACHE_DIR
+        self.max_size = max_size if max_size is not None else CACHE_MAX_SIZE
+        self.num_hits = 0
+        self.num_misses = 0
+        # size of the cache, obtained on the first write
+        self.size = None
+
+    def get_file_path(self, key):
+        """Method to obtain the path of an entry.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+
+        Returns
+        -------
+        file_path : str
+            Path of the entry.
+        """
+
+        return os.path.join(self.cache_dir, key[:2], key + '.npz')
+
+    def get(self, key):
+        """Method to obtain the results of an entry.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+
+        Returns
+        -------
+        results : dict
+            Arrays of the entry. If the entry does not exist, ``None`` is returned.
+        """
+
+        # load entry
+        file_path = self.get_file_path(key)
+        try:
+            with np.load(file_path) as file:
+                results = {name: file[name] for name in file.files}
+            os.utime(file_path)
+        except (OSError, ValueError, EOFError):
+            self.num_misses += 1
+            return None
+
+        self.num_hits += 1
+
+        return results
+
+    def put(self, key, results):
+        """Method to save the results of an entry.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        results : dict
+            Arrays of the entry.
+        """
+
+        # write to a temporary file to avoid partial entries across processes
+        file_path = self.get_file_path(key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path + '.' + str(os.getpid()), 'wb') as file:
+            np.savez(file, **results)
+        os.replace(file_path + '.' + str(os.getpid()), file_path)
+
+        # update size
+        if self.size is None:
+            self.size = self.get_size()
+        else:
+            self.size += os.path.getsize(file_path)
+        if self.size > self.max_size:
+            self.evict()
+
+    def get_entries(self):
+        """Method to obtain the entries of the cache.
+
+        Returns
+        -------
+        entries : list
+            Tuples of the modification time, size and path of each entry, sorted by the modification time.
+        """
+
+        # scan directory
+        entries = list()
+        for root, _, file_names in os.walk(self.cache_dir):
+            for file_name in file_names:
+                if not file_name.endswith('.npz'):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, file_name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(root, file_name)))
+
+        return sorted(entries)
+
+    def get_size(self):
+        """Method to obtain the total size of the entries.
+
+        Returns
+        -------
+        size : int
+            Size of the cache in bytes.
+        """
+
+        return sum(entry[1] for entry in self.get_entries())
+
+    def evict(self, size=None):
+        """Method to remove the least-recently used entries.
+
+        Parameters
+        ----------
+        size : int, optional
+            Size of the cache in bytes after the eviction. If ``None``, 90% of the maximum size is used.
+        """
+
+        # extract frequently used variables
+        entries = self.get_entries()
+        size_target = size if size is not None else int(0.9 * self.max_size)
+        self.size = sum(entry[1] for entry in entries)
+
+        # remove oldest entries
+        num_evicted = 0
+        for _, entry_size, file_path in entries:
+            if self.size <= size_target:
+                break
+            try:
+                os.remove(file_path)
+            except OSError:
+                continue
+            self.size -= entry_size
+            num_evicted += 1
+        logger.info('Evicted {} entries from {}'.format(num_evicted, self.cache_dir))
+
+class CachedFunc():
+    """Class to wrap a function of the system parameters with a persistent result cache.
+
+    The key of each point is obtained from the system parameters, the solver parameters and the version of the code, so that overlapping sweeps of different scripts share their results.
+    Instances can be pickled to worker processes when the wrapped function is defined at the module level.
+
+    Parameters
+    ----------
+    func : callable
+        Function formatted as ``func(system_params)``, returning an array or a dictionary of arrays. The latter can be used to cache additional results such as windowed trajectories.
+    params_solver : dict
+        Parameters of the solver used by the function. The optional keys ``'cache_dir'`` and ``'cache_max_size'`` set the directory and the maximum size of the cache.
+    deps : list, optional
+        Functions and classes producing the results, in addition to the function. The modules of the repository that the function and these objects depend on are included in the version of the code. Default is ``None``.
+    """
+
+    def __init__(self, func, params_solver, deps=None):
+        """Class constructor for CachedFunc."""
+
+        # set attributes
+        self.func = func
+        self.params_solver = params_solver
+        self.code_version = get_code_version(func, *(deps if deps is not None else list()))
+        self.cache = ResultCache(
+            cache_dir=params_solver.get('cache_dir', None),
+            max_size=params_solver.get('cache_max_size', None)
+        )
+
+    def __call__(self, system_params):
+        """Method to obtain the results at a point, computing them on a cache miss.
+
+        Parameters
+        ----------
+        system_params : dict
+            Parameters of the system.
+
+        Returns
+        -------
+        results : numpy.ndarray or dict
+            Results of the function.
+        """
+
+        # look up entry
+        key = get_cache_key(system_params, self.params_solver, self.code_version)
+        results = self.cache.get(key)
+        if results is not None:
+            return results['v'] if list(results.keys()) == ['v'] else results
+
+        # compute and save entry
+        v = self.func(system_params)
+        self.cache.put(key, v if isinstance(v, dict) else {'v': v})
+
+        return v
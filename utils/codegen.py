@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to compile symbolic expressions into cached numerical kernels."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-16"
+__updated__ = "2026-10-17"
+
+# dependencies
+import hashlib
+import importlib.util
+import inspect
+import logging
+import numpy as np
+import os
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# version of the generated code, included in the hashes
+CODEGEN_VERSION = '1'
+# default directory of the generated kernels
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'kernels')
+
+# loaded kernels
+_kernels = dict()
+
+def get_kernel(builder, target='numpy', cache_dir=None):
+    """Function to obtain a vectorized kernel for the expressions returned by a builder.
+
+    Loaded kernels are memoized by the builder, the target and the cache directory.
+    Otherwise, the source code of the builder is hashed along with the target and the version of the generated code, so that cached kernels are imported without evaluating the builder and ``sympy`` is only required to generate them.
+    On a cache miss, each polynomial is replaced by the shortest of its expanded, factored and Horner forms, and the expressions are reduced by common-subexpression elimination before being printed into a module inside the cache directory.
+
+    Parameters
+    ----------
+    builder : callable
+        Function returning a tuple ``(args, exprs)`` of lists of ``sympy`` symbols and expressions.
+    target : str, optional
+        Target of the generated code. Options are ``'numpy'`` (fallback) and ``'numba'``. Default is ``'numpy'``.
+    cache_dir : str, optional
+        Directory of the generated kernels. If ``None``, :data:`CACHE_DIR` is used.
+
+    Returns
+    -------
+    kernel : callable
+        Kernel formatted as ``kernel(*args)``, returning the values of the expressions stacked along the last axis.
+    """
+
+    # validate target
+    assert target in ['numpy', 'numba'], "Parameter ``'target'`` can only assume the values ``'numpy'`` and ``'numba'``"
+
+    # look up loaded kernel
+    key_kernel = (builder, target, cache_dir)
+    if key_kernel in _kernels:
+        return _kernels[key_kernel]
+
+    # hash of the derivation
+    key = hashlib.sha256((inspect.getsource(builder) + target + CODEGEN_VERSION).encode('utf-8')).hexdigest()[:16]
+    name = builder.__name__.replace('get_expressions_', '') + '_' + target + '_' + key
+    file_path = os.path.join(cache_dir if cache_dir is not None else CACHE_DIR, name + '.py')
+
+    # generate module on cache miss
+    if not os.path.isfile(file_path):
+        args, exprs = builder()
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # write to a temporary file to avoid partial modules across processes
+        with open(file_path + '.' + str(os.getpid()), 'w') as file:
+            file.write(get_kernel_source(args, exprs, target))
+        os.replace(file_path + '.' + str(os.getpid()), file_path)
+        logger.info('Generated kernel {}'.format(file_path))
+
+    # import module
+    spec = importlib.util.spec_from_file_location(name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    func = module.kernel
+
+    def kernel(*args):
+        return np.stack(np.broadcast_arrays(*func(*args)), axis=-1)
+
+    _kernels[key_kernel] = kernel
+
+    return kernel
+
+def get_kernel_source(args, exprs, target='numpy'):
+    """Function to obtain the source code of a kernel.
+
+    Parameters
+    ----------
+    args : list
+        Symbols of the arguments.
+    exprs : list
+        Expressions to evaluate.
+    target : str, optional
+        Target of the generated code. Options are ``'numpy'`` (fallback) and ``'numba'``. Default is ``'numpy'``.
+
+    Returns
+    -------
+    source : str
+        Source code of the module containing the function ``kernel``.
+    """
+
+    # dependencies
+    import sympy as sp
+    from sympy.printing.numpy import NumPyPrinter
+
+    # compact forms of the polynomial expressions
+    exprs = [sp.sympify(expr) for expr in exprs]
+    exprs_compact = list()
+    for expr in exprs:
+        forms = [expr, sp.factor(expr)]
+        if expr.is_polynomial(*args) and len(expr.free_symbols) > 0:
+            forms.append(sp.horner(expr))
+        exprs_compact.append(min(forms, key=sp.count_ops))
+
+    # common subexpressions
+    replacements, reduced = sp.cse(exprs_compact, symbols=sp.numbered_symbols('x_'), optimizations='basic')
+
+    # names of the arguments
+    printer = NumPyPrinter({'fully_qualified_modules': True})
+    names = ['a_' + str(i) for i in range(len(args))]
+    reduced = [expr.xreplace(dict(zip(args, sp.symbols(names)))) for expr in reduced]
+    replacements = [(symbol, expr.xreplace(dict(zip(args, sp.symbols(names))))) for symbol, expr in replacements]
+
+    # header
+    lines = [
+        '# generated by utils.codegen from the expression hash ' + hashlib.sha256(sp.srepr(exprs).encode('utf-8')).hexdigest(),
+        '# arguments: ' + ', '.join(str(arg) for arg in args),
+        'import numpy'
+    ]
+    if target == 'numba':
+        lines += ['import numba', '', '@numba.njit(cache=True, nogil=True)']
+    else:
+        lines += ['']
+
+    # body
+    lines.append('def kernel(' + ', '.join(names) + '):')
+    for symbol, expr in replacements:
+        lines.append('    ' + str(symbol) + ' = ' + printer.doprint(expr))
+    lines.append('    return (' + ', '.join(printer.doprint(expr) for expr in reduced) + ', )')
+
+    return '\n'.join(lines) + '\n'
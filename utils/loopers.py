@@ -0,0 +1,902 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing loopers to sweep system parameters."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-16"
+__updated__ = "2026-10-17"
+
+# dependencies
+import copy
+import itertools
+import logging
+import multiprocessing
+import numpy as np
+import os
+import time
+
+# local modules
+from utils.schedulers import SweepScheduler
+from utils.stores import SweepStore
+
+# module logger
+logger = logging.getLogger(__name__)
+
+def get_file_path(params):
+    """Function to obtain the path of the file containing the results of a looper.
+
+    The path follows the format of the loopers of the toolbox, for example ``'data/v4.0_qom-v1.0.1/3a_theta=0.0_x=Omegas_1_1.9_2.1_2001.npz'``, with one segment for each of the axes ``'X'``, ``'Y'`` and ``'Z'`` present in the parameters.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters of the looper containing the keys ``'file_path_prefix'`` and ``'X'``, and optionally ``'Y'`` and ``'Z'``.
+
+    Returns
+    -------
+    file_path : str
+        Path of the file. If ``'file_path_prefix'`` is not set, ``None`` is returned.
+    """
+
+    # extract frequently used variables
+    prefix = params.get('file_path_prefix', None)
+    if prefix is None:
+        return None
+
+    # format axes
+    file_path = prefix
+    for axis in [axis for axis in ['X', 'Y', 'Z'] if axis in params]:
+        params_axis = params[axis]
+        idx = '_' + str(params_axis['idx']) if params_axis.get('idx', None) is not None else ''
+        file_path += '_' + axis.lower() + '=' + params_axis['var'] + idx + '_' + str(params_axis['min']) + '_' + str(params_axis['max']) + '_' + str(params_axis['dim'])
+
+    return file_path + '.npz'
+
+def get_store_path(params):
+    """Function to obtain the path of the store containing the partial results of a looper.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters of the looper containing the keys ``'file_path_prefix'`` and ``'X'``.
+
+    Returns
+    -------
+    dir_path : str
+        Path of the directory of the store, formatted as the file path with the extension ``'.store'``. If ``'file_path_prefix'`` is not set, ``None`` is returned.
+    """
+
+    # extract frequently used variables
+    file_path = get_file_path(params)
+
+    return file_path[:- len('.npz')] + '.store' if file_path is not None else None
+
+def get_system_params(params_system, params_X, x):
+    """Function to obtain the system parameters at a value of the looped variable.
+
+    Parameters
+    ----------
+    params_system : dict
+        Base parameters of the system.
+    params_X : dict
+        Parameters of the looped axis containing the keys ``'var'`` and optionally ``'idx'``.
+    x : float
+        Value of the looped variable.
+
+    Returns
+    -------
+    system_params : dict
+        Parameters of the system.
+    """
+
+    # update a copy of the parameters
+    system_params = copy.deepcopy(params_system)
+    if params_X.get('idx', None) is not None:
+        system_params[params_X['var']][params_X['idx']] = x
+    else:
+        system_params[params_X['var']] = x
+
+    return system_params
+
+def get_X_values(params_X):
+    """Function to obtain the values of a looped axis.
+
+    Parameters
+    ----------
+    params_X : dict
+        Parameters of the looped axis containing the keys ``'min'``, ``'max'`` and ``'dim'``. Alternatively, the values can be provided in the key ``'val'``.
+
+    Returns
+    -------
+    X : numpy.ndarray
+        Values of the axis.
+    """
+
+    if params_X.get('val', None) is not None:
+        return np.array(params_X['val'], dtype=np.float_)
+
+    return np.linspace(params_X['min'], params_X['max'], params_X['dim'])
+
+class ContinuationLooper():
+    r"""Class to sweep a system parameter by warm-starting each point from the periodic state of its neighbour.
+
+    The axis is split into contiguous chunks of indices, one for each process, and the points of each chunk are processed in order.
+    The function is called as ``func(system_params, iv_modes, iv_corrs)`` and returns the values along with the solver of the point.
+    For each point after the first point of a chunk, ``iv_modes`` and ``iv_corrs`` are obtained from the ``get_periodic_state`` method of the solver of the previous point, for example :meth:`solvers.deterministic.OEMHLESolver.get_periodic_state` with ``'hle_method'`` set to ``'floquet'`` or with ``'stop_on_convergence'``.
+    If the periodic state is unavailable, the point is started from the initial values of the system.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values and the solver for each point, formatted as ``func(system_params, iv_modes, iv_corrs)``.
+    params : dict
+        Parameters of the looper in the format of the ``XLooper`` of the toolbox. The looper parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        show_progress       (*bool*) option to display the progress of the looper. Default is ``False``.
+        file_path_prefix    (*str*) prefix of the file path to save the results. If ``None``, the results are not saved. Default is ``None``.
+        X                   (*dict*) parameters of the looped axis with the keys ``'var'``, ``'idx'`` (optional), ``'min'``, ``'max'`` and ``'dim'``.
+        ================    ====================================================
+    params_system : dict
+        Base parameters of the system.
+    """
+
+    def __init__(self, func, params, params_system):
+        """Class constructor for ContinuationLooper."""
+
+        # set attributes
+        self.func = func
+        self.params = params
+        self.params_system = params_system
+        self.axes = {
+            'X': {
+                'var': params['X']['var'],
+                'val': get_X_values(params['X'])
+            }
+        }
+        self.results = dict()
+
+    def loop(self, num_processes=None):
+        """Method to run the looper.
+
+        Existing results with the same file path are loaded instead of being recomputed.
+
+        Parameters
+        ----------
+        num_processes : int, optional
+            Number of processes. If ``None``, the number of available cores is used.
+
+        Returns
+        -------
+        results : dict
+            Results of the looper with the key ``'V'``.
+        """
+
+        # load existing results
+        file_path = get_file_path(self.params)
+        if file_path is not None and os.path.isfile(file_path):
+            self.results['V'] = np.load(file_path)['arr_0']
+            return self.results
+
+        # split indices into contiguous chunks
+        dim = len(self.axes['X']['val'])
+        num_processes = min(dim, num_processes if num_processes is not None else multiprocessing.cpu_count())
+        chunks = [chunk for chunk in np.array_split(np.arange(dim), num_processes) if len(chunk) > 0]
+
+        # process chunks
+        if len(chunks) == 1:
+            Vs = [self.loop_chunk(chunks[0])]
+        else:
+            with multiprocessing.Pool(len(chunks)) as pool:
+                Vs = pool.map(self.loop_chunk, chunks)
+        self.results['V'] = np.concatenate(Vs)
+
+        # save results
+        if file_path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            # write to a temporary file to avoid partial results
+            with open(file_path + '.' + str(os.getpid()), 'wb') as file:
+                np.savez_compressed(file, self.results['V'])
+            os.replace(file_path + '.' + str(os.getpid()), file_path)
+
+        return self.results
+
+    def loop_chunk(self, idxs):
+        """Method to process a chunk of contiguous points in order.
+
+        Parameters
+        ----------
+        idxs : numpy.ndarray
+            Indices of the points.
+
+        Returns
+        -------
+        V : numpy.ndarray
+            Values returned by the function for each point.
+        """
+
+        V = list()
+        iv_modes, iv_corrs = None, None
+        for j, i in enumerate(idxs):
+            v, solver = self.func(get_system_params(self.params_system, self.params['X'], self.axes['X']['val'][i]), iv_modes, iv_corrs)
+            V.append(np.asarray(v))
+
+            # warm start of the next point
+            iv_modes, iv_corrs = solver.get_periodic_state()
+
+            # update progress
+            if self.params.get('show_progress', False) and (j + 1) % max(1, int(len(idxs) / 10)) == 0:
+                logger.info('Looping ({:0.0f}%) chunk starting at index {}'.format(100.0 * (j + 1) / len(idxs), idxs[0]))
+
+        return np.array(V)
+
+def run_continuation_looper(func, params, params_system, num_processes=None):
+    """Function to run a continuation looper over contiguous chunks in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values and the solver for each point, formatted as ``func(system_params, iv_modes, iv_corrs)``.
+    params : dict
+        Parameters of the looper.
+    params_system : dict
+        Base parameters of the system.
+    num_processes : int, optional
+        Number of processes. If ``None``, the number of available cores is used.
+
+    Returns
+    -------
+    looper : :class:`utils.loopers.ContinuationLooper`
+        Looper containing the axes and the results.
+    """
+
+    # initialize looper
+    looper = ContinuationLooper(
+        func=func,
+        params=params,
+        params_system=params_system
+    )
+    looper.loop(num_processes=num_processes)
+
+    return looper
+
+class StoredLooper():
+    r"""Class to sweep a system parameter while writing the result of each point to a resumable store.
+
+    The results are written to a :class:`utils.stores.SweepStore` next to the file path of the looper as soon as each point is computed, so that an interrupted sweep resumes from the pending points.
+    The pending points are distributed by a :class:`utils.schedulers.SweepScheduler` and the utilization of each worker is available in the attribute ``stats`` after the loop.
+    Once all points are done, the results are saved to the file path in the format of the ``XLooper`` of the toolbox.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values for each point, formatted as ``func(system_params)``.
+    params : dict
+        Parameters of the looper in the format of the ``XLooper`` of the toolbox. The looper parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        show_progress       (*bool*) option to display the progress of the looper. Default is ``False``.
+        file_path_prefix    (*str*) prefix of the file path to save the results. If ``None``, the results are neither stored nor saved. Default is ``None``.
+        chunk_time          (*float*) target duration of each scheduled chunk in seconds. Default is ``10.0``.
+        X                   (*dict*) parameters of the looped axis with the keys ``'var'``, ``'idx'`` (optional), ``'min'``, ``'max'`` and ``'dim'``.
+        ================    ====================================================
+    params_system : dict
+        Base parameters of the system.
+    """
+
+    def __init__(self, func, params, params_system):
+        """Class constructor for StoredLooper."""
+
+        # set attributes
+        self.func = func
+        self.params = params
+        self.params_system = params_system
+        self.axes = {
+            'X': {
+                'var': params['X']['var'],
+                'val': get_X_values(params['X'])
+            }
+        }
+        self.results = dict()
+        self.stats = list()
+
+    def loop(self, num_processes=None):
+        """Method to run the looper.
+
+        Existing results with the same file path are loaded instead of being recomputed.
+
+        Parameters
+        ----------
+        num_processes : int, optional
+            Number of processes. If ``None``, the number of available cores is used.
+
+        Returns
+        -------
+        results : dict
+            Results of the looper with the key ``'V'``.
+        """
+
+        # load existing results
+        file_path = get_file_path(self.params)
+        if file_path is not None and os.path.isfile(file_path):
+            self.results['V'] = np.load(file_path)['arr_0']
+            return self.results
+
+        # extract frequently used variables
+        X = self.axes['X']['val']
+        dir_path = get_store_path(self.params)
+
+        # create store from the first point
+        idxs = np.arange(len(X))
+        if dir_path is not None:
+            store = SweepStore(dir_path)
+            resumed = store.exists()
+            if not resumed:
+                v = np.asarray(self.func(self.get_system_params(0)))
+                store.create(len(X), v.shape, v.dtype, meta={'var': self.params['X']['var'], 'val': X.tolist()})
+                store.write(0, v)
+                store.close()
+            idxs = store.get_pending()
+            if resumed:
+                logger.info('Resuming {} of {} points from {}'.format(len(idxs), len(X), dir_path))
+
+        # evaluate pending points
+        scheduler = SweepScheduler(
+            func=self.func,
+            get_params=self.get_system_params,
+            num_processes=num_processes,
+            chunk_time=self.params.get('chunk_time', 10.0),
+            show_progress=self.params.get('show_progress', False)
+        )
+        V = scheduler.run(idxs, len(X), dir_path)
+        self.stats = scheduler.stats
+
+        # collect results
+        if dir_path is not None:
+            V, done = store.read()
+            assert np.all(done), "Store at ``'{}'`` contains pending points".format(dir_path)
+        self.results['V'] = V
+
+        # save results
+        if file_path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            np.savez_compressed(file_path, self.results['V'])
+
+        return self.results
+
+    def get_system_params(self, i):
+        """Method to obtain the system parameters at a point.
+
+        Parameters
+        ----------
+        i : int
+            Index of the point.
+
+        Returns
+        -------
+        system_params : dict
+            Parameters of the system.
+        """
+
+        return get_system_params(self.params_system, self.params['X'], self.axes['X']['val'][i])
+
+def run_stored_looper(func, params, params_system, num_processes=None):
+    """Function to run a resumable looper over dynamically scheduled chunks of pending points in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values for each point, formatted as ``func(system_params)``.
+    params : dict
+        Parameters of the looper.
+    params_system : dict
+        Base parameters of the system.
+    num_processes : int, optional
+        Number of processes. If ``None``, the number of available cores is used.
+
+    Returns
+    -------
+    looper : :class:`utils.loopers.StoredLooper`
+        Looper containing the axes and the results.
+    """
+
+    # initialize looper
+    looper = StoredLooper(
+        func=func,
+        params=params,
+        params_system=params_system
+    )
+    looper.loop(num_processes=num_processes)
+
+    return looper
+
+class MapLooper():
+    r"""Class to map a function over a grid of system parameters in tiles written to a resumable store.
+
+    The grid spanned by the axes ``'X'``, ``'Y'`` and optionally ``'Z'`` is split into tiles of ``tile_dim`` points along each axis.
+    Each tile is evaluated as a single unit by a :class:`utils.schedulers.SweepScheduler` and checkpointed in a :class:`utils.stores.SweepStore` next to the file path of the looper, so that an interrupted map resumes from the pending tiles.
+    Several processes started with the same parameters act as nodes sharing the store, whose workers claim the next pending tile as soon as they finish one, so that faster workers evaluate more tiles.
+    The claim of a tile is renewed after each of its points, so that the tiles of failed nodes are taken over once their claims are not renewed within ``claim_timeout``, independent of ``tile_dim``.
+    Once all tiles are done, the map is assembled and saved to the file path by each node.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values for each point, formatted as ``func(system_params)``.
+    params : dict
+        Parameters of the looper. The looper parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        show_progress       (*bool*) option to display the progress of the looper. Default is ``False``.
+        file_path_prefix    (*str*) prefix of the file path to save the results. If ``None``, the results are neither stored nor saved. Default is ``None``.
+        chunk_time          (*float*) target duration of each scheduled chunk of tiles in seconds. Default is ``10.0``.
+        tile_dim            (*int*) number of points of each tile along each axis. Default is ``32``.
+        claim_timeout       (*float*) age in seconds since the last renewal after which the claim of a pending tile is taken over by another node. It should exceed the duration of a single point. Default is ``3600.0``.
+        poll_time           (*float*) interval in seconds between the checks of the tiles claimed by other nodes. Default is ``10.0``.
+        X                   (*dict*) parameters of the first axis with the keys ``'var'``, ``'idx'`` (optional), ``'min'``, ``'max'`` and ``'dim'``.
+        Y                   (*dict*) parameters of the second axis in the format of ``'X'``.
+        Z                   (*dict*) parameters of the optional third axis in the format of ``'X'``.
+        ================    ====================================================
+    params_system : dict
+        Base parameters of the system.
+    """
+
+    def __init__(self, func, params, params_system):
+        """Class constructor for MapLooper."""
+
+        # set attributes
+        self.func = func
+        self.params = params
+        self.params_system = params_system
+        self.axes = dict()
+        for axis in [axis for axis in ['X', 'Y', 'Z'] if axis in params]:
+            self.axes[axis] = {
+                'var': params[axis]['var'],
+                'val': get_X_values(params[axis])
+            }
+        self.results = dict()
+        self.stats = list()
+
+        # tiles
+        self.shape = tuple(len(self.axes[axis]['val']) for axis in self.axes)
+        self.tile_shape = tuple(min(params.get('tile_dim', 32), dim) for dim in self.shape)
+        self.tiles_shape = tuple(- (- dim // tile_dim) for dim, tile_dim in zip(self.shape, self.tile_shape))
+        self.num_tiles = int(np.prod(self.tiles_shape))
+
+    def loop(self, num_processes=None):
+        """Method to run the looper.
+
+        Existing results with the same file path are loaded instead of being recomputed.
+
+        Parameters
+        ----------
+        num_processes : int, optional
+            Number of processes of the current node. If ``None``, the number of available cores is used.
+
+        Returns
+        -------
+        results : dict
+            Results of the looper with the key ``'V'`` containing the map with shape ``(len(X), len(Y), ...)`` followed by the shape of the values.
+        """
+
+        # load existing results
+        file_path = get_file_path(self.params)
+        if file_path is not None and os.path.isfile(file_path):
+            self.results['V'] = np.load(file_path)['arr_0']
+            return self.results
+
+        # extract frequently used variables
+        dir_path = get_store_path(self.params)
+        num_processes = num_processes if num_processes is not None else multiprocessing.cpu_count()
+        scheduler = SweepScheduler(
+            func=self.get_tile_values,
+            get_params=self.get_tile_params,
+            num_processes=num_processes,
+            chunk_time=self.params.get('chunk_time', 10.0),
+            show_progress=self.params.get('show_progress', False),
+            claim_timeout=self.params.get('claim_timeout', 3600.0)
+        )
+
+        # evaluate all tiles without a store
+        if dir_path is None:
+            self.results['V'] = self.get_map(scheduler.run(np.arange(self.num_tiles), self.num_tiles))
+            self.stats = scheduler.stats
+            return self.results
+
+        # create store from the first tile
+        store = SweepStore(dir_path)
+        resumed = store.exists()
+        if not resumed:
+            V_tile = self.get_tile_values(self.get_tile_params(0))
+            store.create(self.num_tiles, V_tile.shape, V_tile.dtype, meta={axis: self.axes[axis]['val'].tolist() for axis in self.axes})
+            store.write(0, V_tile)
+            store.close()
+        idxs = store.get_pending()
+        if resumed:
+            logger.info('Resuming {} of {} tiles from {}'.format(len(idxs), self.num_tiles, dir_path))
+
+        # evaluate tiles claimed by the workers until all tiles are done
+        while len(idxs) > 0:
+            scheduler.run(idxs, self.num_tiles, dir_path)
+            self.stats += scheduler.stats
+            idxs = store.get_pending()
+
+            # wait for the tiles claimed by other nodes
+            if len(idxs) > 0:
+                time.sleep(self.params.get('poll_time', 10.0))
+
+        # collect tiles
+        V_tiles, done = store.read()
+        assert np.all(done), "Store at ``'{}'`` contains pending tiles".format(dir_path)
+        self.results['V'] = self.get_map(V_tiles)
+
+        # save results
+        if file_path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            # write to a temporary file to avoid partial results across nodes
+            with open(file_path + '.' + str(os.getpid()), 'wb') as file:
+                np.savez_compressed(file, self.results['V'])
+            os.replace(file_path + '.' + str(os.getpid()), file_path)
+
+        return self.results
+
+    def get_map(self, V_tiles):
+        """Method to assemble the map from the values of the tiles.
+
+        Parameters
+        ----------
+        V_tiles : numpy.ndarray
+            Values of the tiles with shape ``(num_tiles, num_points_tile, ...)``.
+
+        Returns
+        -------
+        V : numpy.ndarray
+            Map with shape ``(len(X), len(Y), ...)`` followed by the shape of the values.
+        """
+
+        # extract frequently used variables
+        dim = len(self.shape)
+        shape_v = V_tiles.shape[2:]
+
+        # interleave the axes of the tiles and of the points in each tile
+        V = V_tiles.reshape(self.tiles_shape + self.tile_shape + shape_v)
+        V = V.transpose(tuple(j for i in range(dim) for j in (i, dim + i)) + tuple(range(2 * dim, V.ndim)))
+        V = V.reshape(tuple(num_tiles * tile_dim for num_tiles, tile_dim in zip(self.tiles_shape, self.tile_shape)) + shape_v)
+
+        return V[tuple(slice(0, dim_axis) for dim_axis in self.shape)]
+
+    def get_system_params(self, idxs):
+        """Method to obtain the system parameters at a point of the grid.
+
+        Parameters
+        ----------
+        idxs : tuple
+            Indices of the point along each axis.
+
+        Returns
+        -------
+        system_params : dict
+            Parameters of the system.
+        """
+
+        # update each looped variable
+        system_params = self.params_system
+        for axis, i in zip(self.axes, idxs):
+            system_params = get_system_params(system_params, self.params[axis], self.axes[axis]['val'][i])
+
+        return system_params
+
+    def get_tile_params(self, k):
+        """Method to obtain the system parameters of the points of a tile.
+
+        Parameters
+        ----------
+        k : int
+            Index of the tile.
+
+        Returns
+        -------
+        tile_params : tuple
+            Index of the tile and the parameters of the system for each point inside the grid, in row-major order of the tile.
+        """
+
+        # ranges of the tile along each axis
+        idxs_tile = np.unravel_index(k, self.tiles_shape)
+        ranges = [range(i * tile_dim, i * tile_dim + tile_dim) for i, tile_dim in zip(idxs_tile, self.tile_shape)]
+
+        return k, [self.get_system_params(idxs) if all(i < dim for i, dim in zip(idxs, self.shape)) else None for idxs in itertools.product(*ranges)]
+
+    def get_tile_values(self, tile_params):
+        """Method to evaluate the function at the points of a tile.
+
+        The claim of the tile in the store is renewed after each point.
+
+        Parameters
+        ----------
+        tile_params : tuple
+            Index of the tile and the parameters of the system for each point of the tile, with ``None`` for the points outside the grid.
+
+        Returns
+        -------
+        V : numpy.ndarray
+            Values of the points with a leading axis of length ``num_points_tile``. Entries of the points outside the grid are ``nan``.
+        """
+
+        # extract frequently used variables
+        k, system_params_list = tile_params
+        dir_path = get_store_path(self.params)
+        store = SweepStore(dir_path) if dir_path is not None else None
+
+        # evaluate points inside the grid
+        vs = list()
+        for system_params in system_params_list:
+            vs.append(np.asarray(self.func(system_params)) if system_params is not None else None)
+            if store is not None:
+                store.renew(k)
+        v_0 = next(v for v in vs if v is not None)
+
+        # pad points outside the grid
+        V = np.full((len(vs), ) + v_0.shape, np.nan, dtype=np.result_type(v_0.dtype, np.float_))
+        for i, v in enumerate(vs):
+            if v is not None:
+                V[i] = v
+
+        return V
+
+def run_map_looper(func, params, params_system, num_processes=None):
+    """Function to run a tiled looper over a grid of system parameters in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values for each point, formatted as ``func(system_params)``.
+    params : dict
+        Parameters of the looper.
+    params_system : dict
+        Base parameters of the system.
+    num_processes : int, optional
+        Number of processes of the current node. If ``None``, the number of available cores is used.
+
+    Returns
+    -------
+    looper : :class:`utils.loopers.MapLooper`
+        Looper containing the axes and the results.
+    """
+
+    # initialize looper
+    looper = MapLooper(
+        func=func,
+        params=params,
+        params_system=params_system
+    )
+    looper.loop(num_processes=num_processes)
+
+    return looper
+
+class AdaptiveLooper():
+    r"""Class to sweep a system parameter by recursively bisecting the intervals where the results vary rapidly.
+
+    The sweep starts from ``dim_coarse`` points of the uniform grid of ``dim`` points and bisects an interval between consecutive points :math:`x_{k}` and :math:`x_{k + 1}` if either
+        * the estimated error of the linear interpolation at its midpoint, :math:`\left| f \left[ x_{k - 1}, x_{k}, x_{k + 1} \right] \right| (x_{k + 1} - x_{k})^{2} / 4` or its counterpart with :math:`x_{k + 2}`, exceeds ``tol`` times the range of the values, or
+        * one of its endpoints is a local extremum whose adjacent differences exceed ``tol`` times the range of the values,
+    for any component of the values, until no interval is marked or the intervals reach the spacing of the uniform grid.
+    The points of each refinement are evaluated in parallel by a :class:`utils.schedulers.SweepScheduler`.
+    As all points lie on the uniform grid, the results can be shared with uniform sweeps through :class:`utils.cache.CachedFunc`.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values for each point, formatted as ``func(system_params)``.
+    params : dict
+        Parameters of the looper in the format of the ``XLooper`` of the toolbox. The looper parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        show_progress       (*bool*) option to display the progress of the looper. Default is ``False``.
+        file_path_prefix    (*str*) prefix of the file path to save the results. If ``None``, the results are not saved. Default is ``None``.
+        chunk_time          (*float*) target duration of each scheduled chunk in seconds. Default is ``10.0``.
+        dim_coarse          (*int*) number of points of the initial grid. Default is ``65``.
+        tol                 (*float*) tolerance of the interpolation error relative to the range of the values. Default is ``1e-3``.
+        X                   (*dict*) parameters of the looped axis with the keys ``'var'``, ``'idx'`` (optional), ``'min'``, ``'max'`` and ``'dim'``, where ``'dim'`` of at least ``2`` sets the finest resolution.
+        ================    ====================================================
+    params_system : dict
+        Base parameters of the system.
+    """
+
+    def __init__(self, func, params, params_system):
+        """Class constructor for AdaptiveLooper."""
+
+        # set attributes
+        self.func = func
+        self.params = params
+        self.params_system = params_system
+        self.X_fine = get_X_values(params['X'])
+        assert len(self.X_fine) >= 2, "Parameter ``'dim'`` of ``'X'`` should be at least ``2`` for the adaptive sweep"
+        self.axes = {
+            'X': {
+                'var': params['X']['var'],
+                'val': None
+            }
+        }
+        self.results = dict()
+        self.stats = list()
+
+    def loop(self, num_processes=None):
+        """Method to run the looper.
+
+        Existing results with the same file path are loaded instead of being recomputed.
+
+        Parameters
+        ----------
+        num_processes : int, optional
+            Number of processes. If ``None``, the number of available cores is used.
+
+        Returns
+        -------
+        results : dict
+            Results of the looper with the key ``'V'`` for the values at the evaluated points, whose values are set in ``axes['X']['val']``.
+        """
+
+        # load existing results
+        file_path = self.get_file_path()
+        if file_path is not None and os.path.isfile(file_path):
+            with np.load(file_path) as file:
+                self.axes['X']['val'] = file['X']
+                self.results['V'] = file['V']
+            return self.results
+
+        # extract frequently used variables
+        dim = len(self.X_fine)
+        tol = self.params.get('tol', 1e-3)
+        scheduler = SweepScheduler(
+            func=self.func,
+            get_params=self.get_system_params,
+            num_processes=num_processes,
+            chunk_time=self.params.get('chunk_time', 10.0)
+        )
+
+        # initial grid
+        idxs = np.unique(np.rint(np.linspace(0, dim - 1, min(dim, self.params.get('dim_coarse', 65)))).astype(np.int_))
+        V = None
+        num_refinements = 0
+        while len(idxs) > 0:
+            # evaluate new points
+            _V = scheduler.run(idxs, dim)
+            self.stats.append(scheduler.stats)
+            if V is None:
+                V = np.full(_V.shape, np.nan, dtype=np.result_type(_V.dtype, np.float_))
+                evaluated = np.zeros(dim, dtype=np.bool_)
+            V[idxs] = _V[idxs]
+            evaluated[idxs] = True
+
+            # bisect marked intervals
+            idxs_eval = np.flatnonzero(evaluated)
+            marked = self.get_marked_intervals(self.X_fine[idxs_eval], V[idxs_eval].reshape((len(idxs_eval), -1)), tol)
+            idxs = np.unique((idxs_eval[:-1][marked] + idxs_eval[1:][marked]) // 2)
+            idxs = idxs[~ evaluated[idxs]]
+            num_refinements += 1
+
+            # update progress
+            if self.params.get('show_progress', False):
+                logger.info('Refinement {}: {} points evaluated, {} points added'.format(num_refinements, int(np.sum(evaluated)), len(idxs)))
+
+        # update results
+        self.axes['X']['val'] = self.X_fine[evaluated]
+        self.results['V'] = V[evaluated]
+
+        # save results
+        if file_path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            np.savez_compressed(file_path, X=self.axes['X']['val'], V=self.results['V'])
+
+        return self.results
+
+    def get_file_path(self):
+        """Method to obtain the path of the file containing the results.
+
+        Returns
+        -------
+        file_path : str
+            Path of the file formatted as that of the uniform sweep with the suffix ``'_tol=<tol>_adaptive'``. If ``'file_path_prefix'`` is not set, ``None`` is returned.
+        """
+
+        # extract frequently used variables
+        file_path = get_file_path(self.params)
+
+        return file_path[:- len('.npz')] + '_tol=' + str(self.params.get('tol', 1e-3)) + '_adaptive.npz' if file_path is not None else None
+
+    def get_marked_intervals(self, X, V, tol):
+        """Method to mark the intervals to bisect.
+
+        Parameters
+        ----------
+        X : numpy.ndarray
+            Sorted values of the evaluated points.
+        V : numpy.ndarray
+            Values of the evaluated points with shape ``(len(X), num_components)``.
+        tol : float
+            Tolerance relative to the range of the values.
+
+        Returns
+        -------
+        marked : numpy.ndarray
+            Boolean mask of length ``len(X) - 1`` marking the intervals to bisect.
+        """
+
+        # extract frequently used variables
+        V = np.nan_to_num(np.real(V))
+        h = np.diff(X)
+        dV = np.diff(V, axis=0) / h[:, None]
+        tols = tol * np.maximum(np.ptp(V, axis=0), np.finfo(np.float_).tiny)
+        marked = np.zeros(len(h), dtype=np.bool_)
+        if len(h) < 2:
+            return marked
+
+        # second divided differences over consecutive triples
+        ddV = np.abs(np.diff(dV, axis=0)) / (X[2:] - X[:-2])[:, None]
+        errors = np.zeros(dV.shape, dtype=np.float_)
+        errors[:-1] = ddV
+        errors[1:] = np.maximum(errors[1:], ddV)
+        marked |= np.any(errors * (h**2 / 4.0)[:, None] > tols, axis=1)
+
+        # local extrema with significant variations
+        jumps = np.abs(np.diff(V, axis=0))
+        extrema = np.any((dV[:-1] * dV[1:] < 0.0) & (jumps[:-1] + jumps[1:] > tols), axis=1)
+        marked[:-1] |= extrema
+        marked[1:] |= extrema
+
+        # intervals at the finest resolution
+        marked &= h > 1.5 * (self.X_fine[1] - self.X_fine[0])
+
+        return marked
+
+    def get_system_params(self, i):
+        """Method to obtain the system parameters at a point of the uniform grid.
+
+        Parameters
+        ----------
+        i : int
+            Index of the point.
+
+        Returns
+        -------
+        system_params : dict
+            Parameters of the system.
+        """
+
+        return get_system_params(self.params_system, self.params['X'], self.X_fine[i])
+
+def run_adaptive_looper(func, params, params_system, num_processes=None):
+    """Function to run an adaptively refined looper in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values for each point, formatted as ``func(system_params)``.
+    params : dict
+        Parameters of the looper.
+    params_system : dict
+        Base parameters of the system.
+    num_processes : int, optional
+        Number of processes. If ``None``, the number of available cores is used.
+
+    Returns
+    -------
+    looper : :class:`utils.loopers.AdaptiveLooper`
+        Looper containing the axes and the results.
+    """
+
+    # initialize looper
+    looper = AdaptiveLooper(
+        func=func,
+        params=params,
+        params_system=params_system
+    )
+    looper.loop(num_processes=num_processes)
+
+    return looper
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing precomputed modulation waveforms shared across parameter points."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-16"
+__updated__ = "2026-10-17"
+
+# dependencies
+from collections import OrderedDict
+import numpy as np
+
+# maximum number of shared schedules per process
+MAX_SCHEDULES = 8
+
+# shared schedules, ordered from the least to the most recently used
+_schedules = OrderedDict()
+
+class ModulationSchedule():
+    r"""Class to tabulate the unit waveforms of the laser, voltage and spring constant modulations over a uniform grid of times.
+
+    The waveforms :math:`e^{i \Omega_{l} t}`, :math:`e^{i \Omega_{v} t}` and :math:`\cos (\Omega_{s} t)` or :math:`\sin (\Omega_{s} t)` depend only on the modulation frequencies and the type of the spring constant modulation, so that a single schedule serves all parameter points sharing them.
+    Only times equal to the tabulated times are read from the tables, while the remaining times are evaluated exactly.
+
+    Parameters
+    ----------
+    Omegas : list
+        Laser and voltage modulation frequencies and the spring constant modulation frequency, in the format :math:`\left[ \Omega_{l}, \Omega_{v}, \Omega_{s} \right]`.
+    t_mod : str
+        Type of modulation for the mechanical spring constant. Options are ``'cos'`` (fallback) for cosinusoidal, ``'sin'`` for sinusoidal.
+    T : numpy.ndarray
+        Uniformly spaced times.
+    num_subdivisions : int, optional
+        Number of tabulated intervals between two consecutive times, for example ``2 * num_substeps`` to include the intermediate stages of a fixed-step Runge-Kutta method. The given times are tabulated as they are. Default is ``1``.
+    """
+
+    def __init__(self, Omegas, t_mod, T, num_subdivisions=1):
+        """Class constructor for ModulationSchedule."""
+
+        # set attributes
+        self.Omegas = tuple(float(Omega) for Omega in Omegas)
+        self.t_mod = t_mod
+        self.num_subdivisions = num_subdivisions
+        self.t_min = float(T[0])
+        self.dt = float(T[-1] - T[0]) / ((len(T) - 1) * num_subdivisions) if len(T) > 1 else 1.0
+
+        # tabulated times containing the given times
+        T = np.asarray(T, dtype=np.float_)
+        self.T_table = np.append(np.ravel(T[:-1, None] + (T[1:] - T[:-1])[:, None] * np.arange(num_subdivisions) / num_subdivisions), T[-1])
+
+        # tabulate waveforms
+        self.E_l, self.E_v, self.W_s = self.get_waveforms_exact(self.T_table)
+        self.num_lookups = 0
+
+    def get_index(self, t):
+        """Method to obtain the index of a tabulated time.
+
+        Parameters
+        ----------
+        t : float
+            Time.
+
+        Returns
+        -------
+        idx : int
+            Index of the time in the tables. If the time is not tabulated, ``None`` is returned.
+        """
+
+        idx = int(round((t - self.t_min) / self.dt))
+
+        return idx if 0 <= idx < len(self.T_table) and self.T_table[idx] == t else None
+
+    def get_times(self, t_start, t_stop):
+        """Method to obtain the tabulated times between two times.
+
+        Parameters
+        ----------
+        t_start : float
+            Initial time.
+        t_stop : float
+            Final time.
+
+        Returns
+        -------
+        Ts : numpy.ndarray
+            Tabulated times from ``t_start`` to ``t_stop``, both inclusive. If either time is not tabulated, ``num_subdivisions + 1`` uniformly spaced times are returned.
+        """
+
+        # indices of the times
+        idx_start = self.get_index(t_start)
+        idx_stop = self.get_index(t_stop)
+        if idx_start is None or idx_stop is None:
+            return np.linspace(t_start, t_stop, self.num_subdivisions + 1)
+
+        return self.T_table[idx_start:idx_stop + 1]
+
+    def get_waveforms(self, t):
+        r"""Method to obtain the unit waveforms, using the tables at tabulated times.
+
+        Parameters
+        ----------
+        t : float or numpy.ndarray
+            Times at which the waveforms are obtained.
+
+        Returns
+        -------
+        E_l : complex or numpy.ndarray
+            Laser waveform :math:`e^{i \Omega_{l} t}`.
+        E_v : complex or numpy.ndarray
+            Voltage waveform :math:`e^{i \Omega_{v} t}`.
+        W_s : float or numpy.ndarray
+            Spring constant waveform.
+        """
+
+        # single time
+        if np.ndim(t) == 0:
+            idx = self.get_index(t)
+            if idx is not None:
+                self.num_lookups += 1
+                return self.E_l[idx], self.E_v[idx], self.W_s[idx]
+            return self.get_waveforms_exact(t)
+
+        # nearest tabulated indices
+        t = np.asarray(t, dtype=np.float_)
+        idxs = np.rint((t - self.t_min) / self.dt).astype(np.int_)
+        on_grid = (idxs >= 0) & (idxs < len(self.T_table))
+        on_grid[on_grid] = self.T_table[idxs[on_grid]] == t[on_grid]
+
+        # multiple times
+        E_l, E_v, W_s = (np.empty(np.shape(t), dtype=np.complex_), np.empty(np.shape(t), dtype=np.complex_), np.empty(np.shape(t), dtype=np.float_))
+        E_l[on_grid], E_v[on_grid], W_s[on_grid] = self.E_l[idxs[on_grid]], self.E_v[idxs[on_grid]], self.W_s[idxs[on_grid]]
+        E_l[~ on_grid], E_v[~ on_grid], W_s[~ on_grid] = self.get_waveforms_exact(t[~ on_grid])
+        self.num_lookups += int(np.sum(on_grid))
+
+        return E_l, E_v, W_s
+
+    def get_waveforms_exact(self, t):
+        r"""Method to evaluate the unit waveforms.
+
+        Parameters
+        ----------
+        t : float or numpy.ndarray
+            Times at which the waveforms are evaluated.
+
+        Returns
+        -------
+        E_l : complex or numpy.ndarray
+            Laser waveform :math:`e^{i \Omega_{l} t}`.
+        E_v : complex or numpy.ndarray
+            Voltage waveform :math:`e^{i \Omega_{v} t}`.
+        W_s : float or numpy.ndarray
+            Spring constant waveform.
+        """
+
+        # extract frequently used variables
+        Omega_l, Omega_v, Omega_s = self.Omegas
+
+        return np.exp(1j * Omega_l * t), np.exp(1j * Omega_v * t), np.sin(Omega_s * t) if self.t_mod == 'sin' else np.cos(Omega_s * t)
+
+def get_modulation_schedule(Omegas, t_mod, T, num_subdivisions=1):
+    """Function to obtain the shared schedule for a set of modulation frequencies and times.
+
+    Schedules are created once per process and reused for all parameter points with the same frequencies, type of modulation and times.
+    Schedules created before the worker processes are forked are shared with the workers.
+    At most :data:`MAX_SCHEDULES` schedules are retained, evicting the least recently used one.
+
+    Parameters
+    ----------
+    Omegas : list
+        Laser and voltage modulation frequencies and the spring constant modulation frequency.
+    t_mod : str
+        Type of modulation for the mechanical spring constant.
+    T : numpy.ndarray
+        Uniformly spaced times.
+    num_subdivisions : int, optional
+        Number of tabulated intervals between two consecutive times. Default is ``1``.
+
+    Returns
+    -------
+    schedule : :class:`utils.modulations.ModulationSchedule`
+        Shared schedule.
+    """
+
+    # key of the schedule
+    key = (tuple(float(Omega) for Omega in Omegas), t_mod, float(T[0]), float(T[-1]), len(T), num_subdivisions)
+    if key in _schedules:
+        _schedules.move_to_end(key)
+        return _schedules[key]
+
+    # evict least recently used schedules
+    while len(_schedules) >= MAX_SCHEDULES:
+        _schedules.popitem(last=False)
+    _schedules[key] = ModulationSchedule(Omegas, t_mod, T, num_subdivisions)
+
+    return _schedules[key]
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing a load-balanced scheduler for sweeps over independent points."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import logging
+import math
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+from queue import Empty
+import time
+
+# local modules
+from utils.stores import SweepStore
+
+# module logger
+logger = logging.getLogger(__name__)
+
+class SweepScheduler():
+    r"""Class to evaluate a function over the points of a sweep with dynamically scheduled chunks.
+
+    Each worker process receives the function and the parameters once at startup and repeatedly claims the next chunk of pending points from a shared counter, so that workers finishing early continue with the remaining points instead of idling.
+    The size of each chunk is the larger of ``min_chunk_size`` and the guided size :math:`\lceil N_{\mathrm{rem}} / (2 N_{\mathrm{proc}}) \rceil`, capped by the number of points the worker evaluates in ``chunk_time`` at its measured rate. The first chunk of each worker contains ``min_chunk_size`` points to measure this rate.
+    The results are written directly to a :class:`utils.stores.SweepStore` or to a shared memory block instead of being pickled back.
+    With ``claim_timeout`` set, each point of a store is claimed right before its evaluation and skipped if it is done or claimed by another process, so that several schedulers can share the same store.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values for each point, formatted as ``func(params)``.
+    get_params : callable
+        Function returning the parameters of a point from its index, formatted as ``get_params(i)``.
+    num_processes : int, optional
+        Number of processes. If ``None``, the number of available cores is used.
+    chunk_time : float, optional
+        Target duration of each chunk in seconds. Default is ``10.0``.
+    min_chunk_size : int, optional
+        Minimum number of points in each chunk. Default is ``1``.
+    show_progress : bool, optional
+        Option to display the progress after each chunk. Default is ``False``.
+    claim_timeout : float, optional
+        Age in seconds after which the claim of a point in the store is stale, passed to :meth:`utils.stores.SweepStore.claim`. If ``None``, the points are evaluated without claims. Default is ``None``.
+    """
+
+    def __init__(self, func, get_params, num_processes=None, chunk_time=10.0, min_chunk_size=1, show_progress=False, claim_timeout=None):
+        """Class constructor for SweepScheduler."""
+
+        # set attributes
+        self.func = func
+        self.get_params = get_params
+        self.num_processes = num_processes if num_processes is not None else multiprocessing.cpu_count()
+        self.chunk_time = chunk_time
+        self.min_chunk_size = min_chunk_size
+        self.show_progress = show_progress
+        self.claim_timeout = claim_timeout
+        self.stats = list()
+
+    def run(self, idxs, num_points, dir_path=None):
+        """Method to evaluate the function at the given points.
+
+        Parameters
+        ----------
+        idxs : numpy.ndarray
+            Indices of the points to evaluate.
+        num_points : int
+            Total number of points of the sweep.
+        dir_path : str, optional
+            Path of an existing store to write the results to. If ``None``, the results are collected in shared memory. Default is ``None``.
+
+        Returns
+        -------
+        V : numpy.ndarray
+            Values of all points with a leading axis of length ``num_points`` if ``dir_path`` is ``None``, else ``None``. Entries of the points not in ``idxs`` are undefined.
+        """
+
+        # extract frequently used variables
+        idxs = np.asarray(idxs, dtype=np.int_)
+        num_processes = max(1, min(len(idxs), self.num_processes))
+        shm = None
+        V = None
+        t_start = time.perf_counter()
+
+        # shared memory from the first point
+        if dir_path is None:
+            if len(idxs) == 0:
+                return None
+            v = np.asarray(self.func(self.get_params(idxs[0])))
+            shm = shared_memory.SharedMemory(create=True, size=max(1, num_points * v.nbytes))
+            V = np.ndarray((num_points, ) + v.shape, dtype=v.dtype, buffer=shm.buf)
+            V[idxs[0]] = v
+            idxs = idxs[1:]
+            sink = (shm.name, V.shape, V.dtype.str)
+        else:
+            sink = dir_path
+
+        # shared state
+        counter = multiprocessing.Value('l', 0)
+        queue = multiprocessing.Queue()
+
+        try:
+            # run in the current process
+            if num_processes == 1:
+                run_worker(self, idxs, counter, sink, queue, 0, t_start)
+                self.stats = [queue.get()]
+            # run in worker processes
+            else:
+                workers = [multiprocessing.Process(target=run_worker, args=(self, idxs, counter, sink, queue, j, t_start)) for j in range(num_processes)]
+                for worker in workers:
+                    worker.start()
+                self.stats = self.get_worker_stats(workers, queue)
+                for worker in workers:
+                    worker.join()
+            errors = [stats['error'] for stats in self.stats if stats['error'] is not None]
+            assert len(errors) == 0, "Workers failed with {}".format(', '.join(errors))
+
+            # copy results
+            if shm is not None:
+                V = np.array(V)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        # report utilization
+        t_wall = time.perf_counter() - t_start
+        for stats in self.stats:
+            stats['utilization'] = stats['time_busy'] / t_wall if t_wall > 0.0 else 1.0
+            logger.info('Worker {worker}: {num_points} points in {num_chunks} chunks, {utilization:0.1%} utilization'.format(**stats))
+
+        return V
+
+    def get_worker_stats(self, workers, queue, timeout=1.0):
+        """Method to collect the statistics of the worker processes.
+
+        The queue is polled so that workers exiting without reporting their statistics, for example when killed, are detected from their exit codes instead of blocking the scheduler.
+
+        Parameters
+        ----------
+        workers : list
+            Started worker processes.
+        queue : multiprocessing.Queue
+            Queue of the statistics of the workers.
+        timeout : float, optional
+            Interval between the checks of the exit codes in seconds. Default is ``1.0``.
+
+        Returns
+        -------
+        stats : list
+            Statistics of each worker, sorted by the index of the worker. Workers exiting without statistics are reported with an error.
+        """
+
+        stats_workers = dict()
+        exited = set()
+        while len(stats_workers) < len(workers):
+            try:
+                stats = queue.get(timeout=timeout)
+                stats_workers[stats['worker']] = stats
+            except Empty:
+                # workers exited without statistics since the previous check
+                for j, worker in enumerate(workers):
+                    if j in stats_workers or worker.exitcode is None:
+                        continue
+                    if j in exited or worker.exitcode != 0:
+                        stats_workers[j] = {
+                            'worker': j,
+                            'num_points': 0,
+                            'num_chunks': 0,
+                            'time_busy': 0.0,
+                            'error': 'Worker exited with code {}'.format(worker.exitcode)
+                        }
+                    exited.add(j)
+
+        return [stats_workers[j] for j in sorted(stats_workers)]
+
+    def get_chunk_size(self, num_remaining, time_per_point):
+        """Method to obtain the size of the next chunk.
+
+        Parameters
+        ----------
+        num_remaining : int
+            Number of unclaimed points.
+        time_per_point : float
+            Measured time per point of the worker in seconds. If ``None``, a chunk of ``min_chunk_size`` points is claimed to measure it.
+
+        Returns
+        -------
+        size : int
+            Number of points in the chunk.
+        """
+
+        # first chunk to measure the rate
+        if time_per_point is None:
+            return self.min_chunk_size
+
+        # guided size
+        size = max(self.min_chunk_size, math.ceil(num_remaining / (2 * self.num_processes)))
+
+        # cap by the target duration
+        if time_per_point > 0.0:
+            size = min(size, max(self.min_chunk_size, int(self.chunk_time / time_per_point)))
+
+        return size
+
+def run_worker(scheduler, idxs, counter, sink, queue, worker, t_start):
+    """Function to evaluate chunks of points claimed from a shared counter.
+
+    Parameters
+    ----------
+    scheduler : :class:`utils.schedulers.SweepScheduler`
+        Scheduler containing the function and the parameters.
+    idxs : numpy.ndarray
+        Indices of the points to evaluate.
+    counter : multiprocessing.Value
+        Shared position of the next unclaimed point in ``idxs``.
+    sink : str or tuple
+        Path of the store, or the name, shape and data type of the shared memory block.
+    queue : multiprocessing.Queue
+        Queue to return the statistics of the worker.
+    worker : int
+        Index of the worker.
+    t_start : float
+        Start time of the scheduler.
+    """
+
+    # attach results
+    if type(sink) is str:
+        store = SweepStore(sink)
+        store.open()
+        V = store.values
+        done = store.done
+    else:
+        shm = shared_memory.SharedMemory(name=sink[0])
+        V = np.ndarray(tuple(sink[1]), dtype=np.dtype(sink[2]), buffer=shm.buf)
+        done = None
+
+    # statistics
+    stats = {
+        'worker': worker,
+        'num_points': 0,
+        'num_chunks': 0,
+        'time_busy': 0.0,
+        'error': None
+    }
+
+    try:
+        while True:
+            # claim next chunk
+            time_per_point = stats['time_busy'] / stats['num_points'] if stats['num_points'] > 0 else None
+            with counter.get_lock():
+                start = counter.value
+                size = scheduler.get_chunk_size(len(idxs) - start, time_per_point)
+                counter.value = min(len(idxs), start + size)
+            if start >= len(idxs):
+                break
+
+            # evaluate chunk
+            for i in idxs[start:start + size]:
+                # skip points done or claimed by other processes
+                if done is not None and scheduler.claim_timeout is not None and (done[i] or not store.claim(i, scheduler.claim_timeout)):
+                    continue
+                t_point = time.perf_counter()
+                V[i] = scheduler.func(scheduler.get_params(i))
+                if done is not None:
+                    done[i] = True
+                stats['time_busy'] += time.perf_counter() - t_point
+                stats['num_points'] += 1
+            stats['num_chunks'] += 1
+
+            # update progress
+            if scheduler.show_progress:
+                logger.info('Looping ({:0.0f}%) worker {}'.format(100.0 * min(len(idxs), start + size) / len(idxs), worker))
+    # report failures to the scheduler
+    except Exception as error:
+        stats['error'] = repr(error)
+
+    # detach results
+    if type(sink) is str:
+        store.close()
+    else:
+        del V
+        shm.close()
+    stats['time_wall'] = time.perf_counter() - t_start
+
+    queue.put(stats)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing resumable on-disk stores of sweep results."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import json
+import numpy as np
+import os
+import shutil
+import time
+
+class SweepStore():
+    """Class to store the results of a sweep point by point in memory-mapped arrays.
+
+    The store is a directory containing the values of all points in ``values.npy``, a completion mask with one byte per point in ``done.npy``, the description of the sweep in ``meta.json`` and the claims of the points in ``claims``.
+    The directory is assembled under a temporary name and renamed once complete, so that concurrent processes either see the entire store or none of it.
+    Each point is written once, by setting its values before marking it as done, so that concurrent workers can write disjoint points and a restarted sweep only computes the points not yet marked.
+    Processes sharing the store can claim points before evaluating them and renew the claims while evaluating them, with claims not renewed within a timeout considered stale and taken over.
+    The arrays are opened lazily as memory maps, so that partial results can be read without loading the entire store.
+
+    Parameters
+    ----------
+    dir_path : str
+        Path of the directory of the store.
+    """
+
+    def __init__(self, dir_path):
+        """Class constructor for SweepStore."""
+
+        # set attributes
+        self.dir_path = dir_path
+        self.values = None
+        self.done = None
+
+    def exists(self):
+        """Method to check if the store is created.
+
+        Returns
+        -------
+        exists : bool
+            ``True`` if the description of the store exists.
+        """
+
+        return os.path.isfile(os.path.join(self.dir_path, 'meta.json'))
+
+    def create(self, num_points, shape, dtype=np.float_, meta=None):
+        """Method to create the store, keeping an existing store with the same description.
+
+        Parameters
+        ----------
+        num_points : int
+            Number of points of the sweep.
+        shape : tuple
+            Shape of the values of each point.
+        dtype : numpy.dtype, optional
+            Data type of the values. Default is ``numpy.float_``.
+        meta : dict, optional
+            Additional JSON-serializable description of the sweep, for example the values of the looped axis. Default is ``None``.
+        """
+
+        # description of the store
+        meta = {
+            'num_points': int(num_points),
+            'shape': [int(dim) for dim in shape],
+            'dtype': np.dtype(dtype).str,
+            'meta': meta if meta is not None else dict()
+        }
+
+        # validate existing store
+        if self.exists():
+            assert self.get_meta() == json.loads(json.dumps(meta)), "Store at ``'{}'`` has a different description".format(self.dir_path)
+            return
+
+        # create store in a temporary directory to avoid partial stores across processes
+        dir_path_temp = os.path.normpath(self.dir_path) + '.' + str(os.getpid())
+        os.makedirs(os.path.join(dir_path_temp, 'claims'), exist_ok=True)
+        np.lib.format.open_memmap(os.path.join(dir_path_temp, 'values.npy'), mode='w+', dtype=dtype, shape=(num_points, ) + tuple(shape)).flush()
+        np.lib.format.open_memmap(os.path.join(dir_path_temp, 'done.npy'), mode='w+', dtype=np.bool_, shape=(num_points, )).flush()
+        with open(os.path.join(dir_path_temp, 'meta.json'), 'w') as file:
+            json.dump(meta, file)
+
+        # rename, keeping the store of a process renaming first
+        try:
+            os.rename(dir_path_temp, self.dir_path)
+        except OSError:
+            shutil.rmtree(dir_path_temp, ignore_errors=True)
+            assert self.exists(), "Store at ``'{}'`` could not be created".format(self.dir_path)
+            assert self.get_meta() == json.loads(json.dumps(meta)), "Store at ``'{}'`` has a different description".format(self.dir_path)
+
+    def claim(self, i, timeout=None):
+        """Method to claim a point for the current process.
+
+        The claim is a file in the directory ``claims`` created exclusively, so that only one process obtains it.
+        A claim older than the timeout is renamed before being claimed again, so that only one process takes it over.
+
+        Parameters
+        ----------
+        i : int
+            Index of the point.
+        timeout : float, optional
+            Age in seconds since the claim was created or last renewed after which it is stale. If ``None``, claims are never stale. Default is ``None``.
+
+        Returns
+        -------
+        claimed : bool
+            ``True`` if the point is claimed by the current process.
+        """
+
+        # extract frequently used variables
+        file_path = os.path.join(self.dir_path, 'claims', str(int(i)))
+
+        for _ in range(2):
+            # create claim exclusively
+            try:
+                fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode('utf-8'))
+                os.close(fd)
+                return True
+            except FileExistsError:
+                pass
+
+            # take over stale claim
+            try:
+                if timeout is None or time.time() - os.path.getmtime(file_path) <= timeout:
+                    return False
+                os.rename(file_path, file_path + '.' + str(os.getpid()))
+                os.remove(file_path + '.' + str(os.getpid()))
+            except OSError:
+                return False
+
+        return False
+
+    def renew(self, i):
+        """Method to renew the claim of a point, so that it is not considered stale while the point is evaluated.
+
+        Parameters
+        ----------
+        i : int
+            Index of the point.
+        """
+
+        # update the modification time of an existing claim
+        try:
+            os.utime(os.path.join(self.dir_path, 'claims', str(int(i))))
+        except OSError:
+            pass
+
+    def get_meta(self):
+        """Method to obtain the description of the store.
+
+        Returns
+        -------
+        meta : dict
+            Description with the keys ``'num_points'``, ``'shape'``, ``'dtype'`` and ``'meta'``.
+        """
+
+        with open(os.path.join(self.dir_path, 'meta.json'), 'r') as file:
+            return json.load(file)
+
+    def open(self, mode='r+'):
+        """Method to open the memory maps of the store for repeated access.
+
+        Parameters
+        ----------
+        mode : str, optional
+            Mode of the memory maps. Options are ``'r+'`` (fallback) for writing and ``'r'`` for reading. Default is ``'r+'``.
+        """
+
+        self.values = np.load(os.path.join(self.dir_path, 'values.npy'), mmap_mode=mode)
+        self.done = np.load(os.path.join(self.dir_path, 'done.npy'), mmap_mode=mode)
+
+    def close(self):
+        """Method to flush and close the memory maps of the store."""
+
+        if self.values is not None and self.values.mode == 'r+':
+            self.values.flush()
+            self.done.flush()
+        self.values = None
+        self.done = None
+
+    def write(self, i, v):
+        """Method to write the values of a point and mark it as done.
+
+        Parameters
+        ----------
+        i : int
+            Index of the point.
+        v : numpy.ndarray
+            Values of the point.
+        """
+
+        if self.values is None:
+            self.open()
+
+        self.values[i] = v
+        self.done[i] = True
+
+    def get_pending(self):
+        """Method to obtain the indices of the points not yet done.
+
+        Returns
+        -------
+        idxs : numpy.ndarray
+            Indices of the pending points.
+        """
+
+        # memory map of the completion mask
+        done = self.done if self.done is not None else np.load(os.path.join(self.dir_path, 'done.npy'), mmap_mode='r')
+
+        return np.flatnonzero(~ np.asarray(done))
+
+    def read(self, idxs=None):
+        """Method to read the values of the points.
+
+        Parameters
+        ----------
+        idxs : slice or numpy.ndarray, optional
+            Indices of the points. If ``None``, all points are read. Default is ``None``.
+
+        Returns
+        -------
+        V : numpy.ndarray
+            Values of the points. Entries of the pending points are undefined.
+        done : numpy.ndarray
+            Boolean mask marking the points that are done.
+        """
+
+        # memory maps of the arrays
+        values = self.values if self.values is not None else np.load(os.path.join(self.dir_path, 'values.npy'), mmap_mode='r')
+        done = self.done if self.done is not None else np.load(os.path.join(self.dir_path, 'done.npy'), mmap_mode='r')
+        idxs = idxs if idxs is not None else slice(None)
+
+        return np.array(values[idxs]), np.array(done[idxs])